@@ -30,18 +30,47 @@ a = Analysis(
     ] + textual_datas + rich_datas,
     hiddenimports=[
         'hermes',
+        'hermes.bench',
+        'hermes.bench.history',
+        'hermes.bench.mock_server',
+        'hermes.bench.options',
+        'hermes.bench.startup',
+        'hermes.bench.suite',
+        'hermes.bench.synthetic',
+        'hermes.bench.transport',
         'hermes.core',
+        'hermes.core.cancellation',
         'hermes.core.config',
         'hermes.core.crowdin_api',
+        'hermes.core.crowdin_async',
         'hermes.core.crowdin_upload_api',
         'hermes.core.file_operations',
+        'hermes.core.crowdin_transport',
+        'hermes.core.gemini',
+        'hermes.core.glossary',
+        'hermes.core.journal',
+        'hermes.core.keys',
+        'hermes.core.metadata_cache',
+        'hermes.core.metrics',
+        'hermes.core.profile_sync',
+        'hermes.core.profiling',
+        'hermes.core.progress',
+        'hermes.core.prompt_cache',
+        'hermes.core.rate_limit',
+        'hermes.core.throughput',
+        'hermes.core.timing',
+        'hermes.core.upload_pipeline',
         'hermes.tui',
         'hermes.tui.app',
+        'hermes.tui.log_store',
+        'hermes.tui.messages',
         'hermes.tui.screens',
         'hermes.tui.screens.main_menu',
         'hermes.tui.screens.settings',
         'hermes.tui.screens.download',
         'hermes.tui.screens.upload',
+        'hermes.tui.screens.dashboard',
+        'hermes.tui.widgets',
         'hermes.cli',
         'textual',
         'textual.app',
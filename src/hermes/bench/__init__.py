@@ -0,0 +1 @@
+"""Benchmarks for Hermes, run against local stand-in servers."""
@@ -0,0 +1,193 @@
+"""Stored benchmark results and regression checks against a baseline.
+
+Every ``hermes bench`` run is appended to bench/history.jsonl next to the
+config. A run can be saved as bench/baseline.json; later runs are compared
+with it scenario by scenario.
+"""
+
+import json
+import platform
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from hermes.core.config import get_config_dir
+
+from .options import BenchOptions
+
+BENCH_DIR = "bench"
+HISTORY_FILE = "history.jsonl"
+BASELINE_FILE = "baseline.json"
+
+# A metric this much worse than the baseline is a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+# Metrics compared with the baseline (lower is better for all of them)
+COMPARED_METRICS = ("p50_seconds", "p95_seconds", "peak_memory_bytes")
+
+
+@dataclass
+class ScenarioResult:
+    """Timings, throughput and peak memory of one scenario."""
+
+    name: str
+    runs: int
+    p50_seconds: float
+    p95_seconds: float
+    units: int
+    unit: str
+    peak_memory_bytes: int
+
+    @property
+    def throughput(self) -> float:
+        """Units per second at the median timing."""
+        return self.units / self.p50_seconds if self.p50_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScenarioResult":
+        return cls(**data)
+
+
+@dataclass
+class BenchRun:
+    """One ``hermes bench`` invocation."""
+
+    results: list[ScenarioResult]
+    options: dict[str, Any] = field(default_factory=dict)
+    started_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    python: str = field(default_factory=lambda: sys.version.split()[0])
+    machine: str = field(default_factory=platform.platform)
+
+    @classmethod
+    def create(cls, results: list[ScenarioResult], options: BenchOptions) -> "BenchRun":
+        return cls(results=results, options=asdict(options))
+
+    def result(self, name: str) -> ScenarioResult | None:
+        return next((result for result in self.results if result.name == name), None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "python": self.python,
+            "machine": self.machine,
+            "options": self.options,
+            "results": [result.to_dict() for result in self.results],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchRun":
+        return cls(
+            results=[ScenarioResult.from_dict(result) for result in data.get("results", [])],
+            options=data.get("options", {}),
+            started_at=data.get("started_at", ""),
+            python=data.get("python", ""),
+            machine=data.get("machine", ""),
+        )
+
+
+@dataclass
+class Regression:
+    """A metric of a scenario that got worse than the baseline allows."""
+
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change against the baseline (0.25 = 25% worse)."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"{self.scenario}: {self.metric} {self.baseline:.4g} -> {self.current:.4g} "
+            f"(+{self.change:.0%})"
+        )
+
+
+def bench_path(file_name: str) -> Path:
+    """Path of a bench file next to the config."""
+    return get_config_dir() / BENCH_DIR / file_name
+
+
+def append_history(run: BenchRun) -> Path:
+    """Append a run to the history file and return its path."""
+    path = bench_path(HISTORY_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(run.to_dict(), ensure_ascii=False) + "\n")
+    return path
+
+
+def read_history(limit: int | None = None) -> list[BenchRun]:
+    """Stored runs, oldest first (the last limit runs if given); unreadable lines are skipped."""
+    try:
+        with bench_path(HISTORY_FILE).open(encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    runs = []
+    for line in lines[-limit:] if limit else lines:
+        try:
+            runs.append(BenchRun.from_dict(json.loads(line)))
+        except (ValueError, TypeError):
+            continue
+    return runs
+
+
+def load_baseline() -> BenchRun | None:
+    """The saved baseline, or None if there is none."""
+    try:
+        with bench_path(BASELINE_FILE).open(encoding="utf-8") as f:
+            return BenchRun.from_dict(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_baseline(run: BenchRun) -> Path:
+    """
+    Save a run's results as the baseline and return its path.
+
+    Scenarios the run did not include keep their previous baseline.
+    """
+    previous = load_baseline()
+    kept = [
+        result for result in (previous.results if previous else []) if not run.result(result.name)
+    ]
+    baseline = BenchRun(
+        results=kept + run.results,
+        options=run.options,
+        started_at=run.started_at,
+        python=run.python,
+        machine=run.machine,
+    )
+    path = bench_path(BASELINE_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(baseline.to_dict(), f, ensure_ascii=False, indent=2)
+    return path
+
+
+def find_regressions(
+    run: BenchRun,
+    baseline: BenchRun,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[Regression]:
+    """Metrics of scenarios in both runs that are more than threshold worse than the baseline."""
+    regressions = []
+    for result in run.results:
+        reference = baseline.result(result.name)
+        if reference is None:
+            continue
+        for metric in COMPARED_METRICS:
+            before = getattr(reference, metric)
+            after = getattr(result, metric)
+            if before and after > before * (1 + threshold):
+                regressions.append(Regression(result.name, metric, before, after))
+    return regressions
@@ -0,0 +1,675 @@
+"""Local stand-in for the Crowdin and Gemini APIs.
+
+Implements the endpoints Hermes uses — translation builds and their
+download, strings, translations, languages, files and project info on the
+Crowdin side, and generateContent / streamGenerateContent (plus context
+caches) on the Gemini side — against an in-memory project. Latency,
+per-response throughput, server errors and 429s can be injected so
+performance work can be measured repeatably without real services.
+
+Run with ``python -m hermes.bench.mock_server`` and point Hermes at it with
+``--crowdin-url`` / ``--gemini-url`` (or HERMES_CROWDIN_URL /
+HERMES_GEMINI_URL, or the profile's crowdin_api_url / gemini_api_url).
+"""
+
+import hashlib
+import io
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import zipfile
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import typer
+
+from hermes.core.crowdin_api import RESOURCE_FILE_NAME
+
+MOCK_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+CROWDIN_PREFIX = "/api/v2"
+GEMINI_API_VERSION = "v1beta"
+
+# Source file new keys are added to, as listed by /files
+MOCK_FILE_ID = 15
+SOURCE_LANGUAGE_ID = "zh-TW"
+
+# Crowdin locale -> language ID (language IDs are the folders of the build zip)
+MOCK_LANGUAGES = {
+    "zh-TW": "zh-TW",
+    "zh-CN": "zh-CN",
+    "en-US": "en",
+    "ja-JP": "ja",
+    "th-TH": "th",
+    "vi-VN": "vi",
+    "id-ID": "id",
+    "ar-SA": "ar",
+}
+
+# Writes are split so throughput throttling is smooth
+WRITE_CHUNK_BYTES = 4096
+# Pieces a streamed Gemini response is split into
+STREAM_CHUNKS = 4
+# Rough characters per token, for the reported usage
+CHARS_PER_TOKEN = 4
+# Smallest prompt Gemini accepts into a context cache
+MIN_CACHE_TOKENS = 1024
+
+JSON_CONTENT_TYPE = "application/json"
+SSE_CONTENT_TYPE = "text/event-stream"
+ZIP_CONTENT_TYPE = "application/zip"
+
+
+@dataclass
+class MockSettings:
+    """Faults and delays injected into every response."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    # Per-response body throughput (0 = unthrottled)
+    bytes_per_second: int = 0
+    # Fractions of requests answered with 500 and with 429
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: int = 1
+    # How long a translation build stays in progress
+    build_seconds: float = 0.0
+    # Seed of the fault injection, for repeatable runs
+    seed: int | None = None
+
+
+@dataclass
+class MockResponse:
+    """A response body, or a list of body chunks for a stream."""
+
+    status: int
+    body: bytes | list[bytes] = b""
+    content_type: str = JSON_CONTENT_TYPE
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class MockStats:
+    """Requests served, by route and by injected fault."""
+
+    requests: Counter = field(default_factory=Counter)
+    errors: int = 0
+    rate_limited: int = 0
+
+    def summary(self) -> str:
+        """One-line report of the traffic the server saw."""
+        total = sum(self.requests.values())
+        return (
+            f"Mock server: {total} requests, {self.rate_limited} rate limited, {self.errors} errors"
+        )
+
+
+def _json(status: int, payload: Any) -> MockResponse:
+    return MockResponse(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+def _crowdin_error(status: int, message: str) -> MockResponse:
+    return _json(status, {"error": {"code": status, "message": message}})
+
+
+def _gemini_error(
+    status: int, state: str, message: str, details: list | None = None
+) -> MockResponse:
+    error = {"code": status, "message": message, "status": state, "details": details or []}
+    return _json(status, {"error": error})
+
+
+def _source_text(identifier: str) -> str:
+    """Source text of a key identifier ("__" + text)."""
+    return identifier.split("__", 1)[1] if "__" in identifier else identifier
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+def _items(entries: list[dict]) -> dict:
+    """Wrap entries the way Crowdin list endpoints do."""
+    return {"data": [{"data": entry} for entry in entries]}
+
+
+class MockProject:
+    """In-memory Crowdin project: strings, translations and builds."""
+
+    def __init__(self, languages: dict[str, str] | None = None):
+        self.languages = dict(languages or MOCK_LANGUAGES)
+        self.strings: dict[str, int] = {}
+        self._string_ids: set[int] = set()
+        self.translations: dict[tuple[int, str], str] = {}
+        self.builds: dict[int, float] = {}
+        self._zips: dict[int, bytes] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Drop every string, translation and build (e.g. between benchmark runs)."""
+        with self._lock:
+            self.strings.clear()
+            self._string_ids.clear()
+            self.translations.clear()
+            self.builds.clear()
+            self._zips.clear()
+
+    def seed(self, translations: dict[str, dict[str, str]]) -> None:
+        """
+        Add existing keys and their translations.
+
+        Args:
+            translations: Translations by locale, then key identifier
+        """
+        with self._lock:
+            for locale, values in translations.items():
+                for identifier, text in values.items():
+                    string_id = self.strings.setdefault(identifier, next(self._ids))
+                    self._string_ids.add(string_id)
+                    self.translations[(string_id, self.languages.get(locale, locale))] = text
+
+    def add_string(self, identifier: str) -> int | None:
+        """Create a string; None if the identifier is taken."""
+        with self._lock:
+            if identifier in self.strings:
+                return None
+            string_id = self.strings[identifier] = next(self._ids)
+            self._string_ids.add(string_id)
+            return string_id
+
+    def add_translation(self, string_id: int, language_id: str, text: str) -> int | None:
+        """Store a translation; None if the string does not exist."""
+        with self._lock:
+            if string_id not in self._string_ids:
+                return None
+            self.translations[(string_id, language_id)] = text
+            return next(self._ids)
+
+    def find_strings(self, identifier: str) -> list[dict]:
+        with self._lock:
+            string_id = self.strings.get(identifier)
+        if string_id is None:
+            return []
+        return [{"id": string_id, "identifier": identifier, "text": _source_text(identifier)}]
+
+    def start_build(self) -> int:
+        with self._lock:
+            build_id = next(self._ids)
+            self.builds[build_id] = time.monotonic()
+            return build_id
+
+    def build_zip(self, build_id: int) -> bytes:
+        """Zip of a build, created on first download and kept for later ones."""
+        with self._lock:
+            cached = self._zips.get(build_id)
+        if cached is None:
+            cached = self._zips.setdefault(build_id, self._zip_translations())
+        return cached
+
+    def _zip_translations(self) -> bytes:
+        """Zip of one CommonResource.json per language, like a Crowdin build."""
+        with self._lock:
+            strings = dict(self.strings)
+            translations = dict(self.translations)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for language_id in self.languages.values():
+                values = {
+                    identifier: translations.get((string_id, language_id), _source_text(identifier))
+                    for identifier, string_id in strings.items()
+                }
+                archive.writestr(
+                    f"{language_id}/{RESOURCE_FILE_NAME}", json.dumps(values, ensure_ascii=False)
+                )
+        return buffer.getvalue()
+
+
+def _schema_keys(request: dict) -> tuple[list[str], list[str]]:
+    """Locales and key identifiers asked for by a translation response schema."""
+    config = request.get("generationConfig", {})
+    schema = config.get("responseSchema") or config.get("responseJsonSchema") or {}
+    locales = list(schema.get("properties", {}))
+    if not locales:
+        return [], []
+    identifiers = list(schema["properties"][locales[0]].get("properties", {}))
+    return locales, identifiers
+
+
+def mock_translations(request: dict) -> dict[str, dict[str, str]]:
+    """Deterministic "translations" filling a Gemini request's response schema."""
+    locales, identifiers = _schema_keys(request)
+    return {
+        locale: {identifier: f"{_source_text(identifier)} [{locale}]" for identifier in identifiers}
+        for locale in locales
+    }
+
+
+def _gemini_candidate(text: str, model: str, request_chars: int) -> dict:
+    prompt_tokens = request_chars // CHARS_PER_TOKEN
+    output_tokens = len(text) // CHARS_PER_TOKEN
+    return {
+        "candidates": [
+            {
+                "content": {"role": "model", "parts": [{"text": text}]},
+                "finishReason": "STOP",
+                "index": 0,
+            }
+        ],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens,
+        },
+        "modelVersion": model,
+    }
+
+
+def _split(text: str, pieces: int) -> list[str]:
+    size = max(1, -(-len(text) // pieces))
+    return [text[start : start + size] for start in range(0, len(text), size)] or [""]
+
+
+Route = tuple[str, re.Pattern[str], Callable[..., MockResponse]]
+
+
+class MockService:
+    """Routes requests to the mock Crowdin project and the mock Gemini model."""
+
+    def __init__(self, settings: MockSettings, project: MockProject, base_url: str):
+        self.settings = settings
+        self.project = project
+        self.base_url = base_url
+        self.stats = MockStats()
+        self._random = random.Random(settings.seed)
+        self._lock = threading.Lock()
+        self.caches: list[dict] = []
+        self._cache_ids = itertools.count(1)
+        project_path = rf"{CROWDIN_PREFIX}/projects/(?P<project>[^/]+)"
+        gemini_path = rf"/{GEMINI_API_VERSION}"
+        self.routes: list[Route] = [
+            ("POST", re.compile(rf"{project_path}/translations/builds"), self.create_build),
+            ("GET", re.compile(rf"{project_path}/translations/builds/(?P<build>\d+)"), self.build),
+            (
+                "GET",
+                re.compile(rf"{project_path}/translations/builds/(?P<build>\d+)/download"),
+                self.build_link,
+            ),
+            ("GET", re.compile(r"/downloads/(?P<build>\d+)\.zip"), self.download),
+            ("GET", re.compile(rf"{project_path}/languages/progress"), self.languages),
+            ("GET", re.compile(rf"{project_path}/files"), self.files),
+            ("GET", re.compile(rf"{project_path}/strings"), self.strings),
+            ("POST", re.compile(rf"{project_path}/strings"), self.add_string),
+            ("POST", re.compile(rf"{project_path}/translations"), self.add_translation),
+            ("GET", re.compile(project_path), self.project_info),
+            (
+                "POST",
+                re.compile(rf"{gemini_path}/models/(?P<model>[^/:]+):generateContent"),
+                self.generate,
+            ),
+            (
+                "POST",
+                re.compile(rf"{gemini_path}/models/(?P<model>[^/:]+):streamGenerateContent"),
+                self.generate_stream,
+            ),
+            ("GET", re.compile(rf"{gemini_path}/cachedContents"), self.list_caches),
+            ("POST", re.compile(rf"{gemini_path}/cachedContents"), self.create_cache),
+        ]
+
+    def _route(self, method: str, path: str) -> tuple[str, Callable[..., MockResponse], dict]:
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                return handler.__name__, handler, match.groupdict()
+        return "unknown", self.not_found, {}
+
+    def _fault(self, is_gemini: bool) -> MockResponse | None:
+        """An injected 429 or 500, or None to answer normally."""
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.settings.rate_limit_rate:
+            self.stats.rate_limited += 1
+            return self._rate_limited(is_gemini)
+        if roll < self.settings.rate_limit_rate + self.settings.error_rate:
+            self.stats.errors += 1
+            return _crowdin_error(500, "Injected server error")
+        return None
+
+    def _rate_limited(self, is_gemini: bool) -> MockResponse:
+        retry_after = self.settings.retry_after_seconds
+        if not is_gemini:
+            response = _crowdin_error(429, "Too Many Requests")
+            response.headers["Retry-After"] = str(retry_after)
+            return response
+        details = [
+            {
+                "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                "retryDelay": f"{retry_after}s",
+            }
+        ]
+        return _gemini_error(429, "RESOURCE_EXHAUSTED", "Injected quota error", details)
+
+    def delay(self) -> None:
+        """Sleep for the configured latency plus jitter."""
+        with self._lock:
+            jitter = self._random.uniform(0, self.settings.jitter_ms)
+        time.sleep((self.settings.latency_ms + jitter) / 1000)
+
+    def handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> MockResponse:
+        """Answer one request, injecting faults first."""
+        parts = urlsplit(target)
+        name, handler, params = self._route(method, parts.path)
+        with self._lock:
+            self.stats.requests[name] += 1
+        self.delay()
+        fault = self._fault(parts.path.startswith(f"/{GEMINI_API_VERSION}"))
+        if fault is not None:
+            return fault
+        response = handler(query=parse_qs(parts.query), body=body, **params)
+        return _not_modified(response, headers.get("If-None-Match"))
+
+    # Crowdin
+
+    def create_build(self, project: str, **_: Any) -> MockResponse:
+        build_id = self.project.start_build()
+        return _json(201, {"data": {"id": build_id, "projectId": project, "status": "inProgress"}})
+
+    def _build_state(self, build_id: int) -> tuple[str, int] | None:
+        started = self.project.builds.get(build_id)
+        if started is None:
+            return None
+        elapsed = time.monotonic() - started
+        if elapsed >= self.settings.build_seconds:
+            return "finished", 100
+        return "inProgress", int(elapsed * 100 / self.settings.build_seconds)
+
+    def build(self, build: str, **_: Any) -> MockResponse:
+        state = self._build_state(int(build))
+        if state is None:
+            return _crowdin_error(404, "Build not found")
+        status, progress = state
+        return _json(200, {"data": {"id": int(build), "status": status, "progress": progress}})
+
+    def build_link(self, build: str, **_: Any) -> MockResponse:
+        state = self._build_state(int(build))
+        if state is None or state[0] != "finished":
+            return _crowdin_error(404, "Build not finished")
+        return _json(200, {"data": {"url": f"{self.base_url}/downloads/{build}.zip"}})
+
+    def download(self, build: str, **_: Any) -> MockResponse:
+        if int(build) not in self.project.builds:
+            return _crowdin_error(404, "Build not found")
+        return MockResponse(200, self.project.build_zip(int(build)), ZIP_CONTENT_TYPE)
+
+    def languages(self, **_: Any) -> MockResponse:
+        entries = [
+            {"languageId": language_id, "language": {"locale": locale}, "translationProgress": 100}
+            for locale, language_id in self.project.languages.items()
+        ]
+        return _json(200, _items(entries))
+
+    def files(self, **_: Any) -> MockResponse:
+        return _json(200, _items([{"id": MOCK_FILE_ID, "path": f"/{RESOURCE_FILE_NAME}"}]))
+
+    def project_info(self, project: str, **_: Any) -> MockResponse:
+        targets = [lang for lang in self.project.languages.values() if lang != SOURCE_LANGUAGE_ID]
+        data = {
+            "id": project,
+            "name": "Hermes mock project",
+            "sourceLanguageId": SOURCE_LANGUAGE_ID,
+            "targetLanguageIds": targets,
+        }
+        return _json(200, {"data": data})
+
+    def strings(self, query: dict[str, list[str]], **_: Any) -> MockResponse:
+        identifier = query.get("filter", [""])[0]
+        return _json(200, _items(self.project.find_strings(identifier)))
+
+    def add_string(self, body: bytes, **_: Any) -> MockResponse:
+        data = json.loads(body or b"{}")
+        identifier = data.get("identifier", "")
+        string_id = self.project.add_string(identifier)
+        if string_id is None:
+            return _crowdin_error(400, f"Identifier '{identifier}' is not unique")
+        return _json(
+            201,
+            {
+                "data": {
+                    "id": string_id,
+                    "identifier": identifier,
+                    "text": data.get("text", ""),
+                    "fileId": data.get("fileId", MOCK_FILE_ID),
+                }
+            },
+        )
+
+    def add_translation(self, body: bytes, **_: Any) -> MockResponse:
+        data = json.loads(body or b"{}")
+        translation_id = self.project.add_translation(
+            data.get("stringId"), data.get("languageId"), data.get("text", "")
+        )
+        if translation_id is None:
+            return _crowdin_error(404, "String not found")
+        return _json(201, {"data": {"id": translation_id, **data}})
+
+    # Gemini
+
+    def generate(self, model: str, body: bytes, **_: Any) -> MockResponse:
+        text = json.dumps(mock_translations(json.loads(body or b"{}")), ensure_ascii=False)
+        return _json(200, _gemini_candidate(text, model, len(body)))
+
+    def generate_stream(self, model: str, body: bytes, **_: Any) -> MockResponse:
+        text = json.dumps(mock_translations(json.loads(body or b"{}")), ensure_ascii=False)
+        events = [
+            f"data: {json.dumps(_gemini_candidate(piece, model, len(body)))}\r\n\r\n".encode()
+            for piece in _split(text, STREAM_CHUNKS)
+        ]
+        return MockResponse(200, events, SSE_CONTENT_TYPE)
+
+    def add_cache(self, display_name: str, model: str, ttl_seconds: float) -> dict:
+        """
+        Store a context cache (a negative ttl_seconds gives an expired one).
+
+        Returns:
+            The cache entry, as listed
+        """
+        expire_time = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
+        with self._lock:
+            cache = {
+                "name": f"cachedContents/{next(self._cache_ids)}",
+                "displayName": display_name,
+                "model": f"models/{model.removeprefix('models/')}",
+                "expireTime": expire_time.isoformat(),
+            }
+            self.caches.append(cache)
+        return cache
+
+    def list_caches(self, **_: Any) -> MockResponse:
+        with self._lock:
+            return _json(200, {"cachedContents": list(self.caches)})
+
+    def create_cache(self, body: bytes, **_: Any) -> MockResponse:
+        data = json.loads(body or b"{}")
+        parts = data.get("systemInstruction", {}).get("parts", [])
+        chars = sum(len(part.get("text", "")) for part in parts)
+        if chars // CHARS_PER_TOKEN < MIN_CACHE_TOKENS:
+            # Hermes then sends the prompt uncached
+            return _gemini_error(400, "INVALID_ARGUMENT", "Cached content is too small")
+        ttl_seconds = float(data.get("ttl", "0s").removesuffix("s"))
+        return _json(200, self.add_cache(data.get("displayName", ""), data["model"], ttl_seconds))
+
+    def not_found(self, **_: Any) -> MockResponse:
+        return _crowdin_error(404, "Not found")
+
+
+def _not_modified(response: MockResponse, if_none_match: str | None) -> MockResponse:
+    """Add an ETag to a plain JSON 200 and answer a matching conditional GET with 304."""
+    if response.status != 200 or not isinstance(response.body, bytes):
+        return response
+    if response.content_type != JSON_CONTENT_TYPE:
+        return response
+    etag = _etag(response.body)
+    if if_none_match == etag:
+        return MockResponse(304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler delegating to the server's MockService."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle each keep-alive response waits ~40ms
+    disable_nagle_algorithm = True
+    server: "_MockHTTPServer"
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        response = self.server.service.handle(self.command, self.path, dict(self.headers), body)
+        self._send(response)
+
+    do_GET = _serve
+    do_POST = _serve
+
+    def _send(self, response: MockResponse) -> None:
+        streaming = isinstance(response.body, list)
+        self.send_response(response.status)
+        self.send_header("Content-Type", response.content_type)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        if streaming:
+            self.send_header("Transfer-Encoding", "chunked")
+        if not streaming:
+            self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        chunks = response.body if streaming else [response.body]
+        for chunk in chunks:
+            self._write(chunk, streaming)
+        if streaming:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def _write(self, data: bytes, chunked: bool) -> None:
+        """Write a body (or one chunk of a stream), throttled to the configured throughput."""
+        if chunked:
+            self.wfile.write(f"{len(data):x}\r\n".encode())
+        bytes_per_second = self.server.service.settings.bytes_per_second
+        for start in range(0, len(data), WRITE_CHUNK_BYTES):
+            piece = data[start : start + WRITE_CHUNK_BYTES]
+            self.wfile.write(piece)
+            if bytes_per_second:
+                time.sleep(len(piece) / bytes_per_second)
+        if chunked:
+            self.wfile.write(b"\r\n")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    service: MockService
+
+
+class MockServer:
+    """
+    Mock Crowdin and Gemini APIs served from a background thread.
+
+    Use as a context manager, then point Hermes at ``crowdin_url`` and
+    ``gemini_url``.
+    """
+
+    def __init__(
+        self,
+        settings: MockSettings | None = None,
+        project: MockProject | None = None,
+        port: int = 0,
+    ):
+        self.httpd = _MockHTTPServer((MOCK_HOST, port), _MockHandler)
+        self.url = f"http://{MOCK_HOST}:{self.httpd.server_address[1]}"
+        self.project = project or MockProject()
+        self.httpd.service = MockService(settings or MockSettings(), self.project, self.url)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def crowdin_url(self) -> str:
+        """Crowdin API root to pass as crowdin_api_url."""
+        return f"{self.url}{CROWDIN_PREFIX}"
+
+    @property
+    def gemini_url(self) -> str:
+        """Gemini API root to pass as gemini_api_url."""
+        return self.url
+
+    @property
+    def stats(self) -> MockStats:
+        return self.httpd.service.stats
+
+    def add_cache(self, display_name: str, model: str, ttl_seconds: float) -> dict:
+        """Store a Gemini context cache, e.g. one left by a previous run."""
+        return self.httpd.service.add_cache(display_name, model, ttl_seconds)
+
+    def start(self) -> "MockServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def main(
+    *,
+    port: int = typer.Option(DEFAULT_PORT, "--port", help="Port to listen on"),
+    latency_ms: float = typer.Option(0.0, "--latency-ms", help="Delay before every response"),
+    jitter_ms: float = typer.Option(0.0, "--jitter-ms", help="Random extra delay, up to this"),
+    bytes_per_second: int = typer.Option(
+        0, "--bytes-per-second", help="Throughput of each response body (0 = unthrottled)"
+    ),
+    error_rate: float = typer.Option(0.0, "--error-rate", help="Fraction answered with 500"),
+    rate_limit_rate: float = typer.Option(
+        0.0, "--rate-limit-rate", help="Fraction answered with 429"
+    ),
+    build_seconds: float = typer.Option(0.0, "--build-seconds", help="Duration of a build"),
+    seed: int | None = typer.Option(None, "--seed", help="Seed for repeatable fault injection"),
+):
+    """Serve the mock Crowdin and Gemini APIs until interrupted."""
+    settings = MockSettings(
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        bytes_per_second=bytes_per_second,
+        error_rate=error_rate,
+        rate_limit_rate=rate_limit_rate,
+        build_seconds=build_seconds,
+        seed=seed,
+    )
+    server = MockServer(settings, port=port)
+    typer.echo(f"HERMES_CROWDIN_URL={server.crowdin_url}")
+    typer.echo(f"HERMES_GEMINI_URL={server.gemini_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        typer.echo(server.stats.summary())
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,31 @@
+"""Sizes and server settings of the benchmark scenarios.
+
+Kept apart from the scenarios so the CLI can build its options without
+importing the suite and the mock server.
+"""
+
+from dataclasses import dataclass
+
+from hermes.core.gemini import TARGET_LOCALES
+
+# Defaults of the scenario sizes
+DEFAULT_REPEAT = 5
+DEFAULT_PROCESS_KEYS = 100_000
+DEFAULT_DOWNLOAD_KEYS = 20_000
+DEFAULT_UPLOAD_KEYS = 200
+DEFAULT_BUILD_SECONDS = 0.5
+DEFAULT_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class BenchOptions:
+    """Sizes and server settings shared by the scenarios."""
+
+    repeat: int = DEFAULT_REPEAT
+    process_keys: int = DEFAULT_PROCESS_KEYS
+    download_keys: int = DEFAULT_DOWNLOAD_KEYS
+    upload_keys: int = DEFAULT_UPLOAD_KEYS
+    languages: int = len(TARGET_LOCALES)
+    latency_ms: float = 0.0
+    build_seconds: float = DEFAULT_BUILD_SECONDS
+    poll_interval: float = DEFAULT_POLL_INTERVAL
@@ -0,0 +1,203 @@
+"""Import-time benchmark of the CLI and the TUI, with a startup budget.
+
+Each target is imported in fresh interpreters and the median import time is
+compared with its budget. The heavy SDKs (google-genai, requests, textual,
+rich's progress bars) are imported by the commands that use them, so a target
+also fails if one of its deferred modules was loaded at import time.
+
+Run with ``python -m hermes.bench.startup``; the exit code is 1 when a target
+is over budget or loads a deferred module, so CI can run it as a check.
+"""
+
+import json
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+DEFAULT_RUNS = 7
+HEAVIEST_IMPORTS = 10
+
+# Milliseconds; the CLI imports in about 90 ms and the TUI in about 150 ms
+DEFAULT_CLI_BUDGET_MS = 200.0
+DEFAULT_TUI_BUDGET_MS = 300.0
+
+CLI_DEFERRED = (
+    "google.genai",
+    "requests",
+    "httpx",
+    "textual",
+    "rich.progress",
+    "hermes.bench.suite",
+    "hermes.bench.mock_server",
+)
+# The TUI needs textual and the async client (httpx) as soon as it starts
+TUI_DEFERRED = ("google.genai", "requests")
+
+# Runs in the child interpreter: time the import, then list the deferred modules it loaded
+PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "loaded": [m for m in sys.argv[2:] if m in sys.modules]}))
+"""
+
+# "import time: self [us] | cumulative | imported package" lines of -X importtime
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)")
+INTERPRETER_LAST_IMPORT = "site"
+
+
+@dataclass(frozen=True)
+class StartupTarget:
+    """A module imported at startup and what it must not pull in."""
+
+    name: str
+    module: str
+    budget_ms: float
+    deferred: tuple[str, ...]
+
+
+@dataclass
+class StartupResult:
+    """Median import time of a target and the deferred modules it loaded."""
+
+    target: StartupTarget
+    runs: int
+    median_ms: float
+    max_ms: float
+    loaded: list[str]
+
+    @property
+    def over_budget(self) -> bool:
+        return self.median_ms > self.target.budget_ms
+
+    @property
+    def passed(self) -> bool:
+        return not self.over_budget and not self.loaded
+
+
+def default_targets(
+    cli_budget_ms: float = DEFAULT_CLI_BUDGET_MS, tui_budget_ms: float = DEFAULT_TUI_BUDGET_MS
+) -> list[StartupTarget]:
+    return [
+        StartupTarget("cli", "hermes.cli", cli_budget_ms, CLI_DEFERRED),
+        StartupTarget("tui", "hermes.tui.app", tui_budget_ms, TUI_DEFERRED),
+    ]
+
+
+def _probe(target: StartupTarget) -> dict:
+    """
+    Import the target once in a fresh interpreter.
+
+    Raises:
+        subprocess.CalledProcessError: If the import fails
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE, target.module, *target.deferred],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The TUI restores the terminal at exit, after the JSON line
+    return json.loads(completed.stdout.splitlines()[0])
+
+
+def measure(target: StartupTarget, runs: int = DEFAULT_RUNS) -> StartupResult:
+    """Median import time of a target over fresh interpreters."""
+    probes = [_probe(target) for _ in range(runs)]
+    timings = [probe["ms"] for probe in probes]
+    loaded = sorted({module for probe in probes for module in probe["loaded"]})
+    return StartupResult(target, runs, statistics.median(timings), max(timings), loaded)
+
+
+def heaviest_imports(module: str, count: int = HEAVIEST_IMPORTS) -> list[tuple[str, float]]:
+    """
+    Modules with the largest self import time (ms) while importing module, from -X importtime.
+
+    Raises:
+        subprocess.CalledProcessError: If the import fails
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = [
+        (match.group(2), int(match.group(1)) / 1000)
+        for match in map(IMPORTTIME_LINE.match, completed.stderr.splitlines())
+        if match
+    ]
+    # Everything up to "site" is imported by the interpreter itself
+    names = [name for name, _ in imports]
+    if INTERPRETER_LAST_IMPORT in names:
+        imports = imports[names.index(INTERPRETER_LAST_IMPORT) + 1 :]
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:count]
+
+
+def render_results(results: list[StartupResult]) -> Table:
+    table = Table(title="Startup import time")
+    table.add_column("Target", style="cyan")
+    table.add_column("Module")
+    table.add_column("Median", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("Budget", justify="right")
+    table.add_column("Deferred modules loaded")
+    for result in results:
+        median_style = "red" if result.over_budget else "green"
+        table.add_row(
+            result.target.name,
+            result.target.module,
+            f"[{median_style}]{result.median_ms:.0f} ms[/{median_style}]",
+            f"{result.max_ms:.0f} ms",
+            f"{result.target.budget_ms:.0f} ms",
+            f"[red]{', '.join(result.loaded)}[/red]" if result.loaded else "[green]none[/green]",
+        )
+    return table
+
+
+def render_imports(module: str, imports: list[tuple[str, float]]) -> Table:
+    table = Table(title=f"Heaviest imports of {module}")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self", justify="right")
+    for name, ms in imports:
+        table.add_row(name, f"{ms:.1f} ms")
+    return table
+
+
+def main(
+    runs: int = typer.Option(DEFAULT_RUNS, "--runs", "-n", help="Fresh interpreters per target"),
+    cli_budget_ms: float = typer.Option(
+        DEFAULT_CLI_BUDGET_MS, "--budget-ms", help="Budget of the CLI import (median)"
+    ),
+    tui_budget_ms: float = typer.Option(
+        DEFAULT_TUI_BUDGET_MS, "--tui-budget-ms", help="Budget of the TUI import (median)"
+    ),
+    show_imports: bool = typer.Option(
+        True, "--imports/--no-imports", help="List the heaviest imports of each target"
+    ),
+):
+    """Measure startup import time and fail when a target is over budget."""
+    console = Console()
+    results = [measure(target, runs) for target in default_targets(cli_budget_ms, tui_budget_ms)]
+    console.print(render_results(results))
+    if show_imports:
+        for result in results:
+            module = result.target.module
+            console.print(render_imports(module, heaviest_imports(module)))
+
+    failed = [result.target.name for result in results if not result.passed]
+    if failed:
+        console.print(f"[red]Startup budget exceeded: {', '.join(failed)}[/red]")
+        raise typer.Exit(1)
+    console.print("[green]All targets within budget[/green]")
+
+
+if __name__ == "__main__":
+    typer.run(main)
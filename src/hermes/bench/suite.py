@@ -0,0 +1,292 @@
+"""Benchmark scenarios behind ``hermes bench``.
+
+Each scenario prepares its inputs in a temporary directory (synthetic
+translation files, a seeded mock server), then runs one step repeatedly:
+a first traced run measures peak memory, the following runs are timed.
+Crowdin and Gemini are always the local mock server, so results only move
+when Hermes does.
+"""
+
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+
+from hermes.core.crowdin_api import CrowdinAPI
+from hermes.core.crowdin_transport import CrowdinTransport
+from hermes.core.crowdin_upload_api import CrowdinUploadAPI
+from hermes.core.file_operations import extract_and_replace_files, process_language_files
+from hermes.core.gemini import DEFAULT_GEMINI_MODEL, TARGET_LOCALES
+from hermes.core.metadata_cache import MetadataCache
+from hermes.core.prompt_cache import PromptCache, cache_display_name
+
+from .history import ScenarioResult
+from .mock_server import (
+    CHARS_PER_TOKEN,
+    MIN_CACHE_TOKENS,
+    MOCK_LANGUAGES,
+    MockProject,
+    MockServer,
+    MockSettings,
+)
+from .options import BenchOptions
+from .synthetic import (
+    ProjectSpec,
+    generate_keys,
+    generate_translations,
+    write_keys_file,
+    write_resource_tree,
+)
+
+PERCENTILE_DIVISIONS = 100
+P50_INDEX = 49
+P95_INDEX = 94
+
+# The mock server accepts any credentials
+BENCH_TOKEN = "bench"
+BENCH_PROJECT_ID = "bench"
+
+# Lifetime of the caches seeded for the prompt-cache scenario
+SEEDED_CACHE_TTL_SECONDS = 3600
+
+# Step of a scenario: runs once and returns the number of units it processed
+Step = Callable[[], int]
+
+
+@dataclass
+class Scenario:
+    """A named benchmark: prepare(options, workdir, stack) returns the step to time."""
+
+    name: str
+    description: str
+    unit: str
+    prepare: Callable[[BenchOptions, Path, ExitStack], Step]
+
+
+def percentile(samples: list[float], index: int) -> float:
+    """Percentile of samples (index into 100 divisions), also for tiny samples."""
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    return statistics.quantiles(samples, n=PERCENTILE_DIVISIONS, method="inclusive")[index]
+
+
+def _quiet(message: str) -> None:
+    return
+
+
+def _languages(count: int) -> dict[str, str]:
+    """Mock project languages: the first count target locales."""
+    return {locale: MOCK_LANGUAGES[locale] for locale in TARGET_LOCALES[:count]}
+
+
+def _crowdin_client(server: MockServer, workdir: Path, stack: ExitStack) -> CrowdinAPI:
+    """Crowdin client for the mock server, with its own metadata cache and connection pool."""
+    transport = CrowdinTransport()
+    stack.callback(transport.client.close)
+    return CrowdinAPI(
+        BENCH_TOKEN,
+        BENCH_PROJECT_ID,
+        metadata_cache=MetadataCache(workdir / "metadata.json"),
+        transport=transport,
+        api_url=server.crowdin_url,
+    )
+
+
+def _build_polling(options: BenchOptions, workdir: Path, stack: ExitStack) -> Step:
+    settings = MockSettings(latency_ms=options.latency_ms, build_seconds=options.build_seconds)
+    server = stack.enter_context(MockServer(settings))
+    api = _crowdin_client(server, workdir, stack)
+
+    def step() -> int:
+        build_id = api.initiate_build()
+        api.check_build_status(build_id, poll_interval=options.poll_interval)
+        return 1
+
+    return step
+
+
+def _download_extract(options: BenchOptions, workdir: Path, stack: ExitStack) -> Step:
+    project = MockProject(_languages(options.languages))
+    spec = ProjectSpec(keys=options.download_keys, languages=list(project.languages.values()))
+    project.seed(generate_translations(spec))
+    server = stack.enter_context(MockServer(MockSettings(latency_ms=options.latency_ms), project))
+    api = _crowdin_client(server, workdir, stack)
+    zip_path = str(workdir / "translations.zip")
+
+    def step() -> int:
+        build_id = api.initiate_build()
+        api.check_build_status(build_id, poll_interval=options.poll_interval)
+        api.download_build(build_id, zip_path)
+        extract_and_replace_files(zip_path, str(workdir / "data"))
+        return Path(zip_path).stat().st_size
+
+    return step
+
+
+def _process_files(options: BenchOptions, workdir: Path, stack: ExitStack) -> Step:
+    data_path = workdir / "data"
+    write_resource_tree(generate_translations(ProjectSpec(keys=options.process_keys)), data_path)
+
+    def step() -> int:
+        processed = process_language_files(str(data_path), str(workdir / "result"))
+        return options.process_keys * len(processed)
+
+    return step
+
+
+def _upload(options: BenchOptions, workdir: Path, stack: ExitStack) -> Step:
+    project = MockProject(_languages(options.languages))
+    server = stack.enter_context(MockServer(MockSettings(latency_ms=options.latency_ms), project))
+    key_path = workdir / "keys.txt"
+    write_keys_file(generate_keys(ProjectSpec(keys=0), options.upload_keys), key_path)
+    upload_api = CrowdinUploadAPI(
+        api_token=BENCH_TOKEN,
+        project_id=BENCH_PROJECT_ID,
+        gemini_api_key=BENCH_TOKEN,
+        key_file_path=str(key_path),
+        data_path=f"{workdir / 'data'}/",
+        log_callback=_quiet,
+        gemini_api_url=server.gemini_url,
+        crowdin=_crowdin_client(server, workdir, stack),
+    )
+
+    def step() -> int:
+        project.reset()
+        return upload_api.run_pipelined_upload().translations_posted
+
+    return step
+
+
+def _prompt(name: str, tokens: int) -> str:
+    """Synthetic system prompt of roughly the given size in tokens."""
+    return f"{name}: " + "x" * tokens * CHARS_PER_TOKEN
+
+
+def _prompt_cache(options: BenchOptions, workdir: Path, stack: ExitStack) -> Step:
+    from google import genai  # noqa: PLC0415 - deferred like the rest of the Gemini SDK
+
+    server = stack.enter_context(MockServer(MockSettings(latency_ms=options.latency_ms)))
+    client = genai.Client(api_key=BENCH_TOKEN, http_options={"base_url": server.gemini_url})
+    expired_prompt = _prompt("expired", MIN_CACHE_TOKENS)
+    live_prompt = _prompt("live", MIN_CACHE_TOKENS)
+    short_prompt = _prompt("short", MIN_CACHE_TOKENS // 2)
+    # A previous run's caches: one past its TTL, one live under the "models/" name
+    expired = server.add_cache(
+        cache_display_name(expired_prompt), DEFAULT_GEMINI_MODEL, -SEEDED_CACHE_TTL_SECONDS
+    )
+    live = server.add_cache(
+        cache_display_name(live_prompt), DEFAULT_GEMINI_MODEL, SEEDED_CACHE_TTL_SECONDS
+    )
+
+    def step() -> int:
+        cache = PromptCache(client, log_callback=_quiet)
+        results = {
+            "expired entry is replaced": cache.get(expired_prompt, DEFAULT_GEMINI_MODEL)
+            not in (None, expired["name"]),
+            "live entry is reused": cache.get(live_prompt, DEFAULT_GEMINI_MODEL) == live["name"],
+            "refused prompt is uncached": cache.get(short_prompt, DEFAULT_GEMINI_MODEL) is None,
+        }
+        failed = [check for check, passed in results.items() if not passed]
+        if failed:
+            raise RuntimeError(f"Prompt cache check failed: {', '.join(failed)}")
+        return len(results)
+
+    return step
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "build-polling", "Initiate a build and poll it to completion", "builds", _build_polling
+        ),
+        Scenario(
+            "download-extract",
+            "Build, download and extract a large translations zip",
+            "bytes",
+            _download_extract,
+        ),
+        Scenario(
+            "process-files",
+            "Convert synthetic resources to JS (process_language_files)",
+            "keys",
+            _process_files,
+        ),
+        Scenario(
+            "upload",
+            "Translate and upload N keys x M languages (pipelined)",
+            "translations",
+            _upload,
+        ),
+        Scenario(
+            "prompt-cache",
+            "Look up, reuse and create Gemini prompt caches (PromptCache)",
+            "lookups",
+            _prompt_cache,
+        ),
+    )
+}
+
+
+def _traced(step: Step) -> tuple[int, int]:
+    """Run a step under tracemalloc; return its units and peak traced memory."""
+    tracemalloc.start()
+    try:
+        units = step()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return units, peak
+
+
+def _timed(step: Step) -> float:
+    start = time.perf_counter()
+    step()
+    return time.perf_counter() - start
+
+
+def run_scenario(scenario: Scenario, options: BenchOptions) -> ScenarioResult:
+    """
+    Prepare a scenario, measure its peak memory once and time options.repeat runs.
+
+    Peak memory is traced Python allocation of the whole process, so it
+    includes the in-process mock server.
+    """
+    with tempfile.TemporaryDirectory(prefix="hermes-bench-") as workdir, ExitStack() as stack:
+        step = scenario.prepare(options, Path(workdir), stack)
+        units, peak = _traced(step)
+        timings = [_timed(step) for _ in range(max(1, options.repeat))]
+    return ScenarioResult(
+        name=scenario.name,
+        runs=len(timings),
+        p50_seconds=percentile(timings, P50_INDEX),
+        p95_seconds=percentile(timings, P95_INDEX),
+        units=units,
+        unit=scenario.unit,
+        peak_memory_bytes=peak,
+    )
+
+
+def run_suite(
+    names: list[str],
+    options: BenchOptions,
+    on_result: Callable[[ScenarioResult], None] | None = None,
+) -> list[ScenarioResult]:
+    """
+    Run scenarios in order.
+
+    Raises:
+        KeyError: If a scenario name is unknown
+    """
+    scenarios = [SCENARIOS[name] for name in names]
+    results = []
+    for scenario in scenarios:
+        result = run_scenario(scenario, options)
+        results.append(result)
+        if on_result:
+            on_result(result)
+    return results
@@ -0,0 +1,232 @@
+"""Synthetic translation projects for scale testing.
+
+Generates CommonResource.json trees and Crowdin-style build zips (one
+folder per language of LANGUAGE_MAPPING) with realistic value lengths and
+scripts (Han, kana, Thai, Arabic, Latin with and without diacritics), plus
+keys files mixing new keys with keys the project already has. Output is
+deterministic for a given seed.
+
+Run with ``python -m hermes.bench.synthetic --keys 1000000 --out scale/``.
+"""
+
+import json
+import math
+import random
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import typer
+
+from hermes.core.crowdin_api import RESOURCE_FILE_NAME
+from hermes.core.file_operations import LANGUAGE_MAPPING
+
+SOURCE_LANGUAGE = "zh-TW"
+
+# Value lengths (characters) follow a log-normal distribution: mostly short UI
+# labels with a long tail of sentences
+DEFAULT_MEDIAN_LENGTH = 8
+DEFAULT_LENGTH_SIGMA = 0.9
+DEFAULT_MAX_LENGTH = 400
+
+# Characters per word for scripts written with spaces
+WORD_LENGTHS = (2, 3, 4, 5, 6, 7, 8)
+
+
+@dataclass(frozen=True)
+class Script:
+    """Characters of a writing system and how its words are joined."""
+
+    alphabet: str
+    separator: str = ""
+
+
+def _char_range(first: int, last: int) -> str:
+    return "".join(chr(code) for code in range(first, last + 1))
+
+
+HAN_TRADITIONAL = Script("碳排放能源直接間接範疇盤查報告數據設定管理請輸入確認取消儲存刪除類別項目")
+HAN_SIMPLIFIED = Script("碳排放能源直接间接范畴盘查报告数据设定管理请输入确认取消储存删除类别项目")
+JAPANESE = Script(_char_range(0x3041, 0x3093) + "排出量直接間接報告設定管理確認")
+THAI = Script(_char_range(0x0E01, 0x0E2E) + _char_range(0x0E30, 0x0E39))
+ARABIC = Script(_char_range(0x0627, 0x064A), " ")
+LATIN = Script("abcdefghijklmnopqrstuvwxyz", " ")
+VIETNAMESE = Script(
+    "aăâbcdđeêghiklmnoôơpqrstuưvxyàảãáạằắẳẵặầấẩẫậèéẻẽẹềếểễệìíỉĩịòóỏõọồốổỗộờớởỡợ", " "
+)
+
+# Script of each build folder (the source folders of LANGUAGE_MAPPING)
+LANGUAGE_SCRIPTS = {
+    "ar": ARABIC,
+    "en": LATIN,
+    "ja": JAPANESE,
+    "zh-TW": HAN_TRADITIONAL,
+    "zh-CN": HAN_SIMPLIFIED,
+    "th": THAI,
+    "vi": VIETNAMESE,
+    "id": LATIN,
+}
+
+
+@dataclass
+class ProjectSpec:
+    """Size and shape of a synthetic project."""
+
+    keys: int
+    languages: list[str] = field(default_factory=lambda: list(LANGUAGE_MAPPING.values()))
+    median_length: int = DEFAULT_MEDIAN_LENGTH
+    length_sigma: float = DEFAULT_LENGTH_SIGMA
+    max_length: int = DEFAULT_MAX_LENGTH
+    seed: int = 0
+
+
+class TextGenerator:
+    """Random strings in a script, with lengths from a log-normal distribution."""
+
+    def __init__(self, spec: ProjectSpec, rng: random.Random):
+        self.spec = spec
+        self.rng = rng
+
+    def length(self) -> int:
+        value = self.rng.lognormvariate(math.log(self.spec.median_length), self.spec.length_sigma)
+        return max(1, min(self.spec.max_length, round(value)))
+
+    def text(self, script: Script, length: int) -> str:
+        """A string of about length characters."""
+        if not script.separator:
+            return "".join(self.rng.choices(script.alphabet, k=length))
+        words = []
+        remaining = length
+        while remaining > 0:
+            size = min(remaining, self.rng.choice(WORD_LENGTHS))
+            words.append("".join(self.rng.choices(script.alphabet, k=size)))
+            remaining -= size + 1
+        return script.separator.join(words)
+
+
+def _source_keys(generator: TextGenerator, count: int, taken: set[str]) -> list[str]:
+    """Unique source (zh-TW) keys not in taken; collisions get a numeric suffix."""
+    keys = []
+    for index in range(count):
+        key = generator.text(HAN_TRADITIONAL, generator.length())
+        if key in taken:
+            key = f"{key}{index}"
+        taken.add(key)
+        keys.append(key)
+    return keys
+
+
+def generate_translations(spec: ProjectSpec) -> dict[str, dict[str, str]]:
+    """
+    Generate a project's translations.
+
+    Returns:
+        Translations by build folder (e.g. "en"), then key identifier ("__" + source text)
+    """
+    generator = TextGenerator(spec, random.Random(spec.seed))
+    keys = _source_keys(generator, spec.keys, set())
+    translations = {}
+    for language in spec.languages:
+        if language == SOURCE_LANGUAGE:
+            translations[language] = {f"__{key}": key for key in keys}
+            continue
+        script = LANGUAGE_SCRIPTS.get(language, LATIN)
+        translations[language] = {
+            f"__{key}": generator.text(script, generator.length()) for key in keys
+        }
+    return translations
+
+
+def _resource_json(values: dict[str, str]) -> str:
+    return json.dumps(values, ensure_ascii=False, indent=2)
+
+
+def write_resource_tree(translations: dict[str, dict[str, str]], path: str | Path) -> int:
+    """
+    Write one <folder>/CommonResource.json per language, like an extracted build.
+
+    Returns:
+        Total characters written
+    """
+    total = 0
+    for language, values in translations.items():
+        resource = Path(path) / language / RESOURCE_FILE_NAME
+        resource.parent.mkdir(parents=True, exist_ok=True)
+        total += resource.write_text(_resource_json(values), encoding="utf-8")
+    return total
+
+
+def write_build_zip(translations: dict[str, dict[str, str]], path: str | Path) -> int:
+    """
+    Write a Crowdin-style build zip of the translations.
+
+    Returns:
+        Size of the zip in bytes
+    """
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for language, values in translations.items():
+            archive.writestr(f"{language}/{RESOURCE_FILE_NAME}", _resource_json(values))
+    return Path(path).stat().st_size
+
+
+def generate_keys(
+    spec: ProjectSpec,
+    new_keys: int,
+    translations: dict[str, dict[str, str]] | None = None,
+    existing_keys: int = 0,
+) -> list[str]:
+    """
+    Keys for a keys file: new keys, plus existing_keys sampled from translations.
+
+    New keys never collide with the project's keys, so they are all uploaded;
+    existing ones exercise the skip path.
+    """
+    rng = random.Random(spec.seed + 1)
+    source = (translations or {}).get(SOURCE_LANGUAGE, {})
+    taken = set(source.values())
+    keys = _source_keys(TextGenerator(spec, rng), new_keys, taken)
+    existing = rng.sample(sorted(source.values()), min(existing_keys, len(source)))
+    mixed = keys + existing
+    rng.shuffle(mixed)
+    return mixed
+
+
+def write_keys_file(keys: list[str], path: str | Path) -> None:
+    """Write keys one per line, the format of keys.txt."""
+    Path(path).write_text("\n".join(keys) + "\n", encoding="utf-8")
+
+
+def main(
+    *,
+    keys: int = typer.Option(10_000, "--keys", help="Keys per language"),
+    out_dir: str = typer.Option("synthetic", "--out", help="Output directory"),
+    languages: str = typer.Option(
+        ",".join(LANGUAGE_MAPPING.values()), "--languages", help="Comma-separated build folders"
+    ),
+    median_length: int = typer.Option(
+        DEFAULT_MEDIAN_LENGTH, "--median-length", help="Median value length in characters"
+    ),
+    new_keys: int = typer.Option(100, "--new-keys", help="New keys in keys.txt"),
+    existing_keys: int = typer.Option(10, "--existing-keys", help="Existing keys in keys.txt"),
+    seed: int = typer.Option(0, "--seed", help="Seed for repeatable output"),
+):
+    """Write a resource tree, a build zip and a keys file for a synthetic project."""
+    spec = ProjectSpec(
+        keys=keys,
+        languages=[language.strip() for language in languages.split(",")],
+        median_length=median_length,
+        seed=seed,
+    )
+    translations = generate_translations(spec)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    tree_bytes = write_resource_tree(translations, out / "data")
+    zip_bytes = write_build_zip(translations, out / "translations.zip")
+    write_keys_file(generate_keys(spec, new_keys, translations, existing_keys), out / "keys.txt")
+    typer.echo(f"{out / 'data'}: {len(translations)} languages x {keys} keys, {tree_bytes:,} chars")
+    typer.echo(f"{out / 'translations.zip'}: {zip_bytes:,} bytes")
+    typer.echo(f"{out / 'keys.txt'}: {new_keys} new, {existing_keys} existing keys")
+
+
+if __name__ == "__main__":
+    typer.run(main)
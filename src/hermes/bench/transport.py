@@ -0,0 +1,263 @@
+"""Benchmark of the HTTP/2 transport against the pooled HTTP/1.1 path.
+
+Starts a local HTTP server that answers every request like Crowdin answers
+a string or translation POST, then sends the same burst of small JSON POSTs
+over pooled HTTP/1.1 connections and over one multiplexed HTTP/2 connection.
+
+Run with ``python -m hermes.bench.transport`` (needs the ``http2`` and
+``bench`` extras).
+"""
+
+import asyncio
+import importlib.util
+import json
+import socket
+import statistics
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from rich.console import Console
+from rich.table import Table
+
+from hermes.core.crowdin_transport import require_http2
+
+BENCH_HOST = "127.0.0.1"
+SERVER_START_TIMEOUT_SECONDS = 10.0
+SERVER_POLL_SECONDS = 0.05
+
+# Default burst: enough requests for connection setup and queuing to show
+DEFAULT_REQUESTS = 2000
+DEFAULT_CONCURRENCY = 64
+DEFAULT_SERVER_LATENCY_MS = 5.0
+
+PERCENTILE_DIVISIONS = 100
+P50_INDEX = 49
+P95_INDEX = 94
+
+RESPONSE_BODY = json.dumps({"data": {"id": 1}}).encode("utf-8")
+REQUEST_BODY = json.dumps({"stringId": 1, "languageId": "en", "text": "Direct energy emissions"})
+
+# ASGI receive/send callables
+Receive = Callable[[], Any]
+Send = Callable[[dict], Any]
+
+
+@dataclass
+class TransportBenchmark:
+    """Result of one protocol run."""
+
+    protocol: str
+    requests: int
+    concurrency: int
+    seconds: float
+    p50_ms: float
+    p95_ms: float
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+
+def require_bench_server() -> None:
+    """
+    Check that the local benchmark server is installed.
+
+    Raises:
+        ImportError: If hypercorn is missing
+    """
+    if importlib.util.find_spec("hypercorn") is None:
+        raise ImportError(
+            "The benchmark server needs the 'bench' extra: pip install 'hermes[bench]'"
+        )
+
+
+def crowdin_post_app(latency_seconds: float) -> Callable[[dict, Receive, Send], Any]:
+    """
+    ASGI app answering every request with a 201 and a small JSON body.
+
+    Args:
+        latency_seconds: Server-side delay per request
+    """
+
+    async def app(scope: dict, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return
+        more_body = True
+        while more_body:
+            message = await receive()
+            more_body = message.get("more_body", False)
+        await asyncio.sleep(latency_seconds)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 201,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": RESPONSE_BODY})
+
+    return app
+
+
+def _free_port() -> int:
+    """Ask the OS for an unused local port."""
+    with socket.socket() as sock:
+        sock.bind((BENCH_HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_listening(port: int) -> None:
+    """Block until the server accepts connections."""
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex((BENCH_HOST, port)) == 0:
+                return
+        time.sleep(SERVER_POLL_SECONDS)
+    raise TimeoutError(f"Benchmark server did not start on port {port}")
+
+
+@contextmanager
+def local_server(app: Callable[[dict, Receive, Send], Any]) -> Iterator[str]:
+    """
+    Serve an ASGI app over cleartext HTTP/1.1 and HTTP/2 (prior knowledge).
+
+    Yields:
+        Base URL of the server
+    """
+    from hypercorn.asyncio import serve  # noqa: PLC0415 - optional dependency
+    from hypercorn.config import Config  # noqa: PLC0415
+
+    require_bench_server()
+    port = _free_port()
+    config = Config()
+    config.bind = [f"{BENCH_HOST}:{port}"]
+    config.loglevel = "WARNING"
+
+    loop = asyncio.new_event_loop()
+    stop = asyncio.Event()
+    thread = threading.Thread(
+        target=loop.run_until_complete,
+        args=(serve(app, config, shutdown_trigger=stop.wait),),
+        daemon=True,
+    )
+    thread.start()
+    _wait_until_listening(port)
+    try:
+        yield f"http://{BENCH_HOST}:{port}"
+    finally:
+        loop.call_soon_threadsafe(stop.set)
+        thread.join()
+        loop.close()
+
+
+def _percentile(latencies: list[float], index: int) -> float:
+    """Latency percentile in milliseconds."""
+    if len(latencies) < 2:
+        return latencies[0] * 1000 if latencies else 0.0
+    return statistics.quantiles(latencies, n=PERCENTILE_DIVISIONS)[index] * 1000
+
+
+async def _post_burst(client: httpx.AsyncClient, url: str, total: int, concurrency: int) -> list:
+    """Send total POSTs with at most concurrency in flight; return their latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+    headers = {"Content-Type": "application/json"}
+
+    async def post() -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(url, headers=headers, content=REQUEST_BODY)
+            response.raise_for_status()
+            return time.perf_counter() - start
+
+    return await asyncio.gather(*(post() for _ in range(total)))
+
+
+async def run_transport_benchmark(
+    base_url: str,
+    http2: bool,
+    total_requests: int = DEFAULT_REQUESTS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> TransportBenchmark:
+    """
+    Time a burst of translation-sized POSTs over one protocol.
+
+    HTTP/1.1 uses a pool of up to ``concurrency`` connections; HTTP/2 uses
+    a single connection (prior knowledge, as the local server is cleartext).
+    """
+    client = httpx.AsyncClient(
+        http1=not http2,
+        http2=http2,
+        limits=httpx.Limits(max_connections=1 if http2 else concurrency),
+    )
+    async with client:
+        start = time.perf_counter()
+        latencies = await _post_burst(
+            client, f"{base_url}/api/v2/projects/1/translations", total_requests, concurrency
+        )
+        seconds = time.perf_counter() - start
+    return TransportBenchmark(
+        protocol="HTTP/2" if http2 else "HTTP/1.1",
+        requests=total_requests,
+        concurrency=concurrency,
+        seconds=seconds,
+        p50_ms=_percentile(latencies, P50_INDEX),
+        p95_ms=_percentile(latencies, P95_INDEX),
+    )
+
+
+def compare_transports(
+    total_requests: int = DEFAULT_REQUESTS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    latency_ms: float = DEFAULT_SERVER_LATENCY_MS,
+) -> list[TransportBenchmark]:
+    """
+    Run the HTTP/1.1 and HTTP/2 benchmarks against a fresh local server.
+
+    Raises:
+        ImportError: If the http2 or bench extras are missing
+    """
+    require_http2()
+    require_bench_server()
+    with local_server(crowdin_post_app(latency_ms / 1000)) as base_url:
+        return [
+            asyncio.run(run_transport_benchmark(base_url, http2, total_requests, concurrency))
+            for http2 in (False, True)
+        ]
+
+
+def render_results(results: list[TransportBenchmark]) -> Table:
+    """Render benchmark results as a Rich table."""
+    table = Table(title="Crowdin transport benchmark")
+    table.add_column("Protocol", style="cyan")
+    table.add_column("Requests", justify="right")
+    table.add_column("Concurrency", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Req/s", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    for result in results:
+        table.add_row(
+            result.protocol,
+            str(result.requests),
+            str(result.concurrency),
+            f"{result.seconds:.2f}",
+            f"{result.requests_per_second:.0f}",
+            f"{result.p50_ms:.1f}",
+            f"{result.p95_ms:.1f}",
+        )
+    return table
+
+
+def main() -> None:
+    """Run the comparison with default settings and print the table."""
+    Console().print(render_results(compare_transports()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,57 @@
 """CLI interface for Hermes using Typer."""
 
+import signal
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+from rich.markup import escape
 from rich.table import Table
 
+from hermes.bench.history import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    BenchRun,
+    ScenarioResult,
+    append_history,
+    find_regressions,
+    load_baseline,
+    save_baseline,
+)
+from hermes.bench.options import BenchOptions
+from hermes.core.cancellation import CancelToken, OperationCancelled
 from hermes.core.config import Profile, get_config, get_config_path
 from hermes.core.crowdin_api import CrowdinAPI, CrowdinError
+from hermes.core.crowdin_transport import configure_transport, get_transport
 from hermes.core.crowdin_upload_api import CrowdinUploadAPI
 from hermes.core.file_operations import (
     extract_and_replace_files,
     process_language_files,
 )
+from hermes.core.gemini import GeminiError
+from hermes.core.journal import UnfinishedJournalError
+from hermes.core.metadata_cache import get_metadata_cache
+from hermes.core.metrics import get_metrics, write_metrics
+from hermes.core.profile_sync import (
+    DEFAULT_MAX_PARALLEL,
+    ProfileJob,
+    ProfileResult,
+    find_shared_paths,
+    sync_profiles,
+)
+from hermes.core.profiling import StageProfiler
+from hermes.core.progress import ProgressBus, ProgressEvent, summarize
+from hermes.core.rate_limit import RateGovernor
+from hermes.core.throughput import format_bytes
+from hermes.core.timing import Timings, get_timings
+from hermes.core.upload_pipeline import STAGE_TRANSLATIONS
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 app = typer.Typer(
     name="hermes",
@@ -20,13 +60,212 @@ app = typer.Typer(
 )
 console = Console()
 
+# Exit code of a run stopped with Ctrl-C (128 + SIGINT)
+EXIT_CANCELLED = 130
+
+# Profile label of the metrics written by `download --all-profiles`
+ALL_PROFILES = "all"
+
 # Config subcommand group
 config_app = typer.Typer(help="Configuration management commands")
 app.add_typer(config_app, name="config")
 
 
+def _configure_http2(enabled: bool) -> None:
+    """Switch Crowdin requests to HTTP/2, exiting if it is not installed."""
+    if not enabled:
+        return
+    try:
+        configure_transport(http2=True)
+    except ImportError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
+def _timings_table(timings: Timings) -> Table:
+    """Render aggregated timing spans; concurrent spans can add up past the wall clock."""
+    elapsed = timings.elapsed
+    table = Table(title=f"Timings ({elapsed:.2f}s wall clock)")
+    table.add_column("Kind", style="dim")
+    table.add_column("Span", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("% wall", justify="right")
+    table.add_column("Mean", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Max", justify="right")
+    for summary in timings.summary():
+        table.add_row(
+            summary.category,
+            summary.name,
+            str(summary.count),
+            f"{summary.total:.3f}s",
+            f"{summary.total / elapsed:.0%}" if elapsed else "-",
+            f"{summary.mean * 1000:.1f} ms",
+            f"{summary.p95 * 1000:.1f} ms",
+            f"{summary.max * 1000:.1f} ms",
+        )
+    return table
+
+
+def _start_timings(enabled: bool) -> None:
+    """Start recording timing spans for this command."""
+    if enabled:
+        get_timings().start()
+
+
+def _report_timings(enabled: bool, json_path: str | None) -> None:
+    """Print the timing breakdown (and write it as JSON) if it was asked for."""
+    timings = get_timings()
+    if not enabled:
+        return
+    timings.stop()
+    console.print(_timings_table(timings))
+    if json_path:
+        timings.write_json(json_path)
+        console.print(f"[dim]Timings written to {json_path}[/dim]")
+
+
+def _progress() -> "Progress":
+    """Progress bar of the download and upload commands."""
+    # rich.progress is imported here so commands without a progress bar start faster
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn  # noqa: PLC0415 - deferred for startup time
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        console=console,
+    )
+
+
+def _progress_bus(progress: "Progress", description: str, rate: float) -> ProgressBus:
+    """Bus feeding a new task of the progress bar and printing its log lines."""
+    task = progress.add_task(description, total=100)
+
+    def apply(events: list[ProgressEvent]) -> None:
+        batch = summarize(events)
+        if batch.lines:
+            console.print("\n".join(batch.lines))
+        progress.update(task, description=batch.status, completed=batch.percent)
+
+    return ProgressBus(apply, rate)
+
+
+@contextmanager
+def _cancel_on_interrupt(cancel: CancelToken) -> Iterator[None]:
+    """Turn the first Ctrl-C into a cancel request; a second one interrupts at once."""
+
+    def interrupt(signum: int, frame: object) -> None:
+        if cancel.cancelled:
+            raise KeyboardInterrupt
+        cancel.cancel("Interrupted")
+        console.print(
+            "[yellow]Cancelling after the requests in flight (Ctrl-C again to abort)[/yellow]"
+        )
+
+    previous = signal.signal(signal.SIGINT, interrupt)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+def _start_profiler(directory: str | None) -> StageProfiler | None:
+    """Start the stage profiler if an output directory was given."""
+    if not directory:
+        return None
+    profiler = StageProfiler()
+    profiler.start()
+    return profiler
+
+
+def _report_profiler(profiler: StageProfiler | None, directory: str | None) -> None:
+    """Stop the profiler and write its flame graph input and allocations report."""
+    if profiler is None or not directory:
+        return
+    profiler.stop()
+    try:
+        folded_path, allocations_path = profiler.write(directory)
+    except OSError as e:
+        console.print(f"[yellow]Warning: Could not write profile: {e}[/yellow]")
+        return
+    console.print(f"[dim]Profile written to {folded_path} and {allocations_path}[/dim]")
+
+
+def _write_metrics_files(metrics_dir: str, command: str, labels: dict[str, str]) -> None:
+    """Write the run metrics; a failure is reported but does not fail the run."""
+    try:
+        prom_path, json_path = write_metrics(get_metrics(), metrics_dir, command, labels)
+    except OSError as e:
+        console.print(f"[yellow]Warning: Could not write metrics: {e}[/yellow]")
+        return
+    console.print(f"[dim]Metrics written to {prom_path} and {json_path}[/dim]")
+
+
+def _report_metrics(
+    metrics_dir: str, command: str, labels: dict[str, str], started: float, succeeded: bool
+) -> None:
+    """Add the run summary to the collected metrics and write them if a directory is set."""
+    if not metrics_dir:
+        return
+    metrics = get_metrics()
+    metrics.set("hermes_run_success", int(succeeded))
+    metrics.set("hermes_run_duration_seconds", time.perf_counter() - started)
+    metrics.set("hermes_run_timestamp_seconds", time.time())
+    stats = get_transport().stats
+    metrics.set("hermes_crowdin_gets_total", stats.network, outcome="network")
+    metrics.set("hermes_crowdin_gets_total", stats.coalesced, outcome="coalesced")
+    metrics.set("hermes_crowdin_gets_total", stats.not_modified, outcome="not_modified")
+    _write_metrics_files(metrics_dir, command, labels)
+
+
+@dataclass
+class _RunOutcome:
+    """Whether a command succeeded, recorded in its run metrics."""
+
+    succeeded: bool = False
+
+
+@contextmanager
+def _reported_run(
+    command: str,
+    labels: dict[str, str],
+    *,
+    metrics_dir: str,
+    timings: bool,
+    timings_json: str | None,
+    profiler_dir: str | None,
+) -> Iterator[_RunOutcome]:
+    """Record the timings, profile and metrics of a command and report them when it ends."""
+    _start_timings(timings)
+    get_metrics().reset()
+    profiler = _start_profiler(profiler_dir)
+    started = time.perf_counter()
+    outcome = _RunOutcome()
+    try:
+        yield outcome
+    finally:
+        _report_profiler(profiler, profiler_dir)
+        _report_timings(timings, timings_json)
+        _report_metrics(metrics_dir, command, labels, started, outcome.succeeded)
+
+
+def _select_profile(name: str | None) -> Profile:
+    """Activate the named profile, if given, and return the current profile."""
+    cfg = get_config()
+    if name:
+        if name not in cfg.profiles:
+            console.print(f"[red]Profile '{name}' not found[/red]")
+            raise typer.Exit(1)
+        cfg.active_profile = name
+    return cfg.current_profile
+
+
 @app.command()
 def download(
+    *,
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
     project_id: str | None = typer.Option(None, "--project-id", help="Override project ID"),
     data_path: str | None = typer.Option(None, "--data-path", help="Override data path"),
@@ -34,83 +273,400 @@ def download(
     token: str | None = typer.Option(
         None, "--token", "-t", help="Crowdin API token", envvar="CROWDIN_TOKEN"
     ),
+    http2: bool = typer.Option(False, "--http2", help="Send Crowdin API requests over HTTP/2"),
+    crowdin_url: str | None = typer.Option(
+        None,
+        "--crowdin-url",
+        help="Crowdin API root (e.g. a mock server)",
+        envvar="HERMES_CROWDIN_URL",
+    ),
+    timings: bool = typer.Option(
+        False, "--timings", help="Print a breakdown of time per stage and per request"
+    ),
+    timings_json: str | None = typer.Option(
+        None, "--timings-json", help="Write the timing spans to this JSON file (implies --timings)"
+    ),
+    metrics_dir: str | None = typer.Option(
+        None,
+        "--metrics-dir",
+        help="Write run metrics (Prometheus textfile and JSON) to this directory",
+        envvar="HERMES_METRICS_DIR",
+    ),
+    profiler_dir: str | None = typer.Option(
+        None,
+        "--profiler",
+        help="Profile CPU and memory per stage; write a flame graph and allocations report here",
+    ),
+    all_profiles: bool = typer.Option(
+        False, "--all-profiles", help="Download every profile concurrently"
+    ),
+    profiles: str | None = typer.Option(
+        None, "--profiles", help="Comma-separated profiles to download concurrently"
+    ),
+    max_parallel: int = typer.Option(
+        DEFAULT_MAX_PARALLEL,
+        "--max-parallel",
+        help="Profiles downloading at the same time (with --all-profiles/--profiles)",
+    ),
+    crowdin_rpm: int = typer.Option(
+        0,
+        "--crowdin-rpm",
+        help="Crowdin requests per minute shared by all profiles (0 = unlimited)",
+    ),
 ):
     """Download translations from Crowdin."""
-    cfg = get_config()
-
-    # Select profile
-    if profile:
-        if profile not in cfg.profiles:
-            console.print(f"[red]Profile '{profile}' not found[/red]")
+    if all_profiles or profiles:
+        if project_id or data_path or result_path:
+            console.print(
+                "[red]--project-id, --data-path and --result-path apply to a single profile[/red]"
+            )
             raise typer.Exit(1)
-        cfg.active_profile = profile
+        names = _configured_profiles() if all_profiles else _profile_names(profiles or "")
+        _start_timings(timings or bool(timings_json))
+        profiler = _start_profiler(profiler_dir)
+        try:
+            _download_profiles(
+                names,
+                token=token,
+                crowdin_url=crowdin_url,
+                http2=http2,
+                max_parallel=max_parallel,
+                crowdin_rpm=crowdin_rpm,
+                metrics_dir=metrics_dir,
+                metrics_profile=ALL_PROFILES if all_profiles else "+".join(names),
+            )
+        finally:
+            _report_profiler(profiler, profiler_dir)
+            _report_timings(timings or bool(timings_json), timings_json)
+        return
 
-    p = cfg.current_profile
+    p = _select_profile(profile)
 
     # Override with CLI options
     api_token = token or p.crowdin_token
     proj_id = project_id or p.project_id
     d_path = data_path or p.data_path
     r_path = result_path or p.result_path
+    api_url = crowdin_url or p.crowdin_api_url or None
 
     if not api_token:
         console.print("[red]Error: Crowdin API token not configured.[/red]")
         console.print("Set it with: hermes config set-token --crowdin YOUR_TOKEN")
         raise typer.Exit(1)
 
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Downloading translations...", total=100)
-
-            # Initialize API
-            api = CrowdinAPI(api_token, proj_id)
-
-            # Initiate build
-            progress.update(task, description="Initiating build...", completed=10)
-            build_id = api.initiate_build()
-            console.print(f"[green]Build initiated: {build_id}[/green]")
-
-            # Wait for build
-            progress.update(task, description="Building...", completed=20)
-            api.check_build_status(build_id)
-            console.print("[green]Build completed[/green]")
-
-            # Download
-            progress.update(task, description="Downloading...", completed=50)
-            zip_path = api.download_build(build_id)
-            console.print(f"[green]Downloaded: {zip_path}[/green]")
-
-            # Extract
-            progress.update(task, description="Extracting...", completed=70)
-            extract_and_replace_files(zip_path, d_path)
-
-            # Process
-            progress.update(task, description="Processing...", completed=85)
-            processed = process_language_files(d_path, r_path)
-
-            progress.update(task, description="Complete!", completed=100)
-
-        console.print("\n[bold green]✅ Download complete![/bold green]")
-        console.print(f"Processed {len(processed)} languages: {', '.join(processed)}")
+    _configure_http2(http2 or p.http2)
+    cancel = CancelToken()
+
+    with _reported_run(
+        "download",
+        {"profile": p.name, "project": proj_id},
+        metrics_dir=metrics_dir or p.metrics_dir,
+        timings=timings or bool(timings_json),
+        timings_json=timings_json,
+        profiler_dir=profiler_dir,
+    ) as run:
+        try:
+            with (
+                _cancel_on_interrupt(cancel),
+                _progress() as progress,
+                _progress_bus(progress, "Downloading translations...", p.progress_rate) as bus,
+            ):
+                api = CrowdinAPI(api_token, proj_id, api_url=api_url)
+                processed = _download_with_progress(api, bus, d_path, r_path, cancel)
+
+            console.print("\n[bold green]✅ Download complete![/bold green]")
+            console.print(f"[dim]{get_transport().stats.summary()}[/dim]")
+            console.print(f"Processed {len(processed)} languages: {', '.join(processed)}")
+            run.succeeded = True
+
+        except CrowdinError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(1) from e
+
+        except OperationCancelled as e:
+            console.print("[yellow]Download cancelled; rerun to download again[/yellow]")
+            raise typer.Exit(EXIT_CANCELLED) from e
+
+
+def _download_with_progress(
+    api: CrowdinAPI, bus: ProgressBus, data_path: str, result_path: str, cancel: CancelToken
+) -> list[str]:
+    """
+    Build, download, extract and process the latest translations, reporting progress.
+
+    Returns:
+        Processed language codes
+    """
+    # Initiate build
+    bus.update("Initiating build...", 10)
+    build_id = api.initiate_build()
+    bus.log(f"[green]Build initiated: {build_id}[/green]")
+
+    # Wait for build
+    bus.update("Building...", 20)
+    api.check_build_status(build_id, cancel=cancel)
+    bus.log("[green]Build completed[/green]")
+
+    # Download
+    bus.update("Downloading...", 50)
+    zip_path = api.download_build(build_id, progress_callback=bus.scaled(50, 70), cancel=cancel)
+    bus.log(f"[green]Downloaded: {zip_path}[/green]")
+
+    # Extract
+    bus.update("Extracting...", 70)
+    extract_and_replace_files(zip_path, data_path, cancel=cancel)
+
+    # Process
+    bus.update("Processing...", 85)
+    processed = process_language_files(data_path, result_path, cancel=cancel)
+
+    bus.update("Complete!", 100)
+    return processed
+
+
+def _profile_names(value: str) -> list[str]:
+    """Profile names of a comma-separated list, without blanks and duplicates."""
+    return list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+
+
+def _configured_profiles() -> list[str]:
+    """Profiles with a project ID; the others (e.g. an unused default) are skipped."""
+    names = []
+    for name, p in get_config().profiles.items():
+        if p.project_id:
+            names.append(name)
+        else:
+            console.print(f"[dim]Skipping profile '{name}' (no project ID)[/dim]")
+    return names
+
+
+def _profile_jobs(names: list[str], token: str | None, crowdin_url: str | None) -> list[ProfileJob]:
+    """
+    Jobs of the named profiles; each profile's own token comes before the --token fallback.
+
+    Raises:
+        typer.Exit: If a profile is missing, has no token, or shares a directory with another
+    """
+    cfg = get_config()
+    jobs = []
+    for name in names:
+        if name not in cfg.profiles:
+            console.print(f"[red]Profile '{name}' not found[/red]")
+            raise typer.Exit(1)
+        p = cfg.profiles[name]
+        if not p.project_id:
+            console.print(f"[red]Error: Profile '{name}' has no project ID[/red]")
+            raise typer.Exit(1)
+        api_token = p.crowdin_token or token
+        if not api_token:
+            console.print(f"[red]Error: Crowdin API token not configured for '{name}'.[/red]")
+            console.print(f"Set it with: hermes config set-token --crowdin YOUR_TOKEN -p {name}")
+            raise typer.Exit(1)
+        jobs.append(
+            ProfileJob(
+                profile=name,
+                api_token=api_token,
+                project_id=p.project_id,
+                data_path=p.data_path,
+                result_path=p.result_path,
+                api_url=crowdin_url or p.crowdin_api_url or None,
+            )
+        )
+
+    shared = find_shared_paths(jobs)
+    for profile, other, path in shared:
+        console.print(f"[red]Profiles '{profile}' and '{other}' both write to {path}[/red]")
+    if shared:
+        raise typer.Exit(1)
+    return jobs
+
+
+def _sync_table(results: list[ProfileResult], elapsed: float) -> Table:
+    """Consolidated summary of a multi-profile download."""
+    table = Table(title=f"Profiles ({elapsed:.1f}s wall clock)")
+    table.add_column("Profile", style="cyan")
+    table.add_column("Project")
+    table.add_column("Status")
+    table.add_column("Languages", justify="right")
+    table.add_column("Time", justify="right")
+    for result in results:
+        if result.succeeded:
+            status = "[green]done[/green]"
+        elif result.cancelled:
+            status = "[yellow]cancelled[/yellow]"
+        else:
+            status = f"[red]failed: {escape(result.error)}[/red]"
+        table.add_row(
+            result.profile,
+            result.project_id or "-",
+            status,
+            str(len(result.languages)),
+            f"{result.seconds:.1f}s",
+        )
+    return table
+
+
+def _download_profiles(
+    names: list[str],
+    *,
+    token: str | None,
+    crowdin_url: str | None,
+    http2: bool,
+    max_parallel: int,
+    crowdin_rpm: int,
+    metrics_dir: str | None,
+    metrics_profile: str,
+) -> None:
+    """
+    Download several profiles concurrently and print a consolidated summary.
+
+    Raises:
+        typer.Exit: 1 if a profile failed, EXIT_CANCELLED if the run was cancelled
+    """
+    cfg = get_config()
+    if not names:
+        console.print("[red]No profiles to download[/red]")
+        raise typer.Exit(1)
+    jobs = _profile_jobs(names, token, crowdin_url)
+
+    _configure_http2(http2 or any(cfg.profiles[name].http2 for name in names))
+    get_metrics().reset()
+    started = time.perf_counter()
+    cancel = CancelToken()
+    governor = RateGovernor(requests_per_minute=crowdin_rpm)
+    rate = cfg.current_profile.progress_rate
+    console.print(
+        f"Downloading {len(jobs)} profiles, {max(1, max_parallel)} at a time"
+        + (f", {crowdin_rpm} Crowdin requests/min" if crowdin_rpm else "")
+    )
+
+    with _cancel_on_interrupt(cancel), _progress() as progress, ExitStack() as stack:
+        buses = {
+            job.profile: stack.enter_context(
+                _progress_bus(progress, f"{job.profile}: waiting", rate)
+            )
+            for job in jobs
+        }
+
+        def report(profile: str, status: str, percent: float) -> None:
+            buses[profile].update(f"{profile}: {status}", percent)
+
+        results = sync_profiles(jobs, max_parallel, governor, report, cancel)
+
+    elapsed = time.perf_counter() - started
+    console.print(_sync_table(results, elapsed))
+    console.print(f"[dim]{get_transport().stats.summary()}[/dim]")
+    if governor.stats.throttled:
+        console.print(
+            f"[dim]Rate limit: {governor.stats.throttled} requests waited "
+            f"{governor.stats.wait_seconds:.1f}s[/dim]"
+        )
+
+    succeeded = all(result.succeeded for result in results)
+    _report_metrics(
+        metrics_dir or cfg.current_profile.metrics_dir,
+        "download",
+        {"profile": metrics_profile},
+        started,
+        succeeded,
+    )
+    if cancel.cancelled:
+        console.print("[yellow]Download cancelled; rerun to download again[/yellow]")
+        raise typer.Exit(EXIT_CANCELLED)
+    if not succeeded:
+        raise typer.Exit(1)
 
+
+def _download_latest(
+    api_token: str,
+    project_id: str,
+    data_path: str,
+    result_path: str,
+    *,
+    api_url: str | None = None,
+    cancel: CancelToken | None = None,
+) -> None:
+    """Build, download, extract and process the latest translations."""
+    api = CrowdinAPI(api_token, project_id, api_url=api_url)
+    build_id = api.initiate_build()
+    api.check_build_status(build_id, cancel=cancel)
+    zip_path = api.download_build(build_id, cancel=cancel)
+    extract_and_replace_files(zip_path, data_path, cancel=cancel)
+    process_language_files(data_path, result_path, cancel=cancel)
+    console.print("[green]Downloaded latest translations[/green]")
+
+
+def _wait(wait_for_download: Callable[[], object] | None) -> None:
+    """Join a background download, re-raising its error."""
+    if wait_for_download:
+        wait_for_download()
+
+
+def _translate_and_upload(
+    upload_api: CrowdinUploadAPI,
+    bus: ProgressBus,
+    wait_for_download: Callable[[], object] | None,
+    *,
+    stream: bool,
+    resume: bool,
+) -> None:
+    """Translate the new keys with Gemini and add them, streamed or as pipelined stages."""
+    # Streaming: create keys first, post languages as Gemini finishes them
+    if stream:
+        bus.update("Streaming upload...", 50)
+        upload_api.run_streaming_upload(wait_for_download=wait_for_download)
+        return
+
+    # Translate, add keys and add translations as overlapping stages
+    bus.update("Translating and uploading...", 50)
+
+    def pipeline_progress(stage: str, done: int, total: int) -> None:
+        # Stages overlap, so only posted translations move the bar
+        if stage != STAGE_TRANSLATIONS or not total:
+            bus.update(f"Uploading ({stage} {done}/{total})...")
+            return
+        bus.update(f"Uploading ({stage} {done}/{total})...", 50 + 49 * done // total)
+
+    stats = upload_api.run_pipelined_upload(
+        pipeline_progress,
+        wait_for_download=wait_for_download,
+        resume=resume,
+    )
+    bus.log(
+        f"[green]Added {stats.keys_created} new keys and "
+        f"{stats.translations_posted} translations[/green]"
+    )
+
+
+@contextmanager
+def _exit_on_upload_error(cancel_hint: str) -> Iterator[None]:
+    """Report a failed or cancelled upload and exit with its code."""
+    try:
+        yield
     except CrowdinError as e:
+        console.print(f"[red]Crowdin API error: {e}[/red]")
+        raise typer.Exit(1) from e
+    except GeminiError as e:
+        console.print(f"[red]Gemini API error: {e}[/red]")
+        raise typer.Exit(1) from e
+    except UnfinishedJournalError as e:
         console.print(f"[red]Error: {e}[/red]")
-        raise typer.Exit(1)
+        console.print("Resume it with: hermes upload --resume")
+        raise typer.Exit(1) from e
+    except OperationCancelled as e:
+        console.print(f"[yellow]Upload cancelled{cancel_hint}[/yellow]")
+        raise typer.Exit(EXIT_CANCELLED) from e
 
 
 @app.command()
 def upload(
+    *,
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to use"),
     project_id: str | None = typer.Option(None, "--project-id", help="Override project ID"),
     data_path: str | None = typer.Option(None, "--data-path", help="Override data path"),
     key_path: str | None = typer.Option(None, "--keys", "-k", help="Path to keys file"),
     prompts_path: str | None = typer.Option(None, "--prompts", help="Path to prompts file"),
+    glossary_path: str | None = typer.Option(None, "--glossary", help="Path to glossary file"),
     token: str | None = typer.Option(
         None, "--token", "-t", help="Crowdin API token", envvar="CROWDIN_TOKEN"
     ),
@@ -121,18 +677,48 @@ def upload(
         False, "--no-download", help="Skip downloading latest translations"
     ),
     no_gemini: bool = typer.Option(False, "--no-gemini", help="Skip Gemini AI translation"),
+    stream: bool = typer.Option(
+        False, "--stream", help="Post each language as soon as Gemini streams it"
+    ),
+    resume: bool = typer.Option(
+        False, "--resume", help="Resume an interrupted upload, skipping completed work"
+    ),
+    refresh_metadata: bool = typer.Option(
+        False, "--refresh-metadata", help="Ignore cached Crowdin languages and file ids"
+    ),
+    http2: bool = typer.Option(False, "--http2", help="Send Crowdin API requests over HTTP/2"),
+    crowdin_url: str | None = typer.Option(
+        None,
+        "--crowdin-url",
+        help="Crowdin API root (e.g. a mock server)",
+        envvar="HERMES_CROWDIN_URL",
+    ),
+    gemini_url: str | None = typer.Option(
+        None,
+        "--gemini-url",
+        help="Gemini API root (e.g. a mock server)",
+        envvar="HERMES_GEMINI_URL",
+    ),
+    timings: bool = typer.Option(
+        False, "--timings", help="Print a breakdown of time per stage and per request"
+    ),
+    timings_json: str | None = typer.Option(
+        None, "--timings-json", help="Write the timing spans to this JSON file (implies --timings)"
+    ),
+    metrics_dir: str | None = typer.Option(
+        None,
+        "--metrics-dir",
+        help="Write run metrics (Prometheus textfile and JSON) to this directory",
+        envvar="HERMES_METRICS_DIR",
+    ),
+    profiler_dir: str | None = typer.Option(
+        None,
+        "--profiler",
+        help="Profile CPU and memory per stage; write a flame graph and allocations report here",
+    ),
 ):
     """Upload translations to Crowdin with optional Gemini AI translation."""
-    cfg = get_config()
-
-    # Select profile
-    if profile:
-        if profile not in cfg.profiles:
-            console.print(f"[red]Profile '{profile}' not found[/red]")
-            raise typer.Exit(1)
-        cfg.active_profile = profile
-
-    p = cfg.current_profile
+    p = _select_profile(profile)
 
     # Override with CLI options
     api_token = token or p.crowdin_token
@@ -141,40 +727,49 @@ def upload(
     d_path = data_path or p.data_path
     k_path = key_path or p.key_path
     pr_path = prompts_path or p.prompts_path
+    gl_path = glossary_path or p.glossary_path
+    api_url = crowdin_url or p.crowdin_api_url or None
 
     if not api_token:
         console.print("[red]Error: Crowdin API token not configured.[/red]")
         raise typer.Exit(1)
 
+    if refresh_metadata:
+        get_metadata_cache(proj_id, api_url).invalidate()
+
+    _configure_http2(http2 or p.http2)
+
+    if resume and stream:
+        console.print("[red]Error: --resume cannot be combined with --stream[/red]")
+        raise typer.Exit(1)
+
     if not no_gemini and not g_token:
         console.print(
             "[yellow]Warning: Gemini token not configured. Skipping AI translation.[/yellow]"
         )
         no_gemini = True
 
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Uploading translations...", total=100)
-
-            # Download first if not skipped
-            if not no_download:
-                progress.update(task, description="Downloading latest...", completed=10)
-                api = CrowdinAPI(api_token, proj_id)
-                build_id = api.initiate_build()
-                api.check_build_status(build_id)
-                zip_path = api.download_build(build_id)
-                extract_and_replace_files(zip_path, d_path)
-                process_language_files(d_path, p.result_path)
-                console.print("[green]Downloaded latest translations[/green]")
-
-            # Initialize upload API
-            progress.update(task, description="Initializing...", completed=30)
+    cancel = CancelToken()
+    hint = "" if stream or no_gemini else "; rerun with --resume to continue"
+    with (
+        _reported_run(
+            "upload",
+            {"profile": p.name, "project": proj_id},
+            metrics_dir=metrics_dir or p.metrics_dir,
+            timings=timings or bool(timings_json),
+            timings_json=timings_json,
+            profiler_dir=profiler_dir,
+        ) as run,
+        _exit_on_upload_error(hint),
+    ):
+        with (
+            _cancel_on_interrupt(cancel),
+            _progress() as progress,
+            _progress_bus(progress, "Uploading translations...", p.progress_rate) as bus,
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            # Initialize upload API (reads the data files before a download replaces them)
+            bus.update("Initializing...", 10)
             upload_api = CrowdinUploadAPI(
                 api_token=api_token,
                 project_id=proj_id,
@@ -182,33 +777,155 @@ def upload(
                 key_file_path=k_path,
                 prompt_file_path=pr_path,
                 data_path=d_path,
-                log_callback=lambda msg: console.print(f"[dim]{msg}[/dim]"),
+                glossary_file_path=gl_path,
+                log_callback=lambda msg: bus.log(f"[dim]{msg}[/dim]"),
+                rate_governor=RateGovernor(p.gemini_rpm, p.gemini_tpm),
+                fallback_model=p.gemini_fallback_model or None,
+                crowdin_api_url=api_url,
+                gemini_api_url=gemini_url or p.gemini_api_url or None,
+                cancel=cancel,
+                resource_file_path=p.crowdin_file_path,
             )
 
-            # Translate with Gemini
+            # Download in the background while Gemini translates; key creation waits for it
+            wait_for_download = None
+            if not no_download:
+                bus.update("Downloading latest...", 20)
+                if not no_gemini:
+                    upload_api.preload_glossary()
+                download = executor.submit(
+                    _download_latest,
+                    api_token,
+                    proj_id,
+                    d_path,
+                    p.result_path,
+                    api_url=api_url,
+                    cancel=cancel,
+                )
+                wait_for_download = download.result
+
             if not no_gemini:
-                progress.update(task, description="Translating with Gemini...", completed=50)
-                translations = upload_api.translate_missing_with_gemini()
-                if translations:
-                    console.print(f"[green]Translated {len(translations)} languages[/green]")
+                try:
+                    _translate_and_upload(
+                        upload_api, bus, wait_for_download, stream=stream, resume=resume
+                    )
+                except BaseException:
+                    # Stop the background download, or leaving the executor waits for it
+                    cancel.cancel("Upload failed")
+                    raise
+
+            _wait(wait_for_download)
+            bus.update("Complete!", 100)
 
-            # Add keys
-            progress.update(task, description="Adding keys...", completed=70)
-            added = upload_api.add_keys()
-            console.print(f"[green]Added {len(added)} new keys[/green]")
+        console.print("\n[bold green]✅ Upload complete![/bold green]")
+        console.print(f"[dim]{get_transport().stats.summary()}[/dim]")
+        run.succeeded = True
 
-            # Add translations
-            progress.update(task, description="Adding translations...", completed=85)
-            upload_api.add_translations()
 
-            progress.update(task, description="Complete!", completed=100)
+BENCH_SCENARIO_HELP = "Comma-separated scenarios to run (default: all)"
 
-        console.print("\n[bold green]✅ Upload complete![/bold green]")
 
-    except CrowdinError as e:
-        console.print(f"[red]Error: {e}[/red]")
+def _baseline_change(result: ScenarioResult, baseline: BenchRun | None) -> str:
+    """p95 change against the baseline, e.g. "+12%"."""
+    reference = baseline.result(result.name) if baseline else None
+    if reference is None or not reference.p95_seconds:
+        return "-"
+    return f"{result.p95_seconds / reference.p95_seconds - 1:+.0%}"
+
+
+def _bench_table(results: list[ScenarioResult], baseline: BenchRun | None) -> Table:
+    """Render benchmark results as a table."""
+    table = Table(title="Benchmarks")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Runs", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("Throughput", justify="right")
+    table.add_column("Peak memory", justify="right")
+    table.add_column("p95 vs baseline", justify="right")
+    for result in results:
+        table.add_row(
+            result.name,
+            str(result.runs),
+            f"{result.p50_seconds * 1000:.1f} ms",
+            f"{result.p95_seconds * 1000:.1f} ms",
+            f"{result.throughput:,.0f} {result.unit}/s",
+            format_bytes(result.peak_memory_bytes),
+            _baseline_change(result, baseline),
+        )
+    return table
+
+
+@app.command()
+def bench(
+    *,
+    scenario: str | None = typer.Option(None, "--scenario", "-s", help=BENCH_SCENARIO_HELP),
+    repeat: int = typer.Option(BenchOptions.repeat, "--repeat", "-n", help="Timed runs"),
+    keys: int = typer.Option(
+        BenchOptions.process_keys, "--keys", help="Keys per resource file for process-files"
+    ),
+    download_keys: int = typer.Option(
+        BenchOptions.download_keys, "--download-keys", help="Keys in the download-extract zip"
+    ),
+    upload_keys: int = typer.Option(
+        BenchOptions.upload_keys, "--upload-keys", help="Keys uploaded by the upload scenario"
+    ),
+    languages: int = typer.Option(
+        BenchOptions.languages, "--languages", help="Languages of the mock project"
+    ),
+    latency_ms: float = typer.Option(0.0, "--latency-ms", help="Mock server latency per request"),
+    baseline: bool = typer.Option(
+        False, "--save-baseline", help="Save this run as the baseline for later comparisons"
+    ),
+    threshold: float = typer.Option(
+        DEFAULT_REGRESSION_THRESHOLD,
+        "--threshold",
+        help="Relative slowdown or memory growth reported as a regression",
+    ),
+):
+    """Run benchmark scenarios against a local mock server and compare with the baseline."""
+    # The suite pulls in the mock server and every API client; only bench needs them
+    from hermes.bench.suite import SCENARIOS, run_suite  # noqa: PLC0415 - deferred for startup time
+
+    names = [name.strip() for name in scenario.split(",")] if scenario else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        console.print(f"[red]Unknown scenario: {', '.join(unknown)}[/red]")
+        console.print(f"Available: {', '.join(SCENARIOS)}")
         raise typer.Exit(1)
 
+    options = BenchOptions(
+        repeat=repeat,
+        process_keys=keys,
+        download_keys=download_keys,
+        upload_keys=upload_keys,
+        languages=languages,
+        latency_ms=latency_ms,
+    )
+    results = run_suite(
+        names,
+        options,
+        on_result=lambda result: console.print(f"[dim]Finished {result.name}[/dim]"),
+    )
+    run = BenchRun.create(results, options)
+    reference = load_baseline()
+    console.print(_bench_table(results, reference))
+    console.print(f"[dim]Results appended to {append_history(run)}[/dim]")
+
+    if baseline:
+        console.print(f"[green]Baseline saved: {save_baseline(run)}[/green]")
+        return
+    if reference is None:
+        console.print("[dim]No baseline yet; save one with --save-baseline[/dim]")
+        return
+
+    regressions = find_regressions(run, reference, threshold)
+    for regression in regressions:
+        console.print(f"[red]Regression: {regression.describe()}[/red]")
+    if regressions:
+        raise typer.Exit(1)
+    console.print("[green]No regressions against the baseline[/green]")
+
 
 @config_app.command("show")
 def config_show():
@@ -326,12 +1043,46 @@ def config_set_token(
 
 @config_app.command("set")
 def config_set(
+    *,
     profile: str | None = typer.Option(None, "--profile", "-p", help="Profile to update"),
     project_id: str | None = typer.Option(None, "--project-id", help="Project ID"),
     data_path: str | None = typer.Option(None, "--data-path", help="Data path"),
     result_path: str | None = typer.Option(None, "--result-path", help="Result path"),
     key_path: str | None = typer.Option(None, "--key-path", help="Keys file path"),
     prompts_path: str | None = typer.Option(None, "--prompts-path", help="Prompts file path"),
+    glossary_path: str | None = typer.Option(None, "--glossary-path", help="Glossary file path"),
+    crowdin_file_path: str | None = typer.Option(
+        None,
+        "--crowdin-file-path",
+        help="Crowdin file new keys are added to, with branch and folders (e.g. /CommonResource.json)",
+    ),
+    gemini_rpm: int | None = typer.Option(
+        None, "--gemini-rpm", help="Gemini requests per minute budget (0 = unlimited)"
+    ),
+    gemini_tpm: int | None = typer.Option(
+        None, "--gemini-tpm", help="Gemini tokens per minute budget (0 = unlimited)"
+    ),
+    gemini_fallback_model: str | None = typer.Option(
+        None, "--gemini-fallback-model", help="Cheaper Gemini model for short keys"
+    ),
+    http2: bool | None = typer.Option(
+        None, "--http2/--no-http2", help="Send Crowdin API requests over HTTP/2"
+    ),
+    crowdin_url: str | None = typer.Option(
+        None, "--crowdin-url", help="Crowdin API root (empty = api.crowdin.com)"
+    ),
+    gemini_url: str | None = typer.Option(
+        None, "--gemini-url", help="Gemini API root (empty = Google)"
+    ),
+    metrics_dir: str | None = typer.Option(
+        None, "--metrics-dir", help="Directory for run metrics files (empty = none)"
+    ),
+    progress_rate: float | None = typer.Option(
+        None, "--progress-rate", help="Progress updates per second shown (0 = every update)"
+    ),
+    log_max_lines: int | None = typer.Option(
+        None, "--log-max-lines", help="TUI log lines kept in memory (older ones go to logs/)"
+    ),
 ):
     """Set configuration values for a profile."""
     cfg = get_config()
@@ -343,27 +1094,29 @@ def config_set(
         cfg.active_profile = profile
 
     p = cfg.current_profile
-    updated = []
-
-    if project_id:
-        p.project_id = project_id
-        updated.append("project_id")
-
-    if data_path:
-        p.data_path = data_path
-        updated.append("data_path")
-
-    if result_path:
-        p.result_path = result_path
-        updated.append("result_path")
-
-    if key_path:
-        p.key_path = key_path
-        updated.append("key_path")
 
-    if prompts_path:
-        p.prompts_path = prompts_path
-        updated.append("prompts_path")
+    # Empty paths are ignored; the other options accept empty values (e.g. "" clears a URL)
+    values = {
+        "project_id": project_id or None,
+        "data_path": data_path or None,
+        "result_path": result_path or None,
+        "key_path": key_path or None,
+        "prompts_path": prompts_path or None,
+        "glossary_path": glossary_path or None,
+        "crowdin_file_path": crowdin_file_path or None,
+        "gemini_rpm": gemini_rpm,
+        "gemini_tpm": gemini_tpm,
+        "gemini_fallback_model": gemini_fallback_model,
+        "http2": http2,
+        "crowdin_api_url": crowdin_url,
+        "gemini_api_url": gemini_url,
+        "metrics_dir": metrics_dir,
+        "progress_rate": progress_rate,
+        "log_max_lines": log_max_lines,
+    }
+    updated = [name for name, value in values.items() if value is not None]
+    for name in updated:
+        setattr(p, name, values[name])
 
     if updated:
         cfg.save()
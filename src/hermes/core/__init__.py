@@ -1,15 +1,44 @@
-"""Core business logic for Hermes."""
+"""Core business logic for Hermes.
 
-from .config import Config, Profile
-from .crowdin_api import CrowdinAPI
-from .crowdin_upload_api import CrowdinUploadAPI
-from .file_operations import extract_and_replace_files, process_language_files
+The exports are resolved on first access, so importing one core module does
+not load every client (and the Gemini SDK) with it.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cancellation import CancelToken, OperationCancelled
+    from .config import Config, Profile
+    from .crowdin_api import CrowdinAPI
+    from .crowdin_upload_api import CrowdinUploadAPI
+    from .file_operations import extract_and_replace_files, process_language_files
+
+# Export name -> module that defines it
+_EXPORTS = {
+    "CancelToken": ".cancellation",
+    "Config": ".config",
+    "CrowdinAPI": ".crowdin_api",
+    "CrowdinUploadAPI": ".crowdin_upload_api",
+    "OperationCancelled": ".cancellation",
+    "Profile": ".config",
+    "extract_and_replace_files": ".file_operations",
+    "process_language_files": ".file_operations",
+}
 
 __all__ = [
+    "CancelToken",
     "Config",
     "CrowdinAPI",
     "CrowdinUploadAPI",
+    "OperationCancelled",
     "Profile",
     "extract_and_replace_files",
     "process_language_files",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
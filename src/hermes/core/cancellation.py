@@ -0,0 +1,69 @@
+"""Cooperative cancellation of long-running operations.
+
+A CancelToken is created per operation and handed to the code doing the work,
+which checks it between steps (a build poll, a downloaded chunk, an extracted
+file, a translation batch, a posted string) and raises OperationCancelled.
+Waits (build polling, rate limiting, backoff) sleep on the token, so a cancel
+wakes them at once. A request that is already in flight is allowed to finish,
+which bounds the time to stop by one request timeout.
+"""
+
+import asyncio
+import threading
+
+# Interval at which async waits check the token
+ASYNC_POLL_SECONDS = 0.1
+
+
+class OperationCancelled(Exception):
+    """Raised by an operation whose CancelToken was cancelled."""
+
+
+class CancelToken:
+    """Thread-safe cancellation flag shared by an operation and its caller."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Cancelled") -> None:
+        """Request cancellation; the first reason is kept."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            OperationCancelled: If cancellation was requested
+        """
+        if self._event.is_set():
+            raise OperationCancelled(self.reason)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleep for seconds, waking up as soon as the token is cancelled.
+
+        Raises:
+            OperationCancelled: If cancellation was requested
+        """
+        self._event.wait(max(0.0, seconds))
+        self.raise_if_cancelled()
+
+    async def sleep_async(self, seconds: float) -> None:
+        """
+        Sleep for seconds without blocking the event loop, waking up on cancel.
+
+        Raises:
+            OperationCancelled: If cancellation was requested
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + seconds
+        while (remaining := deadline - loop.time()) > 0:
+            self.raise_if_cancelled()
+            await asyncio.sleep(min(remaining, ASYNC_POLL_SECONDS))
+        self.raise_if_cancelled()
@@ -8,6 +8,9 @@ from pathlib import Path
 
 APP_NAME = "hermes"
 
+# Progress batches per second delivered to the CLI/TUI
+DEFAULT_MAX_RATE = 10.0
+
 
 def get_app_dir() -> Path:
     """
@@ -62,6 +65,31 @@ class Profile:
     result_path: str = "i18n/default/"
     key_path: str = "keys.txt"
     prompts_path: str = "prompts.txt"
+    glossary_path: str = "glossary.txt"
+
+    # Full Crowdin path (branch and folders included) of the file new keys are added to
+    crowdin_file_path: str = "/CommonResource.json"
+
+    # Gemini rate budgets (0 = unlimited) and optional cheaper model for short keys
+    gemini_rpm: int = 0
+    gemini_tpm: int = 0
+    gemini_fallback_model: str = ""
+
+    # Send Crowdin API requests over HTTP/2 (needs the optional http2 extra)
+    http2: bool = False
+
+    # API roots, e.g. the bench mock server (empty = the real services)
+    crowdin_api_url: str = ""
+    gemini_api_url: str = ""
+
+    # Directory the CLI writes run metrics to (empty = no metrics files)
+    metrics_dir: str = ""
+
+    # Progress batches per second delivered to the CLI/TUI (0 = every update)
+    progress_rate: float = DEFAULT_MAX_RATE
+
+    # Operation log lines the TUI keeps in memory; older lines are saved under logs/
+    log_max_lines: int = 10_000
 
     # Tokens stored directly in profile (obfuscated in JSON)
     _crowdin_token: str = field(default="", repr=False)
@@ -96,6 +124,17 @@ class Profile:
             "result_path": self.result_path,
             "key_path": self.key_path,
             "prompts_path": self.prompts_path,
+            "glossary_path": self.glossary_path,
+            "crowdin_file_path": self.crowdin_file_path,
+            "gemini_rpm": self.gemini_rpm,
+            "gemini_tpm": self.gemini_tpm,
+            "gemini_fallback_model": self.gemini_fallback_model,
+            "http2": self.http2,
+            "crowdin_api_url": self.crowdin_api_url,
+            "gemini_api_url": self.gemini_api_url,
+            "metrics_dir": self.metrics_dir,
+            "progress_rate": self.progress_rate,
+            "log_max_lines": self.log_max_lines,
             # Tokens are obfuscated (base64) - not encrypted, just not plaintext
             "crowdin_token": _encode_token(self._crowdin_token),
             "gemini_token": _encode_token(self._gemini_token),
@@ -111,6 +150,17 @@ class Profile:
             result_path=data.get("result_path", "i18n/default/"),
             key_path=data.get("key_path", "keys.txt"),
             prompts_path=data.get("prompts_path", "prompts.txt"),
+            glossary_path=data.get("glossary_path", "glossary.txt"),
+            crowdin_file_path=data.get("crowdin_file_path", "/CommonResource.json"),
+            gemini_rpm=data.get("gemini_rpm", 0),
+            gemini_tpm=data.get("gemini_tpm", 0),
+            gemini_fallback_model=data.get("gemini_fallback_model", ""),
+            http2=data.get("http2", False),
+            crowdin_api_url=data.get("crowdin_api_url", ""),
+            gemini_api_url=data.get("gemini_api_url", ""),
+            metrics_dir=data.get("metrics_dir", ""),
+            progress_rate=data.get("progress_rate", DEFAULT_MAX_RATE),
+            log_max_lines=data.get("log_max_lines", 10_000),
         )
         # Decode obfuscated tokens
         profile._crowdin_token = _decode_token(data.get("crowdin_token", ""))
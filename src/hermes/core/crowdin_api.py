@@ -3,8 +3,31 @@
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
 
-import requests
+from .cancellation import CancelToken, OperationCancelled
+from .crowdin_transport import REQUEST_TIMEOUT_SECONDS, CrowdinTransport, get_transport
+from .metadata_cache import MetadataCache, get_metadata_cache
+from .metrics import (
+    SERVICE_CROWDIN,
+    STAGE_BUILD,
+    STAGE_DOWNLOAD,
+    get_metrics,
+    metered,
+)
+from .rate_limit import RateGovernor
+from .timing import CATEGORY_HTTP, get_timings, timed
+
+# Crowdin API v2 root; a profile can point it elsewhere (e.g. the bench mock server)
+CROWDIN_API_URL = "https://api.crowdin.com/api/v2"
+
+# Resource file of each language, and the project path of the file new keys are added to
+RESOURCE_FILE_NAME = "CommonResource.json"
+RESOURCE_FILE_PATH = f"/{RESOURCE_FILE_NAME}"
+
+# Largest page size the Crowdin list endpoints accept
+MAX_PAGE_SIZE = 500
 
 
 @dataclass
@@ -22,18 +45,190 @@ class CrowdinError(Exception):
     pass
 
 
+def project_url(project_id: str, api_url: str | None = None) -> str:
+    """Base URL of a project's endpoints, under api_url or the real Crowdin API."""
+    return f"{(api_url or CROWDIN_API_URL).rstrip('/')}/projects/{project_id}"
+
+
+def _save_stream(
+    response: Any,
+    save_path: str,
+    progress_callback: Callable[[int], None] | None,
+    cancel: CancelToken,
+) -> int:
+    """
+    Write a streamed requests response to save_path.
+
+    Returns:
+        Bytes written
+
+    Raises:
+        OperationCancelled: If cancel was cancelled (the partial file is removed)
+    """
+    total_size = int(response.headers.get("content-length", 0))
+    downloaded = 0
+    metrics = get_metrics()
+    try:
+        with Path(save_path).open("wb") as file:
+            for chunk in response.iter_content(chunk_size=8192):
+                cancel.raise_if_cancelled()
+                if chunk:
+                    file.write(chunk)
+                    downloaded += len(chunk)
+                    metrics.inc("hermes_download_bytes_total", len(chunk))
+                    metrics.stage_progress(STAGE_DOWNLOAD, downloaded, total_size)
+                    if progress_callback and total_size > 0:
+                        progress_callback(int(downloaded * 100 / total_size))
+    except OperationCancelled:
+        response.close()
+        Path(save_path).unlink()
+        raise
+    return downloaded
+
+
+def _parse_languages(payload: dict) -> dict[str, str]:
+    """Map locale to language ID from a /languages/progress response."""
+    languages = {}
+    for item in payload.get("data", []):
+        locale = item["data"]["language"]["locale"]
+        lang_id = item["data"]["languageId"]
+        languages[locale] = lang_id
+    return languages
+
+
+def _parse_files(payload: dict) -> dict[str, int]:
+    """Map file path to file ID from a /files response."""
+    return {item["data"]["path"]: item["data"]["id"] for item in payload.get("data", [])}
+
+
+def find_file_id(files: dict[str, int], file_path: str = RESOURCE_FILE_PATH) -> int:
+    """
+    Find a source file by its full path in the project, e.g. "/main/CommonResource.json".
+
+    Args:
+        files: File path to file ID, as returned by get_files
+        file_path: Path of the file, including its branch and folders
+
+    Returns:
+        ID of the file
+
+    Raises:
+        CrowdinError: If no file has this path (the error lists files with the same name)
+    """
+    wanted = "/" + file_path.strip("/")
+    if wanted in files:
+        return files[wanted]
+    name = wanted.rsplit("/", 1)[-1]
+    same_name = sorted(path for path in files if path.rsplit("/", 1)[-1] == name)
+    hint = f"; files with this name: {', '.join(same_name)}" if same_name else ""
+    raise CrowdinError(f"Source file {wanted} not found in the project{hint}")
+
+
+def _parse_project(payload: dict) -> dict[str, Any]:
+    """Keep the stable project fields from a project response."""
+    data = payload.get("data", {})
+    return {
+        "id": data.get("id"),
+        "name": data.get("name"),
+        "sourceLanguageId": data.get("sourceLanguageId"),
+        "targetLanguageIds": data.get("targetLanguageIds", []),
+    }
+
+
 class CrowdinAPI:
     """Crowdin API client for downloading translations."""
 
-    def __init__(self, api_token: str, project_id: str):
+    def __init__(
+        self,
+        api_token: str,
+        project_id: str,
+        *,
+        metadata_cache: MetadataCache | None = None,
+        transport: CrowdinTransport | None = None,
+        api_url: str | None = None,
+        rate_governor: RateGovernor | None = None,
+    ):
         self.api_token = api_token
         self.project_id = project_id
-        self.base_url = f"https://api.crowdin.com/api/v2/projects/{self.project_id}"
+        self.base_url = project_url(project_id, api_url)
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Content-Type": "application/json",
         }
+        self.metadata = metadata_cache or get_metadata_cache(project_id, api_url)
+        self.transport = transport or get_transport()
+        # Shared by clients of several projects to keep their combined request rate in budget
+        self.governor = rate_governor
+
+    def _throttle(self, cancel: CancelToken | None = None) -> None:
+        """Wait for the rate governor, if any, before sending a request."""
+        if self.governor is not None:
+            self.governor.acquire(cancel=cancel)
+
+    def _get_metadata(
+        self, name: str, path: str, parse: Callable[[dict], Any], *, paged: bool = False
+    ) -> Any:
+        """
+        Get project metadata through the metadata cache.
+
+        A fresh cached value is returned without a request; a stale one is
+        revalidated with its ETag. A paged list is read MAX_PAGE_SIZE items at
+        a time until a short page; only a single-page list keeps its ETag, since
+        the ETag of the first page says nothing about the others.
 
+        Raises:
+            CrowdinError: If a request fails
+        """
+        cached = self.metadata.fresh(name)
+        if cached is not None:
+            return cached
+
+        headers = dict(self.headers)
+        etag = self.metadata.etag(name)
+        if etag:
+            headers["If-None-Match"] = etag
+        self._throttle()
+        query = f"?limit={MAX_PAGE_SIZE}&offset=0" if paged else ""
+        response = self.transport.get(f"{self.base_url}{path}{query}", headers, use_cache=False)
+
+        if response.status_code == 304:
+            return self.metadata.revalidated(name)
+        if response.status_code != 200:
+            raise CrowdinError(f"Failed to get {name}: {response.status_code} - {response.text}")
+
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if paged:
+            items = payload.get("data", [])
+            page = items
+            while len(page) == MAX_PAGE_SIZE:
+                etag = None
+                page = self._get_page(name, path, offset=len(items))
+                items = items + page
+            payload = {"data": items}
+
+        value = parse(payload)
+        self.metadata.store(name, value, etag)
+        return value
+
+    def _get_page(self, name: str, path: str, offset: int) -> list[dict]:
+        """
+        Get one MAX_PAGE_SIZE page of a list endpoint.
+
+        Raises:
+            CrowdinError: If the request fails
+        """
+        self._throttle()
+        response = self.transport.get(
+            f"{self.base_url}{path}?limit={MAX_PAGE_SIZE}&offset={offset}",
+            self.headers,
+            use_cache=False,
+        )
+        if response.status_code != 200:
+            raise CrowdinError(f"Failed to get {name}: {response.status_code} - {response.text}")
+        return response.json().get("data", [])
+
+    @timed("initiate build")
     def initiate_build(self) -> int:
         """
         Initiate a translation build.
@@ -45,7 +240,8 @@ class CrowdinAPI:
             CrowdinError: If build initiation fails
         """
         url = f"{self.base_url}/translations/builds"
-        response = requests.post(url, headers=self.headers)
+        self._throttle()
+        response = self.transport.post(url, self.headers)
 
         if response.status_code == 201:
             build_id = response.json()["data"]["id"]
@@ -55,11 +251,14 @@ class CrowdinAPI:
                 f"Failed to initiate build: {response.status_code} - {response.text}"
             )
 
+    @timed("wait for build")
+    @metered("hermes_build_wait_seconds_total")
     def check_build_status(
         self,
         build_id: int,
         progress_callback: Callable[[BuildProgress], None] | None = None,
         poll_interval: float = 2.0,
+        cancel: CancelToken | None = None,
     ) -> bool:
         """
         Check and wait for build to complete.
@@ -68,22 +267,28 @@ class CrowdinAPI:
             build_id: The build ID to check
             progress_callback: Optional callback for progress updates
             poll_interval: Seconds between status checks
+            cancel: Optional token; stops polling (the build keeps running on Crowdin)
 
         Returns:
             True if build completed successfully
 
         Raises:
             CrowdinError: If build fails
+            OperationCancelled: If cancel was cancelled
         """
         url = f"{self.base_url}/translations/builds/{build_id}"
+        cancel = cancel or CancelToken()
 
         while True:
-            response = requests.get(url, headers=self.headers)
+            cancel.raise_if_cancelled()
+            self._throttle(cancel)
+            response = self.transport.get(url, self.headers)
 
             if response.status_code == 200:
                 data = response.json()["data"]
                 status = data["status"]
                 progress = data.get("progress", 0)
+                get_metrics().stage_progress(STAGE_BUILD, progress, 100)
 
                 if progress_callback:
                     progress_callback(
@@ -97,7 +302,7 @@ class CrowdinAPI:
                 if status == "finished":
                     return True
                 elif status == "inProgress":
-                    time.sleep(poll_interval)
+                    cancel.sleep(poll_interval)
                 else:
                     raise CrowdinError(f"Build failed with status: {status}")
             else:
@@ -105,11 +310,13 @@ class CrowdinAPI:
                     f"Failed to check build status: {response.status_code} - {response.text}"
                 )
 
+    @timed("download build")
     def download_build(
         self,
         build_id: int,
         save_path: str = "translations.zip",
         progress_callback: Callable[[int], None] | None = None,
+        cancel: CancelToken | None = None,
     ) -> str:
         """
         Download the completed build.
@@ -118,31 +325,44 @@ class CrowdinAPI:
             build_id: The build ID to download
             save_path: Path to save the ZIP file
             progress_callback: Optional callback for download progress (0-100)
+            cancel: Optional token, checked after each chunk
 
         Returns:
             Path to the downloaded file
 
         Raises:
             CrowdinError: If download fails
+            OperationCancelled: If cancel was cancelled (the partial file is removed)
         """
         url = f"{self.base_url}/translations/builds/{build_id}/download"
-        response = requests.get(url, headers=self.headers)
+        self._throttle(cancel)
+        response = self.transport.get(url, self.headers, use_cache=False)
 
         if response.status_code == 200:
             download_url = response.json()["data"]["url"]
 
-            # Download with progress tracking
-            download_response = requests.get(download_url, stream=True)
-            total_size = int(download_response.headers.get("content-length", 0))
+            # Download with progress tracking (requests is only needed here)
+            import requests  # noqa: PLC0415 - deferred for startup time
 
-            with open(save_path, "wb") as file:
-                downloaded = 0
-                for chunk in download_response.iter_content(chunk_size=8192):
-                    if chunk:
-                        file.write(chunk)
-                        downloaded += len(chunk)
-                        if progress_callback and total_size > 0:
-                            progress_callback(int(downloaded * 100 / total_size))
+            start = time.perf_counter()
+            with (
+                get_timings().span("GET build archive", CATEGORY_HTTP) as attrs,
+                get_metrics().in_flight(SERVICE_CROWDIN),
+            ):
+                download_response = requests.get(
+                    download_url, stream=True, timeout=REQUEST_TIMEOUT_SECONDS
+                )
+                downloaded = _save_stream(
+                    download_response, save_path, progress_callback, cancel or CancelToken()
+                )
+                attrs["status"] = download_response.status_code
+                attrs["bytes"] = downloaded
+            get_metrics().observe_request(
+                SERVICE_CROWDIN,
+                "GET build archive",
+                download_response.status_code,
+                time.perf_counter() - start,
+            )
 
             return save_path
         else:
@@ -157,15 +377,37 @@ class CrowdinAPI:
         Returns:
             Dict mapping locale to language ID
         """
-        url = f"{self.base_url}/languages/progress"
-        response = requests.get(url, headers=self.headers)
+        return self._get_metadata("languages", "/languages/progress", _parse_languages)
 
-        if response.status_code == 200:
-            languages = {}
-            for item in response.json().get("data", []):
-                locale = item["data"]["language"]["locale"]
-                lang_id = item["data"]["languageId"]
-                languages[locale] = lang_id
-            return languages
-        else:
-            raise CrowdinError(f"Failed to get languages: {response.status_code} - {response.text}")
+    def get_files(self) -> dict[str, int]:
+        """
+        Get the source files of the project.
+
+        Returns:
+            Dict mapping file path to file ID
+        """
+        return self._get_metadata("files", "/files", _parse_files, paged=True)
+
+    def get_file_id(self, file_path: str = RESOURCE_FILE_PATH) -> int:
+        """
+        Get the ID of the source file new keys are added to.
+
+        Args:
+            file_path: Full path of the file in the project (see find_file_id)
+
+        Returns:
+            File ID
+
+        Raises:
+            CrowdinError: If the project has no file with this path
+        """
+        return find_file_id(self.get_files(), file_path)
+
+    def get_project_info(self) -> dict[str, Any]:
+        """
+        Get project information (name, source and target languages).
+
+        Returns:
+            Dict of project fields
+        """
+        return self._get_metadata("project", "", _parse_project)
@@ -0,0 +1,457 @@
+"""Asyncio Crowdin client for high-fanout operations.
+
+Mirrors the download operations of CrowdinAPI and the string and translation
+operations of CrowdinUploadAPI. Every request takes a slot of a bounded
+semaphore, so thousands of small requests are multiplexed on one event loop
+without flooding Crowdin, and is recorded as a timing span and in the run
+metrics, like the requests of the shared transport. Project metadata goes
+through the shared metadata cache; the response cache is not used, since
+build status and download link responses change on every request.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
+
+import httpx
+
+from .cancellation import CancelToken, OperationCancelled
+from .crowdin_api import (
+    MAX_PAGE_SIZE,
+    RESOURCE_FILE_PATH,
+    BuildProgress,
+    CrowdinError,
+    _parse_files,
+    _parse_languages,
+    find_file_id,
+    project_url,
+)
+from .crowdin_transport import endpoint_name, require_http2
+from .metadata_cache import MetadataCache, get_metadata_cache
+from .metrics import SERVICE_CROWDIN, STAGE_BUILD, STAGE_DOWNLOAD, get_metrics
+from .timing import CATEGORY_HTTP, get_timings
+
+T = TypeVar("T")
+
+# Requests in flight at once, per client
+DEFAULT_MAX_CONCURRENCY = 16
+
+REQUEST_TIMEOUT_SECONDS = 60.0
+DOWNLOAD_CHUNK_SIZE = 8192
+
+
+async def _save_stream(
+    response: httpx.Response,
+    save_path: str,
+    progress_callback: Callable[[int], None] | None,
+    cancel: CancelToken,
+) -> int:
+    """
+    Write a streamed response to save_path.
+
+    Returns:
+        Bytes written
+
+    Raises:
+        OperationCancelled: If cancel was cancelled (the partial file is removed)
+    """
+    total_size = int(response.headers.get("content-length", 0))
+    downloaded = 0
+    metrics = get_metrics()
+    try:
+        with Path(save_path).open("wb") as file:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                cancel.raise_if_cancelled()
+                file.write(chunk)
+                downloaded += len(chunk)
+                metrics.inc("hermes_download_bytes_total", len(chunk))
+                metrics.stage_progress(STAGE_DOWNLOAD, downloaded, total_size)
+                if progress_callback and total_size > 0:
+                    progress_callback(int(downloaded * 100 / total_size))
+    except OperationCancelled:
+        Path(save_path).unlink()
+        raise
+    return downloaded
+
+
+async def gather_settled(aws: Iterable[Awaitable[T]]) -> list[T]:
+    """
+    Run awaitables concurrently and wait for all of them, then re-raise the first error.
+
+    Unlike asyncio.gather, no request is abandoned mid-flight when another
+    fails, so a created key or posted translation is never left unrecorded;
+    requests not yet sent are stopped with a cancel token instead. An error
+    other than OperationCancelled is preferred, as it is the cause.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        causes = [error for error in errors if not isinstance(error, OperationCancelled)]
+        raise (causes or errors)[0]
+    return results
+
+
+class AsyncCrowdinAPI:
+    """
+    Async Crowdin API client.
+
+    Use as an async context manager (or call aclose()) so the connection
+    pool is released. With http2=True (optional ``http2`` extra) concurrent
+    requests are multiplexed on one connection.
+    """
+
+    def __init__(
+        self,
+        api_token: str,
+        project_id: str,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        metadata_cache: MetadataCache | None = None,
+        client: httpx.AsyncClient | None = None,
+        http2: bool = False,
+        api_url: str | None = None,
+    ):
+        self.api_token = api_token
+        self.project_id = project_id
+        self.base_url = project_url(project_id, api_url)
+        self.headers = {
+            "Authorization": f"Bearer {self.api_token}",
+            "Content-Type": "application/json",
+        }
+        self.metadata = metadata_cache or get_metadata_cache(project_id, api_url)
+        if http2 and client is None:
+            require_http2()
+        # Headers are sent per request: the signed build download URL must not get them
+        self.client = client or httpx.AsyncClient(
+            http2=http2,
+            timeout=REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=max_concurrency),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> "AsyncCrowdinAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.client.aclose()
+
+    async def _request(
+        self, method: str, path: str, *, cancel: CancelToken | None = None, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send an API request once a concurrency slot is free.
+
+        The request is recorded as a timing span and in the run metrics.
+
+        Raises:
+            OperationCancelled: If cancel was cancelled while waiting for the slot
+        """
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        url = f"{self.base_url}{path}"
+        endpoint = endpoint_name(method, url)
+        metrics = get_metrics()
+        async with self._semaphore:
+            if cancel:
+                cancel.raise_if_cancelled()
+            start = time.perf_counter()
+            with (
+                get_timings().span(endpoint, CATEGORY_HTTP) as attrs,
+                metrics.in_flight(SERVICE_CROWDIN),
+            ):
+                response = await self.client.request(method, url, headers=headers, **kwargs)
+                attrs["status"] = response.status_code
+        metrics.observe_request(
+            SERVICE_CROWDIN, endpoint, response.status_code, time.perf_counter() - start
+        )
+        return response
+
+    async def _get_metadata(
+        self, name: str, path: str, parse: Callable[[dict], Any], *, paged: bool = False
+    ) -> Any:
+        """Get project metadata through the shared metadata cache (see CrowdinAPI)."""
+        cached = self.metadata.fresh(name)
+        if cached is not None:
+            return cached
+
+        etag = self.metadata.etag(name)
+        headers = {"If-None-Match": etag} if etag else {}
+        params = {"limit": MAX_PAGE_SIZE, "offset": 0} if paged else None
+        response = await self._request("GET", path, headers=headers, params=params)
+
+        if response.status_code == 304:
+            return self.metadata.revalidated(name)
+        if response.status_code != 200:
+            raise CrowdinError(f"Failed to get {name}: {response.status_code} - {response.text}")
+
+        payload = response.json()
+        etag = response.headers.get("ETag")
+        if paged:
+            items = payload.get("data", [])
+            page = items
+            while len(page) == MAX_PAGE_SIZE:
+                etag = None
+                page = await self._get_page(name, path, offset=len(items))
+                items = items + page
+            payload = {"data": items}
+
+        value = parse(payload)
+        self.metadata.store(name, value, etag)
+        return value
+
+    async def _get_page(self, name: str, path: str, offset: int) -> list[dict]:
+        """Get one MAX_PAGE_SIZE page of a list endpoint."""
+        response = await self._request(
+            "GET", path, params={"limit": MAX_PAGE_SIZE, "offset": offset}
+        )
+        if response.status_code != 200:
+            raise CrowdinError(f"Failed to get {name}: {response.status_code} - {response.text}")
+        return response.json().get("data", [])
+
+    async def initiate_build(self) -> int:
+        """
+        Initiate a translation build.
+
+        Returns:
+            Build ID
+
+        Raises:
+            CrowdinError: If build initiation fails
+        """
+        response = await self._request("POST", "/translations/builds")
+        if response.status_code != 201:
+            raise CrowdinError(
+                f"Failed to initiate build: {response.status_code} - {response.text}"
+            )
+        return response.json()["data"]["id"]
+
+    async def check_build_status(
+        self,
+        build_id: int,
+        progress_callback: Callable[[BuildProgress], None] | None = None,
+        poll_interval: float = 2.0,
+        cancel: CancelToken | None = None,
+    ) -> bool:
+        """
+        Wait for a build to complete without blocking the event loop.
+
+        Returns:
+            True if build completed successfully
+
+        Raises:
+            CrowdinError: If the build fails
+            OperationCancelled: If cancel was cancelled
+        """
+        cancel = cancel or CancelToken()
+        while True:
+            cancel.raise_if_cancelled()
+            response = await self._request("GET", f"/translations/builds/{build_id}")
+            if response.status_code != 200:
+                raise CrowdinError(
+                    f"Failed to check build status: {response.status_code} - {response.text}"
+                )
+
+            data = response.json()["data"]
+            status = data["status"]
+            progress = data.get("progress", 0)
+            get_metrics().stage_progress(STAGE_BUILD, progress, 100)
+            if progress_callback:
+                progress_callback(
+                    BuildProgress(
+                        status=status, progress=progress, message=f"Build {status}: {progress}%"
+                    )
+                )
+
+            if status == "finished":
+                return True
+            if status != "inProgress":
+                raise CrowdinError(f"Build failed with status: {status}")
+            await cancel.sleep_async(poll_interval)
+
+    async def download_build(
+        self,
+        build_id: int,
+        save_path: str = "translations.zip",
+        progress_callback: Callable[[int], None] | None = None,
+        cancel: CancelToken | None = None,
+    ) -> str:
+        """
+        Download the completed build, streaming it to save_path.
+
+        Returns:
+            Path to the downloaded file
+
+        Raises:
+            CrowdinError: If download fails
+            OperationCancelled: If cancel was cancelled (the partial file is removed)
+        """
+        response = await self._request("GET", f"/translations/builds/{build_id}/download")
+        if response.status_code != 200:
+            raise CrowdinError(
+                f"Failed to download build: {response.status_code} - {response.text}"
+            )
+
+        download_url = response.json()["data"]["url"]
+        start = time.perf_counter()
+        with (
+            get_timings().span("GET build archive", CATEGORY_HTTP) as attrs,
+            get_metrics().in_flight(SERVICE_CROWDIN),
+        ):
+            async with self.client.stream("GET", download_url) as download_response:
+                attrs["bytes"] = await _save_stream(
+                    download_response, save_path, progress_callback, cancel or CancelToken()
+                )
+                attrs["status"] = download_response.status_code
+        get_metrics().observe_request(
+            SERVICE_CROWDIN,
+            "GET build archive",
+            download_response.status_code,
+            time.perf_counter() - start,
+        )
+        return save_path
+
+    async def get_languages(self) -> dict[str, str]:
+        """Get available languages in the project (locale -> language ID)."""
+        return await self._get_metadata("languages", "/languages/progress", _parse_languages)
+
+    async def get_files(self) -> dict[str, int]:
+        """Get the source files of the project (path -> file ID)."""
+        return await self._get_metadata("files", "/files", _parse_files, paged=True)
+
+    async def get_file_id(self, file_path: str = RESOURCE_FILE_PATH) -> int:
+        """Get the ID of the source file new keys are added to (see CrowdinAPI.get_file_id)."""
+        return find_file_id(await self.get_files(), file_path)
+
+    async def string_exists(self, identifier: str, cancel: CancelToken | None = None) -> bool:
+        """True if Crowdin answers a lookup of the identifier."""
+        response = await self._request(
+            "GET", "/strings", cancel=cancel, params={"filter": identifier}
+        )
+        return response.status_code == 200
+
+    async def add_key(
+        self, identifier: str, file_id: int, cancel: CancelToken | None = None
+    ) -> int:
+        """
+        Add a single translation key.
+
+        Returns:
+            Crowdin string ID
+
+        Raises:
+            CrowdinError: If the key could not be added
+            OperationCancelled: If cancel was cancelled before the request was sent
+        """
+        new_key = {
+            "text": identifier.split("__")[1] if "__" in identifier else identifier,
+            "identifier": identifier,
+            "fileId": file_id,
+        }
+        response = await self._request(
+            "POST", "/strings", cancel=cancel, content=json.dumps(new_key)
+        )
+        if response.status_code != 201:
+            raise CrowdinError(f"Failed to add key '{identifier}': {response.text}")
+        return response.json()["data"]["id"]
+
+    async def add_translation(
+        self, string_id: int, language_id: str, text: str, cancel: CancelToken | None = None
+    ) -> bool:
+        """
+        Add a single translation.
+
+        Returns:
+            True if the translation was added
+
+        Raises:
+            OperationCancelled: If cancel was cancelled before the request was sent
+        """
+        translation_item = {"stringId": string_id, "languageId": language_id, "text": text}
+        response = await self._request(
+            "POST", "/translations", cancel=cancel, content=json.dumps(translation_item)
+        )
+        return response.status_code == 201
+
+    async def add_keys(
+        self,
+        identifiers: list[str],
+        *,
+        file_path: str = RESOURCE_FILE_PATH,
+        key_callback: Callable[[str, int], None] | None = None,
+        cancel: CancelToken | None = None,
+    ) -> dict[str, int]:
+        """
+        Add keys concurrently (bounded by the client's semaphore).
+
+        Args:
+            identifiers: Key identifiers to add
+            file_path: Source file the keys are added to
+            key_callback: Called with (identifier, string ID) as each key is created
+            cancel: Checked before each request is sent; requests in flight finish
+
+        Returns:
+            Dict mapping key identifiers to their Crowdin IDs
+
+        Raises:
+            CrowdinError: If a key could not be added (once the other requests finished)
+            OperationCancelled: If cancel was cancelled
+        """
+        if not identifiers:
+            return {}
+        file_id = await self.get_file_id(file_path)
+
+        async def add(identifier: str) -> int:
+            string_id = await self.add_key(identifier, file_id, cancel)
+            if key_callback:
+                key_callback(identifier, string_id)
+            return string_id
+
+        string_ids = await gather_settled(add(identifier) for identifier in identifiers)
+        return dict(zip(identifiers, string_ids, strict=True))
+
+    async def add_translations(
+        self,
+        translations: dict[str, dict[str, str]],
+        string_ids: dict[str, int],
+        *,
+        translation_callback: Callable[[str, str, bool], None] | None = None,
+        cancel: CancelToken | None = None,
+    ) -> int:
+        """
+        Add translations of created keys concurrently.
+
+        Args:
+            translations: Translations by locale, then key identifier
+            string_ids: Crowdin IDs of the created keys
+            translation_callback: Called with (identifier, locale, added) per translation
+            cancel: Checked before each request is sent; requests in flight finish
+
+        Returns:
+            Number of translations added
+
+        Raises:
+            OperationCancelled: If cancel was cancelled
+        """
+        languages = await self.get_languages()
+
+        async def add(identifier: str, locale: str, text: str) -> bool:
+            string_id = string_ids[identifier]
+            added = await self.add_translation(string_id, languages[locale], text, cancel)
+            if translation_callback:
+                translation_callback(identifier, locale, added)
+            return added
+
+        results = await gather_settled(
+            add(identifier, locale, text)
+            for locale, values in translations.items()
+            if locale in languages
+            for identifier, text in values.items()
+            if identifier in string_ids
+        )
+        return sum(results)
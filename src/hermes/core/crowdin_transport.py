@@ -0,0 +1,396 @@
+"""HTTP transport for Crowdin API requests.
+
+Requests share one pooled connection client: HTTP/1.1 with a pool of
+connections by default, or HTTP/2 (optional ``http2`` extra) where concurrent
+requests are multiplexed on a single connection.
+
+GETs go through a small on-disk response cache: when a cached response has
+an ETag or Last-Modified validator, the request is sent as a conditional GET
+and a 304 is answered from the cache. Identical GETs that are in flight at
+the same time are coalesced into a single request.
+"""
+
+import atexit
+import hashlib
+import importlib.util
+import json
+import re
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+from .config import get_config_dir
+from .metrics import SERVICE_CROWDIN, get_metrics
+from .timing import CATEGORY_HTTP, get_timings
+
+if TYPE_CHECKING:
+    import httpx
+
+# Connections kept open per host on the HTTP/1.1 path
+POOL_MAX_CONNECTIONS = 32
+REQUEST_TIMEOUT_SECONDS = 60.0
+
+# Bounds of the on-disk response cache
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_MAX_BODY_BYTES = 256 * 1024
+
+# Stores are written to disk at most this often; the rest is flushed at exit
+RESPONSE_CACHE_FLUSH_SECONDS = 5.0
+
+RESPONSE_CACHE_DIR = "cache"
+RESPONSE_CACHE_FILE = "crowdin-responses.json"
+
+# Response validators and the conditional request headers they map to
+VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+NOT_MODIFIED = 304
+OK = 200
+
+# Timing spans name endpoints relative to the project, with numeric ids folded
+PROJECT_SEGMENT = "/projects/"
+ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def require_http2() -> None:
+    """
+    Check that the optional HTTP/2 support is installed.
+
+    Raises:
+        ImportError: If the h2 package is missing
+    """
+    if importlib.util.find_spec("h2") is None:
+        raise ImportError("HTTP/2 support needs the 'http2' extra: pip install 'hermes[http2]'")
+
+
+def create_http_client(
+    http2: bool = False,
+    max_connections: int = POOL_MAX_CONNECTIONS,
+) -> "httpx.Client":
+    """
+    Create the pooled client behind the Crowdin clients.
+
+    Args:
+        http2: Negotiate HTTP/2 (multiplexed requests on one connection)
+        max_connections: Size of the connection pool
+
+    Raises:
+        ImportError: If http2 is requested but not installed
+    """
+    import httpx  # noqa: PLC0415 - deferred for startup time
+
+    if http2:
+        require_http2()
+    return httpx.Client(
+        http2=http2,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=max_connections
+        ),
+    )
+
+
+@dataclass
+class CachedResponse:
+    """A response served from the cache, with the parts of httpx.Response callers use."""
+
+    status_code: int
+    text: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+@dataclass
+class TransportStats:
+    """Counters of how GETs were answered."""
+
+    requests: int = 0
+    network: int = 0
+    not_modified: int = 0
+    coalesced: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of GETs answered without downloading a body."""
+        if not self.requests:
+            return 0.0
+        return (self.not_modified + self.coalesced) / self.requests
+
+    def summary(self) -> str:
+        """One-line report of the saved round trips and transfers."""
+        return (
+            f"Crowdin GETs: {self.requests} requested, {self.network} sent, "
+            f"{self.coalesced} coalesced, {self.not_modified} not modified "
+            f"({self.hit_ratio:.0%} hit ratio)"
+        )
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Span name of a request, e.g. "GET /translations/builds/{id}"."""
+    path = urlsplit(url).path
+    if PROJECT_SEGMENT in path:
+        path = "/" + path.split(PROJECT_SEGMENT, 1)[1].partition("/")[2]
+    return f"{method} {ID_SEGMENT.sub('/{id}', path)}"
+
+
+def request_key(url: str, headers: Mapping[str, str]) -> str:
+    """Cache key of a GET: the URL and a hash of the credentials, never the token itself."""
+    material = f"{url}\n{headers.get('Authorization', '')}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _validators(headers: Mapping[str, str]) -> dict[str, str]:
+    """ETag / Last-Modified headers of a response."""
+    return {name: headers[name] for name in VALIDATOR_HEADERS if headers.get(name)}
+
+
+def _read_cache(path: Path) -> dict[str, dict]:
+    """Read cached responses from disk, returning an empty dict on failure."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_cache(path: Path, entries: dict[str, dict]) -> None:
+    """Write cached responses atomically; a failed write only costs a full GET later."""
+    temp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        temp_path.replace(path)
+    except OSError:
+        return
+
+
+class ResponseCache:
+    """Disk-backed, size-bounded cache of GET responses that carry validators."""
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        flush_seconds: float = RESPONSE_CACHE_FLUSH_SECONDS,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_seconds = flush_seconds
+        self._entries = _read_cache(path)
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        # Serializes disk writes without holding _lock, so lookups never wait on I/O
+        self._write_lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        """Cached entry ({"text", "headers"}) for a request key."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def store(self, key: str, text: str, headers: dict[str, str]) -> None:
+        """
+        Cache a response body, evicting the oldest entries beyond max_entries.
+
+        The file is rewritten at most every flush_seconds; call flush() to
+        write the remaining changes.
+        """
+        if len(text.encode("utf-8")) > RESPONSE_CACHE_MAX_BODY_BYTES:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {"text": text, "headers": headers}
+            while len(self._entries) > self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._dirty = True
+            due = time.monotonic() - self._last_flush >= self.flush_seconds
+        # Another thread already writing will pick up this entry on the next flush
+        if due and self._write_lock.acquire(blocking=False):
+            try:
+                self._flush_locked()
+            finally:
+                self._write_lock.release()
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if any."""
+        with self._write_lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Snapshot the entries under _lock and write them outside it; needs _write_lock."""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._entries)
+            self._dirty = False
+            self._last_flush = time.monotonic()
+        _write_cache(self.path, snapshot)
+
+
+class _Flight:
+    """A GET in progress that identical requests wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Any = None
+        self.error: BaseException | None = None
+
+
+class CrowdinTransport:
+    """Thread-safe transport with pooled connections, conditional GETs and coalescing."""
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        client: "httpx.Client | None" = None,
+        http2: bool = False,
+    ):
+        self.cache = cache
+        self.http2 = http2
+        self.client = client or create_http_client(http2=http2)
+        self.stats = TransportStats()
+        self._in_flight: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, headers: Mapping[str, str], use_cache: bool = True) -> Any:
+        """
+        Send a GET, or join an identical one already in flight.
+
+        Args:
+            url: Request URL
+            headers: Request headers
+            use_cache: Use the response cache (disable when the caller sends
+                its own conditional headers)
+
+        Returns:
+            An httpx.Response, or a CachedResponse for a 304 answered from the cache
+        """
+        return self._observed("GET", url, lambda: self._get(url, headers, use_cache))
+
+    def _get(self, url: str, headers: Mapping[str, str], use_cache: bool) -> Any:
+        key = request_key(url, headers)
+        with self._lock:
+            self.stats.requests += 1
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                self.stats.coalesced += 1
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+
+        if not leader:
+            return self._wait(flight)
+
+        try:
+            flight.response = self._fetch(url, headers, key, use_cache)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+        return flight.response
+
+    def post(
+        self, url: str, headers: Mapping[str, str], body: str | None = None
+    ) -> "httpx.Response":
+        """Send a POST on the pooled client."""
+        return self._observed(
+            "POST", url, lambda: self.client.post(url, headers=headers, content=body)
+        )
+
+    def _observed(self, method: str, url: str, send: Callable[[], Any]) -> Any:
+        """Send a request, recording it as a timing span and in the run metrics."""
+        endpoint = endpoint_name(method, url)
+        metrics = get_metrics()
+        start = time.perf_counter()
+        with (
+            get_timings().span(endpoint, CATEGORY_HTTP) as attrs,
+            metrics.in_flight(SERVICE_CROWDIN),
+        ):
+            response = send()
+            attrs["status"] = response.status_code
+        metrics.observe_request(
+            SERVICE_CROWDIN, endpoint, response.status_code, time.perf_counter() - start
+        )
+        return response
+
+    def _wait(self, flight: _Flight) -> Any:
+        """Wait for the leading request and share its outcome."""
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.response
+
+    def _fetch(self, url: str, headers: Mapping[str, str], key: str, use_cache: bool) -> Any:
+        """Send the GET, conditional if a cached response has validators."""
+        entry = self.cache.get(key) if self.cache and use_cache else None
+        request_headers = dict(headers)
+        for name, value in _validators(entry["headers"] if entry else {}).items():
+            request_headers[VALIDATOR_HEADERS[name]] = value
+
+        response = self.client.get(url, headers=request_headers)
+        with self._lock:
+            self.stats.network += 1
+
+        if response.status_code == NOT_MODIFIED and entry:
+            with self._lock:
+                self.stats.not_modified += 1
+            return CachedResponse(OK, entry["text"], entry["headers"])
+
+        validators = _validators(response.headers)
+        if response.status_code == OK and validators and self.cache and use_cache:
+            self.cache.store(key, response.text, validators)
+        return response
+
+
+@dataclass
+class _SharedTransport:
+    """The process-wide transport; configure_transport replaces it."""
+
+    transport: CrowdinTransport | None = None
+
+
+_shared = _SharedTransport()
+_transport_lock = threading.Lock()
+
+
+def _response_cache() -> ResponseCache:
+    """The on-disk response cache next to the config, flushed at exit."""
+    cache = ResponseCache(get_config_dir() / RESPONSE_CACHE_DIR / RESPONSE_CACHE_FILE)
+    atexit.register(cache.flush)
+    return cache
+
+
+def get_transport() -> CrowdinTransport:
+    """Get the process-wide Crowdin transport (its cache, pool and stats are shared)."""
+    with _transport_lock:
+        if _shared.transport is None:
+            _shared.transport = CrowdinTransport(_response_cache())
+        return _shared.transport
+
+
+def configure_transport(http2: bool = False) -> CrowdinTransport:
+    """
+    Switch the process-wide transport between HTTP/1.1 and HTTP/2.
+
+    Call before creating Crowdin clients; clients keep the transport they were
+    created with. The current transport is kept if it already matches.
+
+    Raises:
+        ImportError: If http2 is requested but not installed
+    """
+    with _transport_lock:
+        current = _shared.transport
+        if current is None or current.http2 != http2:
+            # Keep one cache instance, so its pending writes are not lost or overwritten
+            cache = current.cache if current is not None else _response_cache()
+            _shared.transport = CrowdinTransport(cache, http2=http2)
+        return _shared.transport
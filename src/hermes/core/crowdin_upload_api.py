@@ -2,13 +2,104 @@
 
 import json
 import os
-import re
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Collection, Iterator
+from contextlib import contextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-import requests
-from google import genai
+from .cancellation import CancelToken, OperationCancelled
+from .crowdin_api import RESOURCE_FILE_PATH, CrowdinAPI, CrowdinError
+from .gemini import (
+    DEFAULT_GEMINI_MODEL,
+    BatchCallback,
+    GeminiTranslator,
+    LanguageCallback,
+    merge_translations,
+)
+from .glossary import GlossaryIndex, build_glossary_index, format_glossary_section
+from .journal import UploadJournal, journal_path
+from .keys import KeyPlan, fan_out, parse_keys, plan_keys
+from .metrics import get_metrics
+from .prompt_cache import PromptCache
+from .rate_limit import RateGovernor
+from .timing import timed
+from .upload_async import AsyncUploadPipeline
+from .upload_pipeline import STAGE_TRANSLATIONS, PipelineProgress, PipelineStats, UploadPipeline
 
-from .crowdin_api import CrowdinError
+if TYPE_CHECKING:
+    from google import genai
+
+    from .crowdin_async import AsyncCrowdinAPI
+
+
+def _gemini_client(api_key: str, api_url: str | None) -> "genai.Client":
+    """
+    Gemini client, sending requests to api_url instead of Google when it is set.
+
+    The SDK is imported here, not at module load, because it dominates startup time.
+    """
+    from google import genai  # noqa: PLC0415 - deferred for startup time
+
+    if not api_url:
+        return genai.Client(api_key=api_key)
+    return genai.Client(api_key=api_key, http_options={"base_url": api_url})
+
+
+def _fanned_out(
+    language_callback: LanguageCallback | None,
+    plan: KeyPlan,
+) -> LanguageCallback | None:
+    """Wrap a language consumer so it receives results for every key variant."""
+    if language_callback is None:
+        return None
+
+    def consume(locale: str, values: dict[str, str]) -> None:
+        language_callback(locale, fan_out({locale: values}, plan)[locale])
+
+    return consume
+
+
+def _percent_progress(
+    progress_callback: Callable[[str, int], None] | None,
+) -> PipelineProgress | None:
+    """Adapt a (stage, percent) callback to pipeline (stage, done, total) updates."""
+    if progress_callback is None:
+        return None
+
+    def report(stage: str, done: int, total: int) -> None:
+        if stage == STAGE_TRANSLATIONS and total:
+            progress_callback("Adding translations...", done * 100 // total)
+
+    return report
+
+
+def _then(
+    first: Callable[[], object] | None,
+    second: Callable[[], None],
+) -> Callable[[], None] | None:
+    """Chain two steps, or return None when there is no first step."""
+    if first is None:
+        return None
+
+    def run() -> None:
+        first()
+        second()
+
+    return run
+
+
+def _fanned_out_batches(
+    batch_callback: BatchCallback | None,
+    plan: KeyPlan,
+) -> BatchCallback | None:
+    """Wrap a batch consumer so it receives results for every key variant."""
+    if batch_callback is None:
+        return None
+
+    def consume(batch: dict[str, dict[str, str]]) -> None:
+        batch_callback(fan_out(batch, plan))
+
+    return consume
 
 
 class CrowdinUploadAPI:
@@ -66,34 +157,51 @@ Output:
 }
 
 請依照相同格式回傳 JSON 本體，**不要加上任何說明、註解、標記或程式碼框**。
-Input: """
+"""
 
     def __init__(
         self,
         api_token: str,
         project_id: str,
         gemini_api_key: str,
+        *,
         key_file_path: str | None = None,
         prompt_file_path: str | None = None,
         data_path: str = "GSSKPIM-1 (translations)/",
+        glossary_file_path: str | None = None,
         log_callback: Callable[[str], None] | None = None,
+        gemini_client: Any | None = None,
+        rate_governor: RateGovernor | None = None,
+        fallback_model: str | None = None,
+        crowdin_api_url: str | None = None,
+        gemini_api_url: str | None = None,
+        crowdin: CrowdinAPI | None = None,
+        cancel: CancelToken | None = None,
+        resource_file_path: str = RESOURCE_FILE_PATH,
     ):
         self.api_token = api_token
         self.project_id = project_id
-        self.base_url = f"https://api.crowdin.com/api/v2/projects/{self.project_id}"
+        # A client with its own cache or transport can be injected
+        self.crowdin = crowdin or CrowdinAPI(api_token, project_id, api_url=crowdin_api_url)
+        self.base_url = self.crowdin.base_url
         self.headers = {
             "Authorization": f"Bearer {self.api_token}",
             "Content-Type": "application/json",
         }
         self.data_path = data_path
         self.t_file_path = os.path.join(data_path, "zh-TW", "CommonResource.json")
+        self.resource_file_path = resource_file_path
         self.log = log_callback or print
+        # Stops translation and uploads between requests; see run_pipelined_upload
+        self.cancel = cancel or CancelToken()
 
         # Load translations context
         self.translations: dict[str, dict[str, str]] = {}
         self.key_context = ""
         self.prompt_context = self.DEFAULT_PROMPTS
         self.existing_translations: dict = {}
+        self.glossary_file_path = glossary_file_path
+        self._glossary_index: GlossaryIndex | None = None
 
         # Load key file
         if key_file_path and os.path.exists(key_file_path):
@@ -106,137 +214,252 @@ Input: """
                 self.prompt_context = f.read()
 
         # Load existing translations
-        if os.path.exists(self.t_file_path):
-            with open(self.t_file_path, encoding="utf-8") as f:
-                self.existing_translations = json.load(f)
+        self.load_existing_translations()
 
         # Get languages from Crowdin
         self.languages = self._get_languages()
         self.added_keys: dict[str, int] = {}
 
-        # Initialize Gemini client (new SDK)
-        self.gemini_client = genai.Client(api_key=gemini_api_key)
-        self.gemini_model = "gemini-2.0-flash"
+        # Initialize Gemini client (new SDK); a stand-in client can be injected
+        self.gemini_client = gemini_client or _gemini_client(gemini_api_key, gemini_api_url)
+        self.gemini_model = DEFAULT_GEMINI_MODEL
+        self.translator = GeminiTranslator(
+            self.gemini_client,
+            system_prompt=self.prompt_context,
+            build_context=self.glossary_context,
+            model=self.gemini_model,
+            prompt_cache=PromptCache(self.gemini_client, log_callback=self.log),
+            rate_governor=rate_governor,
+            fallback_model=fallback_model,
+            log_callback=self.log,
+            cancel=self.cancel,
+        )
+
+    @timed("load existing translations")
+    def load_existing_translations(self) -> None:
+        """(Re)load the existing zh-TW translations used to skip existing keys."""
+        if os.path.exists(self.t_file_path):
+            with open(self.t_file_path, encoding="utf-8") as f:
+                self.existing_translations = json.load(f)
 
     def _get_languages(self) -> dict[str, str]:
-        """Get available languages from Crowdin."""
-        url = f"{self.base_url}/languages/progress"
-        response = requests.get(url, headers=self.headers)
-
-        if response.status_code == 200:
-            languages = {}
-            for item in response.json().get("data", []):
-                locale = item["data"]["language"]["locale"]
-                lang_id = item["data"]["languageId"]
-                languages[locale] = lang_id
-            return languages
-        else:
-            self.log(f"Warning: Could not get languages: {response.text}")
+        """Get available languages from Crowdin (served from the metadata cache when fresh)."""
+        try:
+            return self.crowdin.get_languages()
+        except CrowdinError as e:
+            self.log(f"Warning: Could not get languages: {e}")
             return {}
 
+    @cached_property
+    def file_id(self) -> int:
+        """
+        ID of the Crowdin source file new keys are added to.
+
+        Raises:
+            CrowdinError: If the project has no file at resource_file_path
+        """
+        file_id = self.crowdin.get_file_id(self.resource_file_path)
+        self.log(f"Adding keys to {self.resource_file_path} (file ID {file_id})")
+        return file_id
+
+    @property
+    def glossary_index(self) -> GlossaryIndex:
+        """Glossary index over the glossary file and existing translations (built lazily)."""
+        if self._glossary_index is None:
+            self._glossary_index = build_glossary_index(self.glossary_file_path, self.data_path)
+        return self._glossary_index
+
+    def preload_glossary(self) -> None:
+        """Build the glossary index now, e.g. before a download replaces the data files."""
+        self._glossary_index = build_glossary_index(self.glossary_file_path, self.data_path)
+
+    def glossary_context(self, key_text: str) -> str:
+        """
+        Build the glossary section of a Gemini request for a set of keys.
+
+        Only glossary entries relevant to key_text are included, so requests
+        do not grow with the size of the glossary.
+        """
+        return format_glossary_section(self.glossary_index.search(key_text))
+
+    @timed("plan keys")
+    def plan_keys(self, keep: Collection[str] = ()) -> KeyPlan:
+        """
+        Parse and deduplicate the keys file.
+
+        Keys already in the existing translations are dropped, and keys that
+        differ only in whitespace or punctuation are translated once.
+
+        Args:
+            keep: Identifiers to plan even if they exist (e.g. keys created by
+                an interrupted run whose translations are not all posted)
+        """
+        existing = set(self.existing_translations) - set(keep)
+        plan = plan_keys(parse_keys(self.key_context), existing)
+        if plan.existing or plan.duplicates:
+            self.log(f"Skipping {len(plan.existing)} existing and {plan.duplicates} duplicate keys")
+        return plan
+
+    @timed("translate")
     def translate_missing_with_gemini(
         self,
         progress_callback: Callable[[str], None] | None = None,
+        language_callback: LanguageCallback | None = None,
+        plan: KeyPlan | None = None,
+        batch_callback: BatchCallback | None = None,
     ) -> dict[str, dict[str, str]]:
         """
         Use Gemini AI to translate missing keys.
 
+        The response is schema-constrained JSON; keys or languages missing from
+        it are re-requested on their own instead of retrying the whole batch.
+
+        Args:
+            progress_callback: Optional callback with status messages
+            language_callback: Optional consumer of (locale, translations). When
+                given, the response is streamed and each language is passed on
+                as soon as Gemini finishes it.
+            plan: Key plan to translate. Defaults to planning the keys file.
+            batch_callback: Optional consumer of each completed batch's
+                translations, keyed by every original identifier
+
         Returns:
             Dict of translations by language
         """
-        if not self.key_context.strip():
+        plan = plan or self.plan_keys()
+        if not plan.keys:
             self.log("No keys to translate")
             return {}
 
         self.log("使用 Gemini 翻譯新字詞...")
-        prompt = f"{self.prompt_context}{self.key_context}"
-
-        try:
-            if progress_callback:
-                progress_callback("Sending to Gemini...")
-
-            result = self.gemini_client.models.generate_content(
-                model=self.gemini_model,
-                contents=prompt,
-            )
-            translated_text = result.text.strip()
-
-            if progress_callback:
-                progress_callback("Parsing response...")
-
-            # Try to extract JSON from response
-            match = re.search(r"```json\n(.*?)\n```", translated_text, re.DOTALL)
-            if match:
-                translations = json.loads(match.group(1))
-            else:
-                # Try parsing as raw JSON
-                translations = json.loads(translated_text)
-
-            # Merge into self.translations
-            for lang, values in translations.items():
-                self.translations.setdefault(lang, {})
-                for key, val in values.items():
-                    self.translations[lang][key] = val
+        if progress_callback:
+            progress_callback("Sending to Gemini...")
 
-            self.log("成功整併 JSON 翻譯結果")
-            return self.translations
+        translations = self.translator.translate(
+            plan.keys,
+            progress_callback=progress_callback,
+            language_callback=_fanned_out(language_callback, plan),
+            batch_callback=_fanned_out_batches(batch_callback, plan),
+        )
+        merge_translations(self.translations, fan_out(translations, plan))
 
-        except Exception as e:
-            raise CrowdinError(f"Translation failed: {e}")
+        self.log("成功整併 JSON 翻譯結果")
+        return self.translations
 
+    @timed("add keys")
     def add_keys(
         self,
         progress_callback: Callable[[int, int], None] | None = None,
+        identifiers: list[str] | None = None,
     ) -> dict[str, int]:
         """
         Add new translation keys to Crowdin.
 
         Args:
             progress_callback: Callback with (current, total) progress
+            identifiers: Key identifiers to add. Defaults to the keys of the
+                zh-TW translations.
 
         Returns:
             Dict mapping key identifiers to their Crowdin IDs
+
+        Raises:
+            OperationCancelled: If self.cancel was cancelled
         """
         added_keys = {}
-        zh_tw_keys = self.translations.get("zh-TW", {})
+        zh_tw_keys = identifiers if identifiers is not None else self.translations.get("zh-TW", {})
         total = len(zh_tw_keys)
 
         for idx, key in enumerate(zh_tw_keys):
+            self.cancel.raise_if_cancelled()
             if progress_callback:
                 progress_callback(idx + 1, total)
 
-            if key in self.existing_translations:
-                # Key already exists, check if it's in Crowdin
-                response = requests.get(
-                    f"{self.base_url}/strings?filter={key}",
-                    headers=self.headers,
-                )
-                if response.status_code == 200:
-                    self.log(f"Key '{key}' 已存在")
-                    continue
-            else:
-                # Add new key
-                new_key = {
-                    "text": key.split("__")[1] if "__" in key else key,
-                    "identifier": key,
-                    "fileId": 15,  # Default file ID
-                }
-                response = requests.post(
-                    f"{self.base_url}/strings",
-                    headers=self.headers,
-                    data=json.dumps(new_key),
-                )
-
-                if response.status_code == 201:
-                    response_data = response.json().get("data", {})
-                    self.log(f"新增 Key: {response_data['identifier']}")
-                    added_keys[response_data["identifier"]] = response_data["id"]
-                else:
-                    raise CrowdinError(f"Failed to add key '{key}': {response.text}")
+            string_id = self.add_key(key)
+            if string_id is not None:
+                added_keys[key] = string_id
 
         self.added_keys = added_keys
         return added_keys
 
+    def add_key(self, key: str) -> int | None:
+        """
+        Add a single translation key to Crowdin.
+
+        Thread-safe; the upload pipeline calls it from several workers.
+
+        Args:
+            key: Key identifier ("__" + source text)
+
+        Returns:
+            Crowdin string ID, or None if the key already exists
+        """
+        if key in self.existing_translations:
+            # Key already exists, check if it's in Crowdin
+            response = self.crowdin.transport.get(
+                f"{self.base_url}/strings?filter={key}",
+                self.headers,
+            )
+            if response.status_code == 200:
+                self.log(f"Key '{key}' 已存在")
+            get_metrics().inc("hermes_upload_keys_total", result="skipped")
+            return None
+
+        new_key = {
+            "text": key.split("__")[1] if "__" in key else key,
+            "identifier": key,
+            "fileId": self.file_id,
+        }
+        response = self.crowdin.transport.post(
+            f"{self.base_url}/strings",
+            self.headers,
+            json.dumps(new_key),
+        )
+
+        if response.status_code != 201:
+            raise CrowdinError(f"Failed to add key '{key}': {response.text}")
+
+        response_data = response.json().get("data", {})
+        self.log(f"新增 Key: {response_data['identifier']}")
+        self.added_keys[response_data["identifier"]] = response_data["id"]
+        get_metrics().inc("hermes_upload_keys_total", result="created")
+        return response_data["id"]
+
+    def add_translation(self, string_id: int, language_id: str, key: str, text: str) -> bool:
+        """
+        Add a single translation for a Crowdin string.
+
+        Args:
+            string_id: Crowdin string ID
+            language_id: Locale of the translation (e.g. "en-US")
+            key: Key identifier, for logging
+            text: Translated text
+
+        Returns:
+            True if the translation was added
+        """
+        translation_item = {
+            "stringId": string_id,
+            "languageId": self.languages[language_id],
+            "text": text,
+        }
+        response = self.crowdin.transport.post(
+            f"{self.base_url}/translations",
+            self.headers,
+            json.dumps(translation_item),
+        )
+
+        if response.status_code != 201:
+            self.log(f"Warning: Failed to add translation: {response.text}")
+            get_metrics().inc(
+                "hermes_upload_translations_total", language=language_id, result="failed"
+            )
+            return False
+
+        self.log(f"新增 {language_id} {key} 翻譯成功")
+        get_metrics().inc("hermes_upload_translations_total", language=language_id, result="posted")
+        return True
+
     def add_translations(
         self,
         progress_callback: Callable[[int, int], None] | None = None,
@@ -246,70 +469,286 @@ Input: """
 
         Args:
             progress_callback: Callback with (current, total) progress
+
+        Raises:
+            OperationCancelled: If self.cancel was cancelled
         """
         if not self.added_keys:
             self.log("No new keys to translate")
             return
 
-        translation_url = f"{self.base_url}/translations"
         total_operations = sum(len(keys) for keys in self.translations.values()) * len(
             self.added_keys
         )
         current = 0
 
         for language_id, keys in self.translations.items():
-            if language_id not in self.languages:
+            current = self.add_language_translations(
+                language_id,
+                keys,
+                progress_callback=progress_callback,
+                progress_offset=current,
+                progress_total=total_operations,
+            )
+
+    @timed("add language translations")
+    def add_language_translations(
+        self,
+        language_id: str,
+        keys: dict[str, str],
+        progress_callback: Callable[[int, int], None] | None = None,
+        progress_offset: int = 0,
+        progress_total: int = 0,
+    ) -> int:
+        """
+        Add one language's translations for newly added keys.
+
+        Args:
+            language_id: Locale of the translations (e.g. "en-US")
+            keys: Translations by key identifier
+            progress_callback: Callback with (current, total) progress
+            progress_offset: Progress count before this language
+            progress_total: Total reported to progress_callback
+
+        Returns:
+            Progress count after this language
+
+        Raises:
+            OperationCancelled: If self.cancel was cancelled
+        """
+        if language_id not in self.languages:
+            return progress_offset
+
+        current = progress_offset
+
+        for key, value in keys.items():
+            if key not in self.added_keys:
                 continue
 
-            for key, value in keys.items():
-                if key in self.added_keys:
-                    current += 1
-                    if progress_callback:
-                        progress_callback(current, total_operations)
-
-                    translation_item = {
-                        "stringId": self.added_keys[key],
-                        "languageId": self.languages[language_id],
-                        "text": value,
-                    }
-                    response = requests.post(
-                        translation_url,
-                        headers=self.headers,
-                        data=json.dumps(translation_item),
-                    )
-
-                    if response.status_code == 201:
-                        self.log(f"新增 {language_id} {key} 翻譯成功")
-                    else:
-                        self.log(f"Warning: Failed to add translation: {response.text}")
+            self.cancel.raise_if_cancelled()
+            current += 1
+            if progress_callback:
+                progress_callback(current, progress_total)
+
+            self.add_translation(self.added_keys[key], language_id, key, value)
+
+        return current
 
     def run_full_upload(
         self,
         progress_callback: Callable[[str, int], None] | None = None,
+        stream: bool = False,
     ) -> None:
         """
         Run the full upload workflow: translate → add keys → add translations.
 
+        The stages are pipelined: keys are created and their translations
+        posted while Gemini is still translating later batches.
+
         Args:
             progress_callback: Callback with (stage, progress) updates
+            stream: Create the keys first, then post each language's
+                translations as soon as Gemini streams it
         """
-        # Stage 1: Translate with Gemini
+        if stream:
+            self.run_streaming_upload(progress_callback)
+            return
+
         if progress_callback:
-            progress_callback("Translating with Gemini...", 0)
+            progress_callback("Translating and uploading...", 0)
+
+        self.run_pipelined_upload(_percent_progress(progress_callback))
+
+        if progress_callback:
+            progress_callback("Complete!", 100)
+
+    @timed("pipelined upload")
+    def run_pipelined_upload(
+        self,
+        progress_callback: PipelineProgress | None = None,
+        wait_for_download: Callable[[], object] | None = None,
+        resume: bool = False,
+    ) -> PipelineStats:
+        """
+        Translate, add keys and add translations as overlapping stages.
+
+        Args:
+            progress_callback: Callback with (stage, done, total) per finished item
+            wait_for_download: Blocks until a concurrent download has finished.
+                Translation starts right away; key creation waits for it and
+                then reloads the existing translations, so keys added to
+                Crowdin in the meantime are skipped.
+            resume: Continue the interrupted run with the same keys file,
+                reusing its journaled translations, keys and posted translations
+
+        Returns:
+            Counters of created keys and posted translations
 
-        self.translate_missing_with_gemini()
+        Raises:
+            OperationCancelled: If self.cancel was cancelled; the journal is
+                kept, so the run can be resumed
+            UnfinishedJournalError: If resume is False and an interrupted run
+                of the same keys left a journal
+        """
+        journal = UploadJournal(journal_path(self.project_id, self.key_context), resume=resume)
+        try:
+            return self._run_pipeline(journal, progress_callback, wait_for_download, resume)
+        finally:
+            # Flushes and releases the file on any error; the journal stays for --resume
+            journal.close()
+
+    def _plan_journaled(self, journal: UploadJournal, resume: bool) -> KeyPlan | None:
+        """Plan the keys still to upload, or discard the journal and return None if none are."""
+        if resume:
+            self.log(
+                f"Resuming: {len(journal.state.string_ids)} keys and "
+                f"{len(journal.state.posted)} translations already uploaded"
+            )
+
+        plan = self.plan_keys(keep=journal.state.string_ids)
+        if not plan.keys:
+            self.log("No keys to translate")
+            journal.discard()
+            return None
+        return plan
+
+    def _run_pipeline(
+        self,
+        journal: UploadJournal,
+        progress_callback: PipelineProgress | None,
+        wait_for_download: Callable[[], object] | None,
+        resume: bool,
+    ) -> PipelineStats:
+        """Plan the keys still to upload and run the journaled pipeline."""
+        plan = self._plan_journaled(journal, resume)
+        if plan is None:
+            return PipelineStats()
+
+        pipeline = UploadPipeline(
+            self,
+            progress_callback=progress_callback,
+            before_keys=_then(wait_for_download, self.load_existing_translations),
+            journal=journal,
+            cancel=self.cancel,
+        )
+        with self._journal_kept(journal):
+            stats = pipeline.run(plan)
+        self._finish_journal(journal, stats)
+        return stats
+
+    @timed("async upload")
+    async def run_async_upload(
+        self,
+        crowdin: "AsyncCrowdinAPI",
+        progress_callback: PipelineProgress | None = None,
+        wait_for_download: Awaitable[object] | None = None,
+        resume: bool = False,
+    ) -> PipelineStats:
+        """
+        Translate, add keys and add translations on the running event loop.
+
+        Like run_pipelined_upload, but the Crowdin requests are sent through
+        an AsyncCrowdinAPI and Gemini runs in a worker thread.
+
+        Args:
+            crowdin: Async client the keys and translations are added with
+            progress_callback: Callback with (stage, done, total) per finished item
+            wait_for_download: Awaited before the first key is created; the
+                existing translations are then reloaded
+            resume: Continue the interrupted run with the same keys file
+
+        Returns:
+            Counters of created keys and posted translations
+
+        Raises:
+            OperationCancelled: If self.cancel was cancelled; the journal is kept
+            UnfinishedJournalError: If resume is False and an interrupted run
+                of the same keys left a journal
+        """
+
+        async def before_keys() -> None:
+            await wait_for_download
+            self.load_existing_translations()
+
+        journal = UploadJournal(journal_path(self.project_id, self.key_context), resume=resume)
+        try:
+            plan = self._plan_journaled(journal, resume)
+            if plan is None:
+                return PipelineStats()
+            pipeline = AsyncUploadPipeline(
+                self,
+                crowdin,
+                progress_callback=progress_callback,
+                before_keys=before_keys if wait_for_download is not None else None,
+                journal=journal,
+                cancel=self.cancel,
+            )
+            with self._journal_kept(journal):
+                stats = await pipeline.run(plan)
+            self._finish_journal(journal, stats)
+            return stats
+        finally:
+            journal.close()
+
+    @contextmanager
+    def _journal_kept(self, journal: UploadJournal) -> Iterator[None]:
+        """
+        Log that the journal is kept for --resume if the run is cancelled or fails.
+
+        Raises:
+            OperationCancelled: If self.cancel was cancelled
+        """
+        try:
+            yield
+        except OperationCancelled:
+            self.log(f"Cancelled; journal kept at {journal.path}; rerun with --resume to continue")
+            raise
+        except Exception:
+            self.log(f"Failed; journal kept at {journal.path}; rerun with --resume to continue")
+            raise
+
+    def _finish_journal(self, journal: UploadJournal, stats: PipelineStats) -> None:
+        """Log the counts and delete the journal of a complete run; keep it if translations failed."""
+        self.log(
+            f"Added {stats.keys_created} keys and {stats.translations_posted} translations"
+            f" ({stats.translations_failed} failed)"
+        )
+        if stats.translations_failed:
+            self.log(f"Journal kept at {journal.path}; rerun with --resume to retry")
+            return
+        journal.discard()
+
+    @timed("streaming upload")
+    def run_streaming_upload(
+        self,
+        progress_callback: Callable[[str, int], None] | None = None,
+        wait_for_download: Callable[[], object] | None = None,
+    ) -> None:
+        """
+        Upload with a streamed Gemini response.
+
+        Keys are created from the keys file before translation starts, and each
+        language is posted while Gemini is still generating the later ones.
+
+        Args:
+            progress_callback: Callback with (stage, progress) updates
+            wait_for_download: Blocks until a concurrent download has finished;
+                the existing translations are then reloaded, so keys added to
+                Crowdin in the meantime are skipped
+        """
+        before_keys = _then(wait_for_download, self.load_existing_translations)
+        if before_keys:
+            before_keys()
 
-        # Stage 2: Add keys
         if progress_callback:
-            progress_callback("Adding keys to Crowdin...", 33)
+            progress_callback("Adding keys to Crowdin...", 0)
 
-        self.add_keys()
+        self.add_keys(identifiers=self.plan_keys().identifiers)
 
-        # Stage 3: Add translations
         if progress_callback:
-            progress_callback("Adding translations...", 66)
+            progress_callback("Translating and adding translations...", 33)
 
-        self.add_translations()
+        self.translate_missing_with_gemini(language_callback=self.add_language_translations)
 
         if progress_callback:
             progress_callback("Complete!", 100)
@@ -5,6 +5,11 @@ import os
 import shutil
 import zipfile
 from collections.abc import Callable
+from pathlib import Path
+
+from .cancellation import CancelToken
+from .metrics import STAGE_EXTRACT, STAGE_PROCESS, get_metrics
+from .timing import get_timings, timed
 
 # Language mapping: output folder -> source folder in ZIP
 LANGUAGE_MAPPING = {
@@ -18,39 +23,73 @@ LANGUAGE_MAPPING = {
     "id-ID": "id",
 }
 
+# Extraction goes to <target><suffix> first and replaces the target when complete
+STAGING_SUFFIX = ".partial"
+
 
+@timed("extract")
 def extract_and_replace_files(
     zip_path: str,
     target_path: str,
     progress_callback: Callable[[int, int], None] | None = None,
+    cancel: CancelToken | None = None,
 ) -> None:
     """
     Extract ZIP file and replace existing files.
 
+    The archive is extracted next to the target and swapped in when complete,
+    so a cancelled or failed extraction leaves the existing files untouched.
+
     Args:
         zip_path: Path to the ZIP file
         target_path: Directory to extract to
         progress_callback: Optional callback with (current, total) progress
+        cancel: Optional token, checked before each member
+
+    Raises:
+        OperationCancelled: If cancel was cancelled
     """
+    staging_path = Path(os.path.normpath(target_path) + STAGING_SUFFIX)
+    if staging_path.exists():
+        shutil.rmtree(staging_path)
+    staging_path.mkdir(parents=True)
+
+    try:
+        _extract_members(zip_path, staging_path, progress_callback, cancel or CancelToken())
+    except BaseException:
+        shutil.rmtree(staging_path, ignore_errors=True)
+        raise
+
     # Remove existing directory
     if os.path.exists(target_path):
         shutil.rmtree(target_path)
-    os.makedirs(target_path)
+    staging_path.replace(target_path)
 
+
+def _extract_members(
+    zip_path: str,
+    target_path: Path,
+    progress_callback: Callable[[int, int], None] | None,
+    cancel: CancelToken,
+) -> None:
     with zipfile.ZipFile(zip_path, "r") as zip_ref:
         members = zip_ref.namelist()
         total = len(members)
 
         for idx, member in enumerate(members):
+            cancel.raise_if_cancelled()
             zip_ref.extract(member, target_path)
+            get_metrics().stage_progress(STAGE_EXTRACT, idx + 1, total)
             if progress_callback:
                 progress_callback(idx + 1, total)
 
 
+@timed("process language files")
 def process_language_files(
     data_path: str,
     result_path: str,
     progress_callback: Callable[[str, int, int], None] | None = None,
+    cancel: CancelToken | None = None,
 ) -> list[str]:
     """
     Process JSON language files and convert to JS format.
@@ -59,14 +98,20 @@ def process_language_files(
         data_path: Path to extracted data
         result_path: Path to save processed files
         progress_callback: Optional callback with (language, current, total)
+        cancel: Optional token, checked before each language (files are written whole)
 
     Returns:
         List of processed language codes
+
+    Raises:
+        OperationCancelled: If cancel was cancelled
     """
     processed = []
     total = len(LANGUAGE_MAPPING)
+    cancel = cancel or CancelToken()
 
     for idx, (output_folder, source_folder) in enumerate(LANGUAGE_MAPPING.items()):
+        cancel.raise_if_cancelled()
         lang_path = os.path.join(result_path, output_folder)
         os.makedirs(lang_path, exist_ok=True)
 
@@ -77,20 +122,28 @@ def process_language_files(
             progress_callback(output_folder, idx + 1, total)
 
         if os.path.exists(input_file):
-            with open(input_file, encoding="utf-8") as f:
-                data = json.load(f)
-
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(
-                    "(function (Radar) {\n"
-                    "    Radar.i18n = Radar.i18n || {};\n"
-                    "    // 自訂 Resource\n"
-                    "    Radar.i18n['CommonResource'] = "
-                )
-                json.dump(data, f, ensure_ascii=False, indent=8)
-                f.write(";\n}(Radar || {}));")
-
+            with get_timings().span("convert language", language=output_folder):
+                with (
+                    get_timings().span("load language json", language=output_folder),
+                    open(input_file, encoding="utf-8") as f,
+                ):
+                    data = json.load(f)
+
+                with open(output_file, "w", encoding="utf-8") as f:
+                    f.write(
+                        "(function (Radar) {\n"
+                        "    Radar.i18n = Radar.i18n || {};\n"
+                        "    // 自訂 Resource\n"
+                        "    Radar.i18n['CommonResource'] = "
+                    )
+                    json.dump(data, f, ensure_ascii=False, indent=8)
+                    f.write(";\n}(Radar || {}));")
+
+            get_metrics().set(
+                "hermes_output_bytes", Path(output_file).stat().st_size, language=output_folder
+            )
             processed.append(output_folder)
+        get_metrics().stage_progress(STAGE_PROCESS, idx + 1, total)
 
     return processed
 
@@ -0,0 +1,727 @@
+"""Gemini translation with schema-constrained JSON output."""
+
+import itertools
+import json
+import re
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any
+
+from .cancellation import CancelToken, OperationCancelled
+from .keys import from_identifier, to_identifier
+from .metrics import SERVICE_GEMINI, get_metrics
+from .prompt_cache import PromptCache
+from .rate_limit import RateGovernor, estimate_tokens
+from .timing import CATEGORY_GEMINI, get_timings
+
+DEFAULT_GEMINI_MODEL = "gemini-2.0-flash"
+
+# Locales requested from Gemini (outermost keys of the response)
+TARGET_LOCALES = ("zh-TW", "zh-CN", "en-US", "ja-JP", "th-TH", "vi-VN", "id-ID")
+
+JSON_MIME_TYPE = "application/json"
+
+# Follow-up requests for keys/languages missing from a response
+MAX_REPAIR_ATTEMPTS = 2
+
+# Keys per request, and requests in flight at once
+GEMINI_BATCH_SIZE = 50
+GEMINI_MAX_PARALLEL_REQUESTS = 4
+
+# Quota (429 / RESOURCE_EXHAUSTED) handling
+MAX_QUOTA_RETRIES = 5
+QUOTA_STATUS_CODE = 429
+QUOTA_STATUS = "RESOURCE_EXHAUSTED"
+RETRY_DELAY_PATTERN = re.compile(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s")
+
+# Keys up to this length go to the fallback model, when one is configured
+SHORT_KEY_MAX_CHARS = 12
+
+CODE_FENCE_PATTERN = re.compile(r"```(?:json)?\s*\n(.*?)\n\s*```", re.DOTALL)
+KEY_JOINER = ", "
+INPUT_PREFIX = "Input: "
+LOCALE_RESTRICTION = "本次只需回傳以下語系：{locales}\n\n"  # noqa: RUF001 - Chinese punctuation
+
+# Consumer of (locale, translations) blocks from a streamed response
+LanguageCallback = Callable[[str, dict[str, str]], None]
+
+# Consumer of the translations of each batch, in completion order
+BatchCallback = Callable[[dict[str, dict[str, str]]], None]
+
+# Depth of the per-locale objects inside the response JSON
+LOCALE_BLOCK_DEPTH = 2
+
+
+class GeminiError(Exception):
+    """Exception for Gemini API errors."""
+
+    pass
+
+
+class GeminiQuotaError(GeminiError):
+    """Gemini quota stayed exhausted after all retries."""
+
+    pass
+
+
+@dataclass
+class GeminiReply:
+    """Outcome of a single Gemini request."""
+
+    text: str | None = None
+    tokens: int = 0
+    quota_exceeded: bool = False
+    retry_after: float | None = None
+    chunks: Iterator[Any] | None = None
+
+
+def is_quota_error(error: Exception) -> bool:
+    """True if an SDK error means the rate limit or quota was hit."""
+    return getattr(error, "code", None) == QUOTA_STATUS_CODE or QUOTA_STATUS in str(error)
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Extract the server-suggested retry delay from a quota error, if present."""
+    match = RETRY_DELAY_PATTERN.search(str(error))
+    if not match:
+        return None
+    return float(match.group(1))
+
+
+def _quota_reply(error: Exception) -> GeminiReply:
+    """
+    Turn an SDK error into a quota-exceeded reply.
+
+    Raises:
+        GeminiError: If the error is not a quota error
+    """
+    if not is_quota_error(error):
+        raise GeminiError(f"Gemini request failed: {error}") from error
+    return GeminiReply(quota_exceeded=True, retry_after=retry_after_seconds(error))
+
+
+def _usage_tokens(response: Any) -> int:
+    """Total tokens reported by a response (0 if not reported)."""
+    usage = getattr(response, "usage_metadata", None)
+    return getattr(usage, "total_token_count", None) or 0
+
+
+def build_response_schema(locales: list[str], identifiers: list[str]) -> dict[str, Any]:
+    """
+    Build the response schema for a translation request.
+
+    The schema has one required object per locale, each with one required
+    string property per key identifier.
+
+    Args:
+        locales: Locale codes expected in the response
+        identifiers: Key identifiers expected in every locale
+
+    Returns:
+        Schema dict accepted by the Gemini ``response_schema`` option
+    """
+    return {
+        "type": "OBJECT",
+        "properties": {locale: _locale_schema(identifiers) for locale in locales},
+        "required": list(locales),
+        "property_ordering": list(locales),
+    }
+
+
+def _locale_schema(identifiers: list[str]) -> dict[str, Any]:
+    """Schema of one locale's object: a required string per identifier."""
+    return {
+        "type": "OBJECT",
+        "properties": {identifier: {"type": "STRING"} for identifier in identifiers},
+        "required": list(identifiers),
+        "property_ordering": list(identifiers),
+    }
+
+
+def _without_input_prefix(prompt: str) -> str:
+    """
+    Drop a trailing "Input:" from a system prompt.
+
+    Prompt files written for the keys to be appended to them end with it, and
+    the request contents already start the keys with INPUT_PREFIX.
+    """
+    stripped = prompt.rstrip()
+    if not stripped.endswith(INPUT_PREFIX.rstrip()):
+        return prompt
+    return stripped.removesuffix(INPUT_PREFIX.rstrip()).rstrip() + "\n"
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a surrounding Markdown code fence, if any."""
+    match = CODE_FENCE_PATTERN.search(text)
+    if match:
+        return match.group(1)
+    return text
+
+
+def _outermost_object(text: str) -> str:
+    """Cut text down to its outermost {...} span to drop stray prose."""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return text
+    return text[start : end + 1]
+
+
+def parse_translation_response(text: str | None) -> dict | None:
+    """
+    Parse a Gemini response into a JSON object.
+
+    Tolerates code fences and text around the JSON body.
+
+    Returns:
+        Parsed object, or None if the response is not a JSON object
+    """
+    if not text:
+        return None
+    candidate = _outermost_object(_strip_code_fence(text.strip()))
+    try:
+        data = json.loads(candidate)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def validate_translations(
+    data: dict | None,
+    locales: list[str],
+    identifiers: list[str],
+) -> dict[str, dict[str, str]]:
+    """
+    Keep only the expected, non-empty string translations from a response.
+
+    Returns:
+        Dict of translations by locale (invalid entries are dropped)
+    """
+    if not data:
+        return {}
+
+    valid = {}
+    for locale in locales:
+        values = data.get(locale)
+        if not isinstance(values, dict):
+            continue
+        valid[locale] = {
+            identifier: values[identifier].strip()
+            for identifier in identifiers
+            if isinstance(values.get(identifier), str) and values[identifier].strip()
+        }
+    return valid
+
+
+def find_missing(
+    translations: dict[str, dict[str, str]],
+    locales: list[str],
+    identifiers: list[str],
+) -> dict[str, list[str]]:
+    """
+    Find the key identifiers still missing per locale.
+
+    Returns:
+        Dict of locale -> missing identifiers (locales with nothing missing are omitted)
+    """
+    missing = {}
+    for locale in locales:
+        present = translations.get(locale, {})
+        absent = [identifier for identifier in identifiers if identifier not in present]
+        if absent:
+            missing[locale] = absent
+    return missing
+
+
+def merge_translations(
+    target: dict[str, dict[str, str]],
+    new: dict[str, dict[str, str]],
+) -> None:
+    """Merge translations by locale into target in place."""
+    for locale, values in new.items():
+        target.setdefault(locale, {}).update(values)
+
+
+class LocaleBlockParser:
+    """
+    Incremental parser for the streamed ``{"locale": {...}, ...}`` response.
+
+    Text is fed in arbitrary chunks; each locale block is returned as soon as
+    its closing brace arrives, without waiting for the rest of the document.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_key = ""
+        self._block_start = 0
+        self._block_key = ""
+
+    def feed(self, chunk: str) -> list[tuple[str, dict]]:
+        """
+        Consume a chunk of response text.
+
+        Returns:
+            (locale, values) pairs for every locale block completed by this chunk
+        """
+        self._buffer += chunk
+        completed = []
+        while self._pos < len(self._buffer):
+            block = self._scan_char(self._buffer[self._pos])
+            self._pos += 1
+            if block:
+                completed.append(block)
+        return completed
+
+    def _scan_char(self, char: str) -> tuple[str, dict] | None:
+        """Advance the scanner by one character."""
+        if self._in_string:
+            self._scan_string_char(char)
+            return None
+        if char == '"':
+            self._in_string = True
+            self._string_start = self._pos
+            return None
+        if char == "{":
+            return self._open_object()
+        if char == "}":
+            return self._close_object()
+        return None
+
+    def _scan_string_char(self, char: str) -> None:
+        """Track escapes and the end of a string literal."""
+        if self._escaped:
+            self._escaped = False
+            return
+        if char == "\\":
+            self._escaped = True
+            return
+        if char != '"':
+            return
+        self._in_string = False
+        if self._depth == 1:
+            self._last_key = self._buffer[self._string_start + 1 : self._pos]
+
+    def _open_object(self) -> None:
+        """Record where a locale block starts."""
+        self._depth += 1
+        if self._depth == LOCALE_BLOCK_DEPTH:
+            self._block_start = self._pos
+            self._block_key = self._last_key
+
+    def _close_object(self) -> tuple[str, dict] | None:
+        """Emit the locale block that this brace closes, if any."""
+        self._depth -= 1
+        if self._depth != LOCALE_BLOCK_DEPTH - 1:
+            return None
+        values = parse_translation_response(self._buffer[self._block_start : self._pos + 1])
+        if values is None:
+            return None
+        return self._block_key, values
+
+
+def _missing_identifiers(missing: dict[str, list[str]]) -> list[str]:
+    """Union of missing identifiers across locales, in first-seen order."""
+    return list(dict.fromkeys(identifier for ids in missing.values() for identifier in ids))
+
+
+def _notify_languages(
+    translations: dict[str, dict[str, str]],
+    language_callback: LanguageCallback,
+) -> None:
+    """Pass each non-empty locale block to the consumer."""
+    for locale, values in translations.items():
+        if values:
+            language_callback(locale, values)
+
+
+def _new_values_only(
+    known: dict[str, dict[str, str]],
+    language_callback: LanguageCallback | None,
+) -> LanguageCallback | None:
+    """Wrap a consumer so it only receives translations not already in known."""
+    if language_callback is None:
+        return None
+
+    def consume(locale: str, values: dict[str, str]) -> None:
+        present = known.get(locale, {})
+        new_values = {key: value for key, value in values.items() if key not in present}
+        if new_values:
+            language_callback(locale, new_values)
+
+    return consume
+
+
+def _batches(items: list[str], size: int) -> list[list[str]]:
+    """Split items into consecutive batches of at most size items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _serialized(language_callback: LanguageCallback | None) -> LanguageCallback | None:
+    """Wrap a consumer so concurrent batches never call it at the same time."""
+    if language_callback is None:
+        return None
+    lock = threading.Lock()
+
+    def consume(locale: str, values: dict[str, str]) -> None:
+        with lock:
+            language_callback(locale, values)
+
+    return consume
+
+
+class GeminiTranslator:
+    """
+    Translate keys with Gemini, validating and repairing structured output.
+
+    The static instruction prompt is sent as a (cached, if possible) system
+    instruction; each request only carries its batch of keys and the context
+    returned by build_context for those keys. Every request goes through the
+    rate governor, and quota errors are retried after a shared backoff.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        system_prompt: str,
+        *,
+        build_context: Callable[[str], str] | None = None,
+        model: str = DEFAULT_GEMINI_MODEL,
+        locales: tuple[str, ...] = TARGET_LOCALES,
+        prompt_cache: PromptCache | None = None,
+        batch_size: int = GEMINI_BATCH_SIZE,
+        max_workers: int = GEMINI_MAX_PARALLEL_REQUESTS,
+        rate_governor: RateGovernor | None = None,
+        fallback_model: str | None = None,
+        short_key_max_chars: int = SHORT_KEY_MAX_CHARS,
+        log_callback: Callable[[str], None] | None = None,
+        cancel: CancelToken | None = None,
+    ):
+        self.client = client
+        self.system_prompt = _without_input_prefix(system_prompt)
+        self.build_context = build_context
+        self.model = model
+        self.locales = list(locales)
+        self.prompt_cache = prompt_cache
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.governor = rate_governor or RateGovernor()
+        self.fallback_model = fallback_model
+        self.short_key_max_chars = short_key_max_chars
+        self.log = log_callback or print
+        # Checked before every request and stream chunk, and wakes rate limit waits
+        self.cancel = cancel or CancelToken()
+        self._system_tokens = estimate_tokens(self.system_prompt)
+
+    def _is_short(self, key: str) -> bool:
+        """True if a key may be sent to the fallback model."""
+        return bool(self.fallback_model) and len(key) <= self.short_key_max_chars
+
+    def _model_for(self, identifiers: list[str]) -> str:
+        """Pick the fallback model for batches of short keys, the main model otherwise."""
+        if all(self._is_short(from_identifier(identifier)) for identifier in identifiers):
+            return self.fallback_model or self.model
+        return self.model
+
+    def _request_config(self, schema: dict[str, Any], model: str) -> dict[str, Any]:
+        """Build the request config, referencing the cached system prompt if available."""
+        config: dict[str, Any] = {
+            "response_mime_type": JSON_MIME_TYPE,
+            "response_schema": schema,
+        }
+        cache_name = self.prompt_cache.get(self.system_prompt, model) if self.prompt_cache else None
+        if cache_name:
+            config["cached_content"] = cache_name
+            return config
+        config["system_instruction"] = self.system_prompt
+        return config
+
+    def _call(self, model: str, contents: str, schema: dict[str, Any]) -> GeminiReply:
+        """
+        Send one schema-constrained request to Gemini.
+
+        Returns:
+            Reply with the response text, or flagged as quota-exceeded
+
+        Raises:
+            GeminiError: If the request fails for any reason other than quota
+        """
+        config = self._request_config(schema, model)
+        try:
+            with (
+                get_timings().span(f"generate {model}", CATEGORY_GEMINI),
+                get_metrics().in_flight(SERVICE_GEMINI),
+            ):
+                result = self.client.models.generate_content(
+                    model=model, contents=contents, config=config
+                )
+        except Exception as e:
+            return _quota_reply(e)
+        return GeminiReply(text=result.text, tokens=_usage_tokens(result))
+
+    def _open_stream(self, model: str, contents: str, schema: dict[str, Any]) -> GeminiReply:
+        """
+        Start a streaming request and wait for its first chunk.
+
+        Returns:
+            Reply holding the chunk iterator, or flagged as quota-exceeded
+
+        Raises:
+            GeminiError: If the request fails for any reason other than quota
+        """
+        config = self._request_config(schema, model)
+        try:
+            with (
+                get_timings().span(f"stream first chunk {model}", CATEGORY_GEMINI),
+                get_metrics().in_flight(SERVICE_GEMINI),
+            ):
+                stream = iter(
+                    self.client.models.generate_content_stream(
+                        model=model, contents=contents, config=config
+                    )
+                )
+                first = next(stream, None)
+        except Exception as e:
+            return _quota_reply(e)
+        head = [first] if first is not None else []
+        return GeminiReply(chunks=itertools.chain(head, stream))
+
+    def _drain(self, reply: GeminiReply) -> Iterator[str]:
+        """
+        Yield the text of a started stream, recording its token usage on reply.
+
+        Raises:
+            GeminiError: If the stream breaks off
+        """
+        try:
+            for chunk in reply.chunks or ():
+                self.cancel.raise_if_cancelled()
+                reply.tokens = _usage_tokens(chunk) or reply.tokens
+                if chunk.text:
+                    yield chunk.text
+        except OperationCancelled:
+            raise
+        except Exception as e:
+            raise GeminiError(f"Gemini stream failed: {e}") from e
+
+    def _record_reply(self, model: str, reply: GeminiReply) -> None:
+        """Count a request and its reported token usage in the run metrics."""
+        metrics = get_metrics()
+        outcome = "quota_exceeded" if reply.quota_exceeded else "ok"
+        metrics.inc("hermes_gemini_requests_total", model=model, outcome=outcome)
+        if reply.tokens:
+            metrics.inc("hermes_gemini_tokens_total", reply.tokens, model=model)
+
+    def _back_off(self, attempt: int, reply: GeminiReply) -> None:
+        """Pause all requests after a quota error."""
+        delay = self.governor.backoff(attempt, reply.retry_after)
+        get_metrics().inc("hermes_retries_total", reason="gemini_quota")
+        self.log(f"Gemini quota exceeded, retrying in {delay:.0f}s...")
+
+    def _generate(self, model: str, contents: str, schema: dict[str, Any]) -> str | None:
+        """
+        Send a request within the rate budgets, retrying on quota errors.
+
+        Raises:
+            GeminiQuotaError: If the quota is still exceeded after MAX_QUOTA_RETRIES
+        """
+        estimate = self._system_tokens + estimate_tokens(contents)
+        for attempt in range(MAX_QUOTA_RETRIES + 1):
+            self.cancel.raise_if_cancelled()
+            with get_timings().span("rate limit wait", CATEGORY_GEMINI):
+                self.governor.acquire(estimate, self.cancel)
+            reply = self._call(model, contents, schema)
+            self._record_reply(model, reply)
+            if not reply.quota_exceeded:
+                self.governor.record_usage(estimate, reply.tokens or estimate)
+                return reply.text
+            self._back_off(attempt, reply)
+        raise GeminiQuotaError(f"Gemini quota still exceeded after {MAX_QUOTA_RETRIES} retries")
+
+    def _generate_stream(self, model: str, contents: str, schema: dict[str, Any]) -> Iterator[str]:
+        """
+        Stream a request within the rate budgets, retrying on quota errors.
+
+        Yields:
+            Response text chunks as they arrive
+
+        Raises:
+            GeminiQuotaError: If the quota is still exceeded after MAX_QUOTA_RETRIES
+        """
+        estimate = self._system_tokens + estimate_tokens(contents)
+        for attempt in range(MAX_QUOTA_RETRIES + 1):
+            self.cancel.raise_if_cancelled()
+            with get_timings().span("rate limit wait", CATEGORY_GEMINI):
+                self.governor.acquire(estimate, self.cancel)
+            reply = self._open_stream(model, contents, schema)
+            if not reply.quota_exceeded:
+                yield from self._drain(reply)
+                self._record_reply(model, reply)
+                self.governor.record_usage(estimate, reply.tokens or estimate)
+                return
+            self._record_reply(model, reply)
+            self._back_off(attempt, reply)
+        raise GeminiQuotaError(f"Gemini quota still exceeded after {MAX_QUOTA_RETRIES} retries")
+
+    def _compose_contents(self, locales: list[str], identifiers: list[str]) -> str:
+        """Build the per-request contents: locale restriction, context and keys."""
+        key_text = KEY_JOINER.join(from_identifier(identifier) for identifier in identifiers)
+        context = self.build_context(key_text) if self.build_context else ""
+        restriction = ""
+        if len(locales) != len(self.locales):
+            restriction = LOCALE_RESTRICTION.format(locales=KEY_JOINER.join(locales))
+        return f"{restriction}{context}{INPUT_PREFIX}{key_text}"
+
+    def request(self, locales: list[str], identifiers: list[str]) -> dict[str, dict[str, str]]:
+        """
+        Request translations of identifiers into locales.
+
+        Returns:
+            Validated translations (possibly incomplete)
+        """
+        schema = build_response_schema(locales, identifiers)
+        contents = self._compose_contents(locales, identifiers)
+        text = self._generate(self._model_for(identifiers), contents, schema)
+        with get_timings().span("parse gemini response"):
+            return validate_translations(parse_translation_response(text), locales, identifiers)
+
+    def request_stream(
+        self,
+        locales: list[str],
+        identifiers: list[str],
+        language_callback: LanguageCallback,
+    ) -> dict[str, dict[str, str]]:
+        """
+        Request translations with a streaming response.
+
+        language_callback is called with (locale, translations) as soon as each
+        locale block of the response is complete.
+
+        Returns:
+            Validated translations (possibly incomplete)
+        """
+        schema = build_response_schema(locales, identifiers)
+        contents = self._compose_contents(locales, identifiers)
+        parser = LocaleBlockParser()
+        translations: dict[str, dict[str, str]] = {}
+
+        for chunk in self._generate_stream(self._model_for(identifiers), contents, schema):
+            with get_timings().span("parse gemini response"):
+                blocks = parser.feed(chunk)
+            for locale, values in blocks:
+                block = validate_translations({locale: values}, locales, identifiers)
+                merge_translations(translations, block)
+                _notify_languages(block, language_callback)
+        return translations
+
+    def _fetch(
+        self,
+        missing: dict[str, list[str]],
+        language_callback: LanguageCallback | None,
+    ) -> dict[str, dict[str, str]]:
+        """Request the missing translations, streaming if a consumer is given."""
+        locales = list(missing)
+        identifiers = _missing_identifiers(missing)
+        if language_callback is None:
+            return self.request(locales, identifiers)
+        return self.request_stream(locales, identifiers, language_callback)
+
+    def translate_batch(
+        self,
+        identifiers: list[str],
+        progress_callback: Callable[[str], None] | None = None,
+        language_callback: LanguageCallback | None = None,
+    ) -> dict[str, dict[str, str]]:
+        """
+        Translate one batch of key identifiers into every target locale.
+
+        Keys or locales missing from a response are re-requested on their own,
+        up to MAX_REPAIR_ATTEMPTS times.
+
+        Returns:
+            Dict of translations by locale
+        """
+        translations: dict[str, dict[str, str]] = {}
+        missing = {locale: list(identifiers) for locale in self.locales}
+
+        for attempt in range(MAX_REPAIR_ATTEMPTS + 1):
+            if attempt:
+                get_metrics().inc("hermes_retries_total", reason="gemini_incomplete")
+            if attempt and progress_callback:
+                progress_callback(f"Re-requesting {len(missing)} incomplete languages...")
+            consumer = _new_values_only(translations, language_callback)
+            merge_translations(translations, self._fetch(missing, consumer))
+            missing = find_missing(translations, self.locales, identifiers)
+            if not missing:
+                return translations
+
+        count = sum(len(ids) for ids in missing.values())
+        self.log(f"Warning: {count} translations still missing after {MAX_REPAIR_ATTEMPTS} retries")
+        return translations
+
+    def translate(
+        self,
+        keys: list[str],
+        progress_callback: Callable[[str], None] | None = None,
+        language_callback: LanguageCallback | None = None,
+        batch_callback: BatchCallback | None = None,
+    ) -> dict[str, dict[str, str]]:
+        """
+        Translate keys into every target locale.
+
+        Keys are split into batches of batch_size that are translated in
+        parallel (up to max_workers requests at a time). If a fallback model
+        is set, short keys are batched separately and sent to it.
+
+        Args:
+            keys: Source texts to translate
+            progress_callback: Optional callback with status messages
+            language_callback: Optional consumer of (locale, translations). When
+                given, responses are streamed and each locale block of each batch
+                is passed on as soon as it is complete; re-requested gaps are
+                passed on too. Calls are serialized across batches.
+            batch_callback: Optional consumer of each batch's translations,
+                called from this thread as soon as the batch is complete.
+
+        Returns:
+            Dict of translations by locale
+
+        Raises:
+            GeminiError: If a batch fails; batches not yet started are dropped
+            OperationCancelled: If self.cancel was cancelled; batches not yet
+                started are dropped and running ones stop at their next request
+        """
+        short_keys = [key for key in keys if self._is_short(key)]
+        long_keys = [key for key in keys if not self._is_short(key)]
+        batches = _batches([to_identifier(key) for key in long_keys], self.batch_size)
+        batches += _batches([to_identifier(key) for key in short_keys], self.batch_size)
+        consumer = _serialized(language_callback)
+        translations: dict[str, dict[str, str]] = {}
+
+        if progress_callback and len(batches) > 1:
+            progress_callback(f"Translating {len(keys)} keys in {len(batches)} batches...")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.translate_batch, batch, progress_callback, consumer)
+                for batch in batches
+            ]
+            try:
+                for future in as_completed(futures):
+                    self.cancel.raise_if_cancelled()
+                    batch_translations = future.result()
+                    merge_translations(translations, batch_translations)
+                    if batch_callback:
+                        batch_callback(batch_translations)
+            except BaseException:
+                # Drop the queued batches instead of spending quota on a failed run
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        return translations
@@ -0,0 +1,277 @@
+"""Glossary retrieval for trimming Gemini prompts.
+
+Glossary entries come from a plain-text glossary file and from the short
+strings of the existing Crowdin resources. A character n-gram inverted index
+selects only the entries relevant to the keys of a request, so prompt size
+stays flat as the glossary grows.
+"""
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from .file_operations import LANGUAGE_MAPPING
+from .timing import timed
+
+# Bigrams work for CJK (no word boundaries) as well as for Latin scripts
+NGRAM_SIZE = 2
+
+# Fraction of an entry's n-grams that must appear in the query to count as relevant
+MIN_MATCH_SCORE = 0.6
+
+# Upper bound on entries injected into a single prompt
+MAX_GLOSSARY_ENTRIES = 40
+
+# One-character terms match any key containing that character, so only this
+# many of them are kept, after every longer match
+MAX_SINGLE_CHAR_ENTRIES = 5
+
+# Existing translations become entries only up to this length; longer ones are
+# sentences rather than terms and would crowd the terms out of the prompt
+MAX_MEMORY_TERM_CHARS = 16
+
+COMMENT_PREFIX = "#"
+TERM_SEPARATORS = ("\t", "=", "|")
+SOURCE_FOLDER = "zh-TW"
+RESOURCE_FILE = "CommonResource.json"
+
+GLOSSARY_HEADER = "參考詞彙表（若輸入包含以下詞彙，請沿用既有譯法）：\n"  # noqa: RUF001 - Chinese punctuation
+
+
+@dataclass(frozen=True)
+class GlossaryEntry:
+    """A single glossary term and the text rendered into the prompt."""
+
+    term: str
+    line: str
+
+
+def _normalize(text: str) -> str:
+    """Lowercase and drop whitespace so n-grams ignore spacing differences."""
+    return "".join(text.lower().split())
+
+
+def char_ngrams(text: str, size: int = NGRAM_SIZE) -> set[str]:
+    """
+    Split text into overlapping character n-grams.
+
+    Args:
+        text: Text to split
+        size: N-gram length
+
+    Returns:
+        Set of n-grams (the whole text if it is shorter than one n-gram)
+    """
+    normalized = _normalize(text)
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+def query_grams(text: str) -> set[str]:
+    """
+    N-grams of a query: its bigrams plus its single characters.
+
+    Terms shorter than NGRAM_SIZE are indexed as themselves, so the single
+    characters only ever match one-character terms (common in CJK); search
+    ranks those below longer matches.
+    """
+    return char_ngrams(text) | set(_normalize(text))
+
+
+def _split_term(line: str) -> str:
+    """Return the source term of a glossary line (text before the first separator)."""
+    for separator in TERM_SEPARATORS:
+        if separator in line:
+            return line.split(separator, 1)[0].strip()
+    return line.strip()
+
+
+def parse_glossary(text: str) -> list[GlossaryEntry]:
+    """
+    Parse glossary file content.
+
+    Each non-empty line is one entry. The term is the text before the first
+    tab, ``=`` or ``|``; the whole line is what gets sent to Gemini.
+
+    Args:
+        text: Raw glossary file content
+
+    Returns:
+        List of glossary entries
+    """
+    entries = []
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith(COMMENT_PREFIX):
+            continue
+        term = _split_term(line)
+        if term:
+            entries.append(GlossaryEntry(term=term, line=line))
+    return entries
+
+
+def _format_translation_line(source: str, translations: dict[str, str]) -> str:
+    """Render an existing translation as a glossary line."""
+    parts = [source] + [f"{lang}: {text}" for lang, text in translations.items() if text]
+    return " | ".join(parts)
+
+
+def entries_from_resources(resources: dict[str, dict[str, str]]) -> list[GlossaryEntry]:
+    """
+    Build glossary entries from existing Crowdin resources.
+
+    Args:
+        resources: Mapping of source folder (e.g. "en") to its identifier -> text dict.
+            The "zh-TW" folder provides the source terms.
+
+    Returns:
+        One entry per short source string (at most MAX_MEMORY_TERM_CHARS
+        characters) that has at least one translation
+    """
+    entries = []
+    for identifier, source in resources.get(SOURCE_FOLDER, {}).items():
+        if not isinstance(source, str) or not source.strip():
+            continue
+        if len(_normalize(source)) > MAX_MEMORY_TERM_CHARS:
+            continue
+        translations = {
+            folder: values.get(identifier, "")
+            for folder, values in resources.items()
+            if folder != SOURCE_FOLDER and isinstance(values.get(identifier), str)
+        }
+        if not any(translations.values()):
+            continue
+        entries.append(
+            GlossaryEntry(term=source.strip(), line=_format_translation_line(source, translations))
+        )
+    return entries
+
+
+def _read_json(path: Path) -> dict:
+    """Read a JSON object from disk, returning an empty dict on failure."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load_resources(data_path: str) -> dict[str, dict[str, str]]:
+    """
+    Load the CommonResource.json of every known language under data_path.
+
+    Args:
+        data_path: Path to the extracted Crowdin build
+
+    Returns:
+        Mapping of source folder to its resource dict (missing files are skipped)
+    """
+    resources = {}
+    for folder in LANGUAGE_MAPPING.values():
+        path = Path(data_path) / folder / RESOURCE_FILE
+        if path.exists():
+            resources[folder] = _read_json(path)
+    return resources
+
+
+class GlossaryIndex:
+    """Character n-gram inverted index over glossary entries."""
+
+    def __init__(self, entries: list[GlossaryEntry]):
+        self.entries = entries
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+        for idx, entry in enumerate(entries):
+            grams = char_ngrams(entry.term)
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(idx)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _score_candidates(self, query: str) -> dict[int, int]:
+        """Count how many of each entry's n-grams occur in the query."""
+        hits: dict[int, int] = defaultdict(int)
+        for gram in query_grams(query):
+            for idx in self._postings.get(gram, ()):
+                hits[idx] += 1
+        return hits
+
+    def search(self, query: str, limit: int = MAX_GLOSSARY_ENTRIES) -> list[GlossaryEntry]:
+        """
+        Find the glossary entries relevant to the query text.
+
+        Args:
+            query: Text of the keys being translated
+            limit: Maximum number of entries to return
+
+        Returns:
+            Matching entries, best match first; n-gram matches come before
+            one-character terms, of which at most MAX_SINGLE_CHAR_ENTRIES are kept
+        """
+        scored = [
+            (
+                len(self.entries[idx].term) > 1,
+                hits / self._gram_counts[idx],
+                len(self.entries[idx].term),
+                idx,
+            )
+            for idx, hits in self._score_candidates(query).items()
+            if hits / self._gram_counts[idx] >= MIN_MATCH_SCORE
+        ]
+        scored.sort(reverse=True)
+
+        results = []
+        seen_terms = set()
+        single_chars = 0
+        for multi_char, _, _, idx in scored:
+            entry = self.entries[idx]
+            if entry.term in seen_terms:
+                continue
+            if not multi_char:
+                if single_chars >= MAX_SINGLE_CHAR_ENTRIES:
+                    break
+                single_chars += 1
+            seen_terms.add(entry.term)
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+
+@timed("build glossary index")
+def build_glossary_index(glossary_file_path: str | None, data_path: str) -> GlossaryIndex:
+    """
+    Build the index from the glossary file and existing translations.
+
+    Args:
+        glossary_file_path: Optional path to a plain-text glossary file
+        data_path: Path to the extracted Crowdin build
+
+    Returns:
+        Index over all available glossary entries
+    """
+    entries = []
+    if glossary_file_path and Path(glossary_file_path).exists():
+        glossary_text = Path(glossary_file_path).read_text(encoding="utf-8")
+        entries.extend(parse_glossary(glossary_text))
+    entries.extend(entries_from_resources(load_resources(data_path)))
+    return GlossaryIndex(entries)
+
+
+def format_glossary_section(entries: list[GlossaryEntry]) -> str:
+    """
+    Render glossary entries as a prompt section.
+
+    Returns:
+        Prompt text, or an empty string when there are no entries
+    """
+    if not entries:
+        return ""
+    lines = "\n".join(f"- {entry.line}" for entry in entries)
+    return f"{GLOSSARY_HEADER}{lines}\n\n"
@@ -0,0 +1,160 @@
+"""Write-ahead journal that makes uploads resumable.
+
+Every Gemini batch, created Crowdin string and posted translation is appended
+to a JSON-lines file (and flushed to disk) as soon as it completes. A resumed
+run replays the journal: cached translations are not sent to Gemini again,
+created keys are not created again and posted translations are skipped.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import get_config_dir
+
+JOURNAL_DIR = "journals"
+JOURNAL_SUFFIX = ".journal.jsonl"
+KEYS_HASH_LENGTH = 12
+
+RECORD_BATCH = "batch"
+RECORD_KEY = "key"
+RECORD_POSTED = "posted"
+
+
+class UnfinishedJournalError(Exception):
+    """Raised when a fresh run would overwrite the journal of an interrupted one."""
+
+
+@dataclass
+class JournalState:
+    """Work already completed by previous runs."""
+
+    translations: dict[str, dict[str, str]] = field(default_factory=dict)
+    string_ids: dict[str, int] = field(default_factory=dict)
+    posted: set[tuple[int, str]] = field(default_factory=set)
+
+
+def journal_path(project_id: str, key_text: str) -> Path:
+    """
+    Journal file of an upload run.
+
+    Runs are identified by project and keys file content, so rerunning the
+    same upload finds the journal of the interrupted one.
+    """
+    keys_hash = hashlib.sha256(key_text.encode("utf-8")).hexdigest()[:KEYS_HASH_LENGTH]
+    return get_config_dir() / JOURNAL_DIR / f"{project_id}-{keys_hash}{JOURNAL_SUFFIX}"
+
+
+def _apply(state: JournalState, record: dict) -> None:
+    """Replay one journal record into the state."""
+    kind = record.get("type")
+    if kind == RECORD_BATCH:
+        for locale, values in record["translations"].items():
+            state.translations.setdefault(locale, {}).update(values)
+        return
+    if kind == RECORD_KEY:
+        state.string_ids[record["identifier"]] = record["string_id"]
+        return
+    if kind == RECORD_POSTED:
+        state.posted.add((record["string_id"], record["locale"]))
+
+
+def _parse_record(line: str) -> dict | None:
+    """Parse a journal line; a line torn by a crash is ignored."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def read_journal(path: Path) -> JournalState:
+    """
+    Replay a journal file.
+
+    Returns:
+        State of the recorded run (empty if the file does not exist)
+    """
+    state = JournalState()
+    if not path.exists():
+        return state
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            record = _parse_record(line)
+            if record is not None:
+                _apply(state, record)
+    return state
+
+
+class UploadJournal:
+    """
+    Thread-safe, append-only journal of one upload run.
+
+    With resume=True the records of an existing journal are loaded into
+    ``state``. With resume=False the run starts fresh, and an existing journal
+    (left by an interrupted run) is not overwritten.
+
+    Raises:
+        UnfinishedJournalError: If resume is False and the journal has records
+    """
+
+    def __init__(self, path: Path, resume: bool = False):
+        if not resume and path.exists() and path.stat().st_size:
+            raise UnfinishedJournalError(
+                f"An interrupted upload of these keys left a journal at {path}; "
+                "resume it, or delete the file to start over"
+            )
+        self.path = path
+        self.state = read_journal(path) if resume else JournalState()
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("a" if resume else "w", encoding="utf-8")
+
+    def _append(self, record: dict) -> None:
+        """Write a record and force it to disk before the caller continues."""
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            _apply(self.state, record)
+
+    def record_batch(self, translations: dict[str, dict[str, str]]) -> None:
+        """Record the translations of a completed Gemini batch."""
+        self._append({"type": RECORD_BATCH, "translations": translations})
+
+    def record_key(self, identifier: str, string_id: int) -> None:
+        """Record a created Crowdin string."""
+        self._append({"type": RECORD_KEY, "identifier": identifier, "string_id": string_id})
+
+    def record_posted(self, string_id: int, locale: str) -> None:
+        """Record a posted translation."""
+        self._append({"type": RECORD_POSTED, "string_id": string_id, "locale": locale})
+
+    def string_id(self, identifier: str) -> int | None:
+        """Crowdin ID of a key created by this or a previous run."""
+        return self.state.string_ids.get(identifier)
+
+    def is_posted(self, string_id: int, locale: str) -> bool:
+        """True if the translation was already posted."""
+        return (string_id, locale) in self.state.posted
+
+    def cached_translations(self, identifiers: list[str]) -> dict[str, dict[str, str]]:
+        """Recorded translations of the given identifiers, by locale."""
+        wanted = set(identifiers)
+        return {
+            locale: {key: text for key, text in values.items() if key in wanted}
+            for locale, values in self.state.translations.items()
+        }
+
+    def close(self) -> None:
+        """Close the journal file, keeping it for a later resume (safe to call twice)."""
+        self._file.close()
+
+    def discard(self) -> None:
+        """Close and delete the journal after a completed run."""
+        self.close()
+        self.path.unlink()
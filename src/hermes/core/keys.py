@@ -0,0 +1,126 @@
+"""Parsing and normalization of the keys file that lists strings to translate."""
+
+import re
+import unicodedata
+from collections.abc import Collection
+from dataclasses import dataclass, field
+
+IDENTIFIER_PREFIX = "__"
+
+NORMALIZATION_FORM = "NFKC"
+PUNCTUATION_CATEGORY = "P"
+
+# Whitespace before or after a non-ASCII character carries no meaning in CJK text
+WIDE_SPACE_PATTERN = re.compile(r"\s+(?=[^\x00-\x7f])|(?<=[^\x00-\x7f])\s+")
+
+
+def parse_keys(key_text: str) -> list[str]:
+    """
+    Split keys file content into individual keys.
+
+    Each non-blank line is one key; commas and other punctuation are part of
+    the key, so sentences are translated whole.
+
+    Args:
+        key_text: Raw content of the keys file
+
+    Returns:
+        Keys in file order, with surrounding whitespace removed
+    """
+    return [line.strip() for line in key_text.splitlines() if line.strip()]
+
+
+def to_identifier(key: str) -> str:
+    """Convert a key to its Crowdin string identifier ("__" + source text)."""
+    return f"{IDENTIFIER_PREFIX}{key}"
+
+
+def from_identifier(identifier: str) -> str:
+    """Convert a Crowdin string identifier back to its source text."""
+    return identifier.removeprefix(IDENTIFIER_PREFIX)
+
+
+def normalize_key(key: str) -> str:
+    """
+    Normalize a key for duplicate detection.
+
+    Applies NFKC (full-width -> half-width), drops punctuation, removes
+    whitespace next to non-ASCII (e.g. CJK) characters and collapses the rest,
+    so keys differing only in those compare equal.
+    """
+    folded = unicodedata.normalize(NORMALIZATION_FORM, key)
+    without_punctuation = "".join(
+        char for char in folded if not unicodedata.category(char).startswith(PUNCTUATION_CATEGORY)
+    )
+    compact = WIDE_SPACE_PATTERN.sub("", without_punctuation)
+    return " ".join(compact.split())
+
+
+@dataclass
+class KeyPlan:
+    """Keys to translate after deduplication, and how to map results back."""
+
+    # Keys sent to Gemini; variants maps each of them to all original spellings
+    keys: list[str] = field(default_factory=list)
+    variants: dict[str, list[str]] = field(default_factory=dict)
+    existing: list[str] = field(default_factory=list)
+    duplicates: int = 0
+
+    @property
+    def identifiers(self) -> list[str]:
+        """Identifiers of every original (non-existing) key, grouped by translated key."""
+        return [to_identifier(variant) for key in self.keys for variant in self.variants[key]]
+
+
+def plan_keys(keys: list[str], existing_identifiers: Collection[str]) -> KeyPlan:
+    """
+    Deduplicate keys before translation.
+
+    Keys whose identifier already exists are dropped. Exact duplicates are
+    collapsed, and variants differing only in whitespace or punctuation are
+    translated once, through their first occurrence.
+
+    Args:
+        keys: Parsed keys in file order
+        existing_identifiers: Identifiers already present in Crowdin
+
+    Returns:
+        Plan with the keys to translate and their variants
+    """
+    plan = KeyPlan()
+    canonical: dict[str, str] = {}
+
+    for key in keys:
+        if to_identifier(key) in existing_identifiers:
+            plan.existing.append(key)
+            continue
+        first = canonical.setdefault(normalize_key(key), key)
+        variants = plan.variants.setdefault(first, [])
+        if not variants:
+            plan.keys.append(key)
+        if key not in variants:
+            variants.append(key)
+
+    plan.duplicates = len(keys) - len(plan.existing) - len(plan.keys)
+    return plan
+
+
+def fan_out(
+    translations: dict[str, dict[str, str]],
+    plan: KeyPlan,
+) -> dict[str, dict[str, str]]:
+    """
+    Copy each translated key's results to all of its variants.
+
+    Returns:
+        Translations by locale, keyed by every original identifier
+    """
+    expanded = {}
+    for locale, values in translations.items():
+        expanded[locale] = {
+            to_identifier(variant): values[to_identifier(key)]
+            for key, variants in plan.variants.items()
+            if to_identifier(key) in values
+            for variant in variants
+        }
+    return expanded
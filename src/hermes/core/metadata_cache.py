@@ -0,0 +1,125 @@
+"""Persistent cache of Crowdin project metadata (languages, files, project info).
+
+Metadata rarely changes, so it is kept on disk per project and reused for
+METADATA_TTL_SECONDS without any request. After that it is revalidated with
+the ETag Crowdin returned, so an unchanged entry costs one 304 response.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .config import get_config_dir
+
+# Entries younger than this are used without contacting Crowdin
+METADATA_TTL_SECONDS = 24 * 60 * 60
+
+CACHE_DIR = "cache"
+CACHE_FILE_TEMPLATE = "crowdin-{project_id}.json"
+URL_HASH_LENGTH = 8
+
+
+def metadata_cache_path(project_id: str, api_url: str | None = None) -> Path:
+    """
+    Cache file of a Crowdin project.
+
+    Projects served from another API root (e.g. the bench mock server) get
+    their own file, so their metadata never mixes with the real project's.
+    """
+    name = project_id
+    if api_url:
+        url_hash = hashlib.sha256(api_url.encode("utf-8")).hexdigest()[:URL_HASH_LENGTH]
+        name = f"{project_id}-{url_hash}"
+    return get_config_dir() / CACHE_DIR / CACHE_FILE_TEMPLATE.format(project_id=name)
+
+
+def _read_entries(path: Path) -> dict[str, dict]:
+    """Read cache entries from disk, returning an empty dict on failure."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_entries(path: Path, entries: dict[str, dict]) -> None:
+    """Write cache entries atomically; a failed write only costs a refetch later."""
+    temp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with temp_path.open("w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False)
+        temp_path.replace(path)
+    except OSError:
+        return
+
+
+class MetadataCache:
+    """Thread-safe, disk-backed metadata entries with TTL and ETag."""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float = METADATA_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = _read_entries(path)
+        self._lock = threading.Lock()
+
+    def fresh(self, name: str) -> Any | None:
+        """Cached value if it is still within the TTL, else None."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or self._clock() - entry["fetched_at"] > self.ttl_seconds:
+                return None
+            return entry["value"]
+
+    def etag(self, name: str) -> str | None:
+        """ETag of the cached value, for revalidation."""
+        with self._lock:
+            return self._entries.get(name, {}).get("etag")
+
+    def revalidated(self, name: str) -> Any | None:
+        """Mark an entry as confirmed unchanged (HTTP 304) and return its value."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            entry["fetched_at"] = self._clock()
+            _write_entries(self.path, self._entries)
+            return entry["value"]
+
+    def store(self, name: str, value: Any, etag: str | None = None) -> None:
+        """Store a freshly fetched value."""
+        with self._lock:
+            self._entries[name] = {"value": value, "etag": etag, "fetched_at": self._clock()}
+            _write_entries(self.path, self._entries)
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop one entry, or every entry when name is None."""
+        with self._lock:
+            names = list(self._entries) if name is None else [name]
+            for entry_name in names:
+                self._entries.pop(entry_name, None)
+            _write_entries(self.path, self._entries)
+
+
+_caches: dict[Path, MetadataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_metadata_cache(project_id: str, api_url: str | None = None) -> MetadataCache:
+    """Get the metadata cache of a project, shared by every client in the process."""
+    path = metadata_cache_path(project_id, api_url)
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = MetadataCache(path)
+        return _caches[path]
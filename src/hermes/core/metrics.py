@@ -0,0 +1,274 @@
+"""Run metrics exported as a Prometheus textfile and as JSON.
+
+Counters and gauges are collected for the whole process (request counts and
+time per endpoint, bytes downloaded, build wait, Gemini tokens, retries,
+output sizes, uploaded keys and translations). At the end of a ``download``
+or ``upload`` run the CLI writes them to a metrics directory, e.g. the
+directory of the node_exporter textfile collector.
+
+While a run is going, the requests in flight and how far each stage is are
+kept as gauges, so the TUI dashboard can derive live rates and ETAs from the
+same registry.
+"""
+
+import functools
+import json
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+COUNTER = "counter"
+GAUGE = "gauge"
+
+SERVICE_CROWDIN = "crowdin"
+SERVICE_GEMINI = "gemini"
+
+# Stages of a download; the upload pipeline adds its own (see upload_pipeline)
+STAGE_BUILD = "build"
+STAGE_DOWNLOAD = "download"
+STAGE_EXTRACT = "extract"
+STAGE_PROCESS = "process"
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class MetricInfo:
+    """Type and help text of a metric family."""
+
+    kind: str
+    help: str
+
+
+METRICS: dict[str, MetricInfo] = {
+    "hermes_run_success": MetricInfo(GAUGE, "1 if the run finished without error, else 0"),
+    "hermes_run_duration_seconds": MetricInfo(GAUGE, "Wall-clock duration of the run"),
+    "hermes_run_timestamp_seconds": MetricInfo(GAUGE, "Unix time the run finished"),
+    "hermes_http_requests_total": MetricInfo(
+        COUNTER, "HTTP requests by service, endpoint and status"
+    ),
+    "hermes_http_request_seconds_total": MetricInfo(
+        COUNTER, "Time spent in HTTP requests by service and endpoint"
+    ),
+    "hermes_http_requests_in_flight": MetricInfo(GAUGE, "HTTP requests in flight by service"),
+    "hermes_crowdin_gets_total": MetricInfo(
+        COUNTER, "Crowdin GETs by how they were answered (network, coalesced, not_modified)"
+    ),
+    "hermes_download_bytes_total": MetricInfo(COUNTER, "Bytes of build archives downloaded"),
+    "hermes_build_wait_seconds_total": MetricInfo(COUNTER, "Time spent waiting for builds"),
+    "hermes_gemini_requests_total": MetricInfo(COUNTER, "Gemini requests by model and outcome"),
+    "hermes_gemini_tokens_total": MetricInfo(COUNTER, "Gemini tokens used by model"),
+    "hermes_retries_total": MetricInfo(COUNTER, "Retried requests by reason"),
+    "hermes_output_bytes": MetricInfo(GAUGE, "Size of each generated resource file by language"),
+    "hermes_upload_keys_total": MetricInfo(COUNTER, "Keys sent to Crowdin by result"),
+    "hermes_upload_translations_total": MetricInfo(
+        COUNTER, "Translations sent to Crowdin by language and result"
+    ),
+    "hermes_stage_done": MetricInfo(GAUGE, "Work done per stage (items, bytes or percent)"),
+    "hermes_stage_total": MetricInfo(GAUGE, "Work to do per stage, in the unit of stage_done"),
+}
+
+# Characters not allowed in metrics file names
+UNSAFE_FILE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Current value of one labelled series."""
+
+    name: str
+    labels: Labels
+    value: float
+
+
+def _labels(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _series_key(name: str, labels: dict[str, Any]) -> tuple[str, Labels]:
+    """Key of a series; metric names must be declared in METRICS."""
+    if name not in METRICS:
+        raise KeyError(f"Unknown metric: {name}")
+    return name, _labels(labels)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class RunMetrics:
+    """Thread-safe registry of labelled counters and gauges."""
+
+    def __init__(self):
+        self._values: dict[tuple[str, Labels], float] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Forget every value, e.g. at the start of a run."""
+        with self._lock:
+            self._values = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """
+        Add value to a counter.
+
+        Raises:
+            KeyError: If the metric is not declared in METRICS
+        """
+        key = _series_key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        """
+        Set a gauge.
+
+        Raises:
+            KeyError: If the metric is not declared in METRICS
+        """
+        key = _series_key(name, labels)
+        with self._lock:
+            self._values[key] = value
+
+    def observe_request(self, service: str, endpoint: str, status: Any, seconds: float) -> None:
+        """Count a request and the time it took."""
+        self.inc("hermes_http_requests_total", service=service, endpoint=endpoint, status=status)
+        self.inc("hermes_http_request_seconds_total", seconds, service=service, endpoint=endpoint)
+
+    @contextmanager
+    def in_flight(self, service: str) -> Iterator[None]:
+        """Count a request as in flight while the block runs."""
+        self.inc("hermes_http_requests_in_flight", service=service)
+        try:
+            yield
+        finally:
+            self.inc("hermes_http_requests_in_flight", -1, service=service)
+
+    def stage_progress(self, stage: str, done: float, total: float) -> None:
+        """Record how far a stage is, for live rates and ETAs."""
+        self.set("hermes_stage_done", done, stage=stage)
+        self.set("hermes_stage_total", total, stage=stage)
+
+    def samples(self, common: dict[str, Any] | None = None) -> list[Sample]:
+        """Every series, ordered by name and labels, with common labels added."""
+        extra = dict(common or {})
+        with self._lock:
+            items = list(self._values.items())
+        samples = [
+            Sample(name, _labels({**extra, **dict(labels)}), value)
+            for (name, labels), value in items
+        ]
+        return sorted(samples, key=lambda sample: (sample.name, sample.labels))
+
+    def to_prometheus(self, common: dict[str, Any] | None = None) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = []
+        current = None
+        for sample in self.samples(common):
+            if sample.name != current:
+                current = sample.name
+                info = METRICS[sample.name]
+                lines.append(f"# HELP {sample.name} {info.help}")
+                lines.append(f"# TYPE {sample.name} {info.kind}")
+            lines.append(
+                f"{sample.name}{_format_labels(sample.labels)} {_format_value(sample.value)}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self, common: dict[str, Any] | None = None) -> dict[str, Any]:
+        """The metrics as JSON-serializable series grouped by metric name."""
+        metrics: dict[str, Any] = {}
+        for sample in self.samples(common):
+            family = metrics.setdefault(
+                sample.name,
+                {
+                    "type": METRICS[sample.name].kind,
+                    "help": METRICS[sample.name].help,
+                    "series": [],
+                },
+            )
+            family["series"].append({"labels": dict(sample.labels), "value": sample.value})
+        return {"labels": {k: str(v) for k, v in (common or {}).items()}, "metrics": metrics}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write via a temporary file so collectors never read a partial file."""
+    temp_path = path.with_name(f"{path.name}.tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    temp_path.replace(path)
+
+
+def metrics_file_stem(command: str, profile: str) -> str:
+    """File name (without extension) of a run's metrics, e.g. "hermes_upload_default"."""
+    return UNSAFE_FILE_CHARS.sub("_", f"hermes_{command}_{profile}")
+
+
+def write_metrics(
+    metrics: RunMetrics, directory: str, command: str, common: dict[str, Any]
+) -> tuple[Path, Path]:
+    """
+    Write <stem>.prom and <stem>.json into directory.
+
+    Args:
+        metrics: Collected metrics
+        directory: Output directory (created if missing)
+        command: CLI command of the run, added as a label and part of the file name
+        common: Labels added to every series; "profile" is part of the file name
+
+    Returns:
+        Paths of the Prometheus and JSON files
+
+    Raises:
+        OSError: If the files cannot be written
+    """
+    labels = {"command": command, **common}
+    target = Path(directory)
+    target.mkdir(parents=True, exist_ok=True)
+    stem = metrics_file_stem(command, str(common.get("profile", "")))
+    prom_path, json_path = target / f"{stem}.prom", target / f"{stem}.json"
+    _write_atomic(prom_path, metrics.to_prometheus(labels))
+    _write_atomic(json_path, json.dumps(metrics.to_dict(labels), ensure_ascii=False, indent=2))
+    return prom_path, json_path
+
+
+_metrics = RunMetrics()
+
+
+def get_metrics() -> RunMetrics:
+    """Get the process-wide metrics registry."""
+    return _metrics
+
+
+def metered(name: str) -> Callable[[F], F]:
+    """Decorator adding the duration of each call of a function to a seconds counter."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _metrics.inc(name, time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
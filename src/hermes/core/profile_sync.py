@@ -0,0 +1,164 @@
+"""Concurrent download of several profiles' translations.
+
+Each profile runs the usual build → download → extract → process pipeline in
+its own worker, with its own archive file and data/result directories. A
+global limit bounds how many profiles run at once, and one rate governor
+spreads the Crowdin request budget over all of them. A failing profile is
+reported in its result and does not stop the others.
+"""
+
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .cancellation import CancelToken, OperationCancelled
+from .crowdin_api import CrowdinAPI
+from .file_operations import extract_and_replace_files, process_language_files
+from .rate_limit import RateGovernor
+
+# Profiles downloaded at the same time unless the caller sets a limit
+DEFAULT_MAX_PARALLEL = 4
+
+ARCHIVE_NAME = "translations.zip"
+
+# Receives (profile, status, percent) as a profile's download advances
+SyncProgress = Callable[[str, str, float], None]
+
+
+@dataclass
+class ProfileJob:
+    """What one profile downloads and where its files go."""
+
+    profile: str
+    api_token: str
+    project_id: str
+    data_path: str
+    result_path: str
+    api_url: str | None = None
+
+
+@dataclass
+class ProfileResult:
+    """Outcome of one profile's download."""
+
+    profile: str
+    project_id: str
+    languages: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+    error: str = ""
+    cancelled: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.error and not self.cancelled
+
+
+def _contains(parent: str, child: str) -> bool:
+    """True if child is parent or a path below it."""
+    parent_path, child_path = Path(parent).resolve(), Path(child).resolve()
+    return child_path == parent_path or parent_path in child_path.parents
+
+
+def find_shared_paths(jobs: list[ProfileJob]) -> list[tuple[str, str, str]]:
+    """
+    Find directories that two profiles would both write to.
+
+    Extraction replaces the whole data directory and processing rewrites the
+    result directory, so two profiles must not share (or nest) either one.
+
+    Returns:
+        (profile, other profile, path) for every overlap found
+    """
+    shared = []
+    for index, job in enumerate(jobs):
+        for other in jobs[index + 1 :]:
+            for path in (job.data_path, job.result_path):
+                for other_path in (other.data_path, other.result_path):
+                    if _contains(path, other_path) or _contains(other_path, path):
+                        shared.append((job.profile, other.profile, path))
+    return shared
+
+
+def download_profile(
+    job: ProfileJob,
+    governor: RateGovernor | None = None,
+    progress: SyncProgress | None = None,
+    cancel: CancelToken | None = None,
+) -> list[str]:
+    """
+    Build, download, extract and process one profile's latest translations.
+
+    The archive is written to a temporary directory of its own, so profiles
+    running at the same time never share a file.
+
+    Returns:
+        Processed language codes
+
+    Raises:
+        CrowdinError: If a Crowdin request fails
+        OperationCancelled: If cancel was cancelled
+    """
+    cancel = cancel or CancelToken()
+
+    def report(status: str, percent: float) -> None:
+        if progress:
+            progress(job.profile, status, percent)
+
+    api = CrowdinAPI(job.api_token, job.project_id, api_url=job.api_url, rate_governor=governor)
+    report("Initiating build...", 10)
+    build_id = api.initiate_build()
+    report("Building...", 20)
+    api.check_build_status(build_id, cancel=cancel)
+    with tempfile.TemporaryDirectory(prefix="hermes-") as archive_dir:
+        report("Downloading...", 50)
+        zip_path = api.download_build(
+            build_id, save_path=str(Path(archive_dir) / ARCHIVE_NAME), cancel=cancel
+        )
+        report("Extracting...", 70)
+        extract_and_replace_files(zip_path, job.data_path, cancel=cancel)
+    report("Processing...", 85)
+    languages = process_language_files(job.data_path, job.result_path, cancel=cancel)
+    report("Complete!", 100)
+    return languages
+
+
+def sync_profiles(
+    jobs: list[ProfileJob],
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    governor: RateGovernor | None = None,
+    progress: SyncProgress | None = None,
+    cancel: CancelToken | None = None,
+) -> list[ProfileResult]:
+    """
+    Download several profiles concurrently.
+
+    Args:
+        jobs: Profiles to download; their paths must not overlap (see find_shared_paths)
+        max_parallel: Profiles downloading at the same time (at least 1)
+        governor: Rate governor shared by every profile's Crowdin requests
+        progress: Optional callback receiving (profile, status, percent)
+        cancel: Optional token stopping every profile
+
+    Returns:
+        One result per job, in the order of jobs
+    """
+    cancel = cancel or CancelToken()
+
+    def run(job: ProfileJob) -> ProfileResult:
+        result = ProfileResult(profile=job.profile, project_id=job.project_id)
+        start = time.perf_counter()
+        try:
+            cancel.raise_if_cancelled()
+            result.languages = download_profile(job, governor, progress, cancel)
+        except OperationCancelled:
+            result.cancelled = True
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+        result.seconds = time.perf_counter() - start
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, max_parallel)) as executor:
+        return list(executor.map(run, jobs))
@@ -0,0 +1,217 @@
+"""Sampling CPU profiler and tracemalloc snapshots per stage.
+
+While active, a background thread samples the stacks of all busy threads
+every few milliseconds. Each sample is prefixed with the stages (timing spans of
+the ``stage`` category) open on its thread, so a flame graph groups the time
+by stage. At the end of each stage a tracemalloc snapshot records the top
+allocations and the growth since the previous snapshot (e.g. after the build
+download, after extraction, while a language's JSON is loaded and while a
+Gemini response is parsed).
+
+``write()`` saves ``cpu.folded`` (collapsed stacks, for flamegraph.pl,
+speedscope or inferno) and ``allocations.txt``.
+"""
+
+import functools
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FrameType
+
+from .throughput import format_bytes
+from .timing import CATEGORY_STAGE, SPAN_START, get_timings
+
+DEFAULT_SAMPLE_INTERVAL = 0.01
+
+# Threads parked here are idle (e.g. pool workers waiting for work) and not sampled
+IDLE_FILE = threading.__file__
+IDLE_FUNCTIONS = frozenset(("wait", "_wait_for_tstate_lock"))
+
+# Allocation sites listed per snapshot
+TOP_ALLOCATIONS = 15
+
+# Snapshots walk every live allocation, so a repeated stage (e.g. one per
+# language) is only snapshotted this often
+MAX_SNAPSHOTS_PER_STAGE = 1
+
+FOLDED_FILE = "cpu.folded"
+ALLOCATIONS_FILE = "allocations.txt"
+
+NO_STAGE = "(no stage)"
+
+# Allocation sites of the profiler and tracing machinery, left out of the reports
+IGNORED_FILES = frozenset(
+    (__file__, tracemalloc.__file__, "<frozen importlib._bootstrap>", "<unknown>")
+)
+
+
+@functools.cache
+def _code_name(code: CodeType) -> str:
+    """Flame graph frame: qualified function name and its file (last two path parts)."""
+    path = "/".join(code.co_filename.replace("\\", "/").split("/")[-2:])
+    return f"{code.co_qualname} ({path}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None) -> list[str]:
+    """Frames of a stack, outermost first."""
+    names = []
+    while frame is not None:
+        names.append(_code_name(frame.f_code))
+        frame = frame.f_back
+    return names[::-1]
+
+
+def _is_idle(frame: FrameType) -> bool:
+    code = frame.f_code
+    return code.co_filename == IDLE_FILE and code.co_name in IDLE_FUNCTIONS
+
+
+def _top_statistics(
+    statistics: list[tracemalloc.StatisticDiff] | list[tracemalloc.Statistic],
+) -> list[str]:
+    """The largest allocation sites, excluding the tracing machinery."""
+    kept = [stat for stat in statistics if stat.traceback[0].filename not in IGNORED_FILES]
+    return [str(stat) for stat in kept[:TOP_ALLOCATIONS]]
+
+
+@dataclass
+class MemoryCheckpoint:
+    """Memory at the end of a stage."""
+
+    label: str
+    current: int
+    peak: int
+    top: list[str] = field(default_factory=list)
+    growth: list[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        lines = [
+            f"== {self.label}: {format_bytes(self.current)} traced, "
+            f"peak {format_bytes(self.peak)} since the previous checkpoint ==",
+            "Top allocations:",
+            *(f"  {line}" for line in self.top),
+        ]
+        if self.growth:
+            lines += [
+                "Growth since the previous checkpoint:",
+                *(f"  {line}" for line in self.growth),
+            ]
+        return "\n".join(lines)
+
+
+class StageProfiler:
+    """Samples CPU stacks per stage and snapshots memory at stage ends."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self.checkpoints: list[MemoryCheckpoint] = []
+        self._stages: dict[int, list[str]] = {}
+        self._snapshot_counts: Counter[str] = Counter()
+        self._previous: tracemalloc.Snapshot | None = None
+        self._owns_timings = False
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="hermes-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start sampling and tracing; stage spans are recorded from now on."""
+        tracemalloc.start()
+        timings = get_timings()
+        self._owns_timings = not timings.enabled
+        if self._owns_timings:
+            timings.start()
+        timings.add_listener(self._on_span)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop sampling and tracing."""
+        timings = get_timings()
+        timings.remove_listener(self._on_span)
+        if self._owns_timings:
+            timings.stop()
+        self._stop.set()
+        self._sampler.join()
+        tracemalloc.stop()
+
+    def _on_span(self, event: str, name: str, category: str) -> None:
+        """Track the open stages of each thread; snapshot memory when one ends."""
+        if category != CATEGORY_STAGE:
+            return
+        thread_id = threading.get_ident()
+        with self._lock:
+            stages = self._stages.setdefault(thread_id, [])
+            if event == SPAN_START:
+                stages.append(name)
+                return
+            if stages:
+                stages.pop()
+        self._checkpoint(f"after {name}")
+
+    def _sample_loop(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self._sample(own_id)
+
+    def _sample(self, own_id: int) -> None:
+        """Count the current stack of every other thread, prefixed with its open stages."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id or _is_idle(frame):
+                continue
+            with self._lock:
+                stages = list(self._stages.get(thread_id) or [NO_STAGE])
+            thread = names.get(thread_id, str(thread_id))
+            self.samples[";".join([*stages, thread, *_stack(frame)])] += 1
+
+    def _checkpoint(self, label: str) -> None:
+        """Snapshot memory, at most MAX_SNAPSHOTS_PER_STAGE times per label."""
+        with self._snapshot_lock:
+            self._snapshot_counts[label] += 1
+            if self._snapshot_counts[label] > MAX_SNAPSHOTS_PER_STAGE:
+                return
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            snapshot = tracemalloc.take_snapshot()
+            checkpoint = MemoryCheckpoint(
+                label=label,
+                current=current,
+                peak=peak,
+                top=_top_statistics(snapshot.statistics("lineno")),
+            )
+            if self._previous is not None:
+                growth = snapshot.compare_to(self._previous, "lineno")
+                checkpoint.growth = _top_statistics([stat for stat in growth if stat.size_diff > 0])
+            self._previous = snapshot
+            self.checkpoints.append(checkpoint)
+
+    def folded(self) -> str:
+        """Collapsed stacks: one "frame;frame;... count" line per distinct stack."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+
+    def allocations_report(self) -> str:
+        return "\n\n".join(checkpoint.render() for checkpoint in self.checkpoints) + "\n"
+
+    def write(self, directory: str) -> tuple[Path, Path]:
+        """
+        Write the flame graph input and the allocations report.
+
+        Returns:
+            Paths of the folded stacks and the allocations report
+
+        Raises:
+            OSError: If the files cannot be written
+        """
+        target = Path(directory)
+        target.mkdir(parents=True, exist_ok=True)
+        folded_path = target / FOLDED_FILE
+        allocations_path = target / ALLOCATIONS_FILE
+        folded_path.write_text(self.folded(), encoding="utf-8")
+        allocations_path.write_text(self.allocations_report(), encoding="utf-8")
+        return folded_path, allocations_path
@@ -0,0 +1,157 @@
+"""Throttled, coalesced progress events for the CLI and the TUI.
+
+Downloads, uploads and the pipeline report progress as typed events (log
+lines, status text, percent done) as often as they like. The bus keeps every
+log line but only the latest status and percent, and hands the pending events
+to the UI as one batch at most ``max_rate`` times per second. The UI then does
+the same amount of work for ten keys as for a hundred thousand.
+
+The first event after a quiet period is delivered at once on the emitting
+thread; later ones are delivered by a timer thread at the end of the interval,
+so a sink must not assume it runs on the UI thread.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+
+from .config import DEFAULT_MAX_RATE
+
+
+@dataclass(frozen=True)
+class LogLine:
+    """A line for the log (never coalesced)."""
+
+    message: str
+
+
+@dataclass(frozen=True)
+class Status:
+    """Status text; only the latest one is delivered."""
+
+    text: str
+
+
+@dataclass(frozen=True)
+class Percent:
+    """Overall progress from 0 to 100; only the latest one is delivered."""
+
+    completed: float
+
+
+ProgressEvent = LogLine | Status | Percent
+BatchSink = Callable[[list[ProgressEvent]], None]
+
+
+@dataclass
+class ProgressBatch:
+    """A batch reduced to what a UI applies: new log lines, latest status and percent."""
+
+    lines: list[str] = field(default_factory=list)
+    status: str | None = None
+    percent: float | None = None
+
+
+def summarize(events: list[ProgressEvent]) -> ProgressBatch:
+    """Collapse events into every log line plus the last status and the last percent."""
+    batch = ProgressBatch()
+    for event in events:
+        if isinstance(event, LogLine):
+            batch.lines.append(event.message)
+        elif isinstance(event, Status):
+            batch.status = event.text
+        else:
+            batch.percent = event.completed
+    return batch
+
+
+def _coalesce_key(event: ProgressEvent) -> Hashable | None:
+    """Events with the same key replace each other; None keeps every event."""
+    if isinstance(event, LogLine):
+        return None
+    return type(event)
+
+
+class ProgressBus:
+    """Collects progress events from any thread and delivers them in throttled batches."""
+
+    def __init__(self, sink: BatchSink, max_rate: float = DEFAULT_MAX_RATE):
+        """
+        Args:
+            sink: Receives each batch, in order, from the emitting or the timer thread
+            max_rate: Batches per second at most (0 = deliver every event at once)
+        """
+        self._sink = sink
+        self._interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        # Replaced events leave a None behind, so coalescing never shifts the list
+        self._pending: list[ProgressEvent | None] = []
+        self._slots: dict[Hashable, int] = {}
+        self._last_delivery = float("-inf")
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        self._delivery_lock = threading.Lock()
+
+    def __enter__(self) -> "ProgressBus":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    def emit(self, event: ProgressEvent) -> None:
+        """Queue an event; delivers now if the last batch is at least one interval old."""
+        with self._lock:
+            self._add(event)
+            delay = self._last_delivery + self._interval - time.monotonic()
+            if delay > 0:
+                self._schedule(delay)
+                return
+        self.flush()
+
+    def log(self, message: str) -> None:
+        self.emit(LogLine(message))
+
+    def update(self, status: str | None = None, percent: float | None = None) -> None:
+        """Set the status text and/or the percent done."""
+        if status is not None:
+            self.emit(Status(status))
+        if percent is not None:
+            self.emit(Percent(percent))
+
+    def scaled(self, start: float, end: float) -> Callable[[float], None]:
+        """Callback mapping a step's own 0-100 progress onto start-end of the overall bar."""
+        return lambda percent: self.emit(Percent(start + (end - start) * percent / 100))
+
+    def flush(self) -> None:
+        """Deliver the pending events now, e.g. before the UI shows a final result."""
+        with self._delivery_lock:
+            events = self._take()
+            if events:
+                self._sink(events)
+
+    def _add(self, event: ProgressEvent) -> None:
+        key = _coalesce_key(event)
+        if key is not None:
+            slot = self._slots.get(key)
+            if slot is not None:
+                self._pending[slot] = None
+            self._slots[key] = len(self._pending)
+        self._pending.append(event)
+
+    def _schedule(self, delay: float) -> None:
+        if self._timer is not None:
+            return
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _take(self) -> list[ProgressEvent]:
+        with self._lock:
+            events = [event for event in self._pending if event is not None]
+            self._pending = []
+            self._slots = {}
+            self._last_delivery = time.monotonic()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return events
@@ -0,0 +1,107 @@
+"""Gemini context caching for the static system prompt."""
+
+import hashlib
+import threading
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+# Lifetime of a cache created by Hermes; reuse across runs within this window
+CACHE_TTL_SECONDS = 3600
+
+CACHE_DISPLAY_PREFIX = "hermes-prompt-"
+PROMPT_HASH_LENGTH = 16
+MODEL_PATH_PREFIX = "models/"
+
+
+def prompt_hash(prompt: str) -> str:
+    """Short, stable hash identifying a system prompt."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:PROMPT_HASH_LENGTH]
+
+
+def cache_display_name(prompt: str) -> str:
+    """Display name of the cache holding this prompt."""
+    return f"{CACHE_DISPLAY_PREFIX}{prompt_hash(prompt)}"
+
+
+def _same_model(cached_model: str | None, model: str) -> bool:
+    """Compare model names with or without the "models/" prefix."""
+    if not cached_model:
+        return False
+    return cached_model.removeprefix(MODEL_PATH_PREFIX) == model.removeprefix(MODEL_PATH_PREFIX)
+
+
+def _is_live(cache: Any, now: datetime) -> bool:
+    """True if a cache entry has not expired yet."""
+    expire_time = getattr(cache, "expire_time", None)
+    return expire_time is None or expire_time > now
+
+
+class PromptCache:
+    """
+    Gemini context caches for system prompts, keyed by prompt hash.
+
+    A cache is looked up by display name (so caches from previous runs are
+    reused), created on a miss, and remembered for the rest of the run. If the
+    service refuses to cache a prompt (e.g. it is below the minimum size),
+    callers fall back to sending the prompt as a plain system instruction.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        ttl_seconds: int = CACHE_TTL_SECONDS,
+        log_callback: Callable[[str], None] | None = None,
+    ):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.log = log_callback or print
+        self._names: dict[tuple[str, str], str | None] = {}
+        self._lock = threading.Lock()
+
+    def get(self, prompt: str, model: str) -> str | None:
+        """
+        Get the cache name for a prompt, creating the cache if needed.
+
+        Caches are model-specific, so each (prompt, model) pair has its own.
+
+        Returns:
+            Cache name to pass as ``cached_content``, or None if caching is unavailable
+        """
+        key = (prompt_hash(prompt), model)
+        with self._lock:
+            if key not in self._names:
+                self._names[key] = self._find(prompt, model) or self._create(prompt, model)
+            return self._names[key]
+
+    def _find(self, prompt: str, model: str) -> str | None:
+        """Find a live cache for this prompt and model."""
+        display_name = cache_display_name(prompt)
+        now = datetime.now(UTC)
+        try:
+            for cache in self.client.caches.list():
+                if (
+                    cache.display_name == display_name
+                    and _same_model(cache.model, model)
+                    and _is_live(cache, now)
+                ):
+                    return cache.name
+        except Exception as e:
+            self.log(f"Warning: Could not list prompt caches: {e}")
+        return None
+
+    def _create(self, prompt: str, model: str) -> str | None:
+        """Create a cache holding the prompt as system instruction."""
+        try:
+            cache = self.client.caches.create(
+                model=model,
+                config={
+                    "system_instruction": prompt,
+                    "display_name": cache_display_name(prompt),
+                    "ttl": f"{self.ttl_seconds}s",
+                },
+            )
+        except Exception as e:
+            self.log(f"Prompt caching unavailable, sending prompt uncached: {e}")
+            return None
+        return cache.name
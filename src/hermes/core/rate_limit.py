@@ -0,0 +1,167 @@
+"""Request and token rate budgets for API calls."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .cancellation import CancelToken
+
+# Budgets are expressed per sliding window of this length
+WINDOW_SECONDS = 60.0
+
+# Exponential backoff after quota errors
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# Rough token estimate: one token per CJK/Thai character, ~4 characters per token otherwise
+CHARS_PER_TOKEN = 4
+WIDE_CHAR_START = 0x0E00
+
+
+@dataclass
+class RateStats:
+    """Counters describing how a governor throttled its callers."""
+
+    requests: int = 0
+    tokens: int = 0
+    throttled: int = 0
+    wait_seconds: float = 0.0
+    quota_errors: int = 0
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text without calling the API.
+
+    Returns:
+        Estimated number of tokens (at least 1 for non-empty text)
+    """
+    wide = sum(1 for char in text if ord(char) >= WIDE_CHAR_START)
+    narrow = len(text) - wide
+    return wide + (narrow + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Delay before retry number attempt (0-based), honoring a server-provided delay."""
+    if retry_after is not None:
+        return retry_after
+    return min(BACKOFF_BASE_SECONDS * 2**attempt, BACKOFF_MAX_SECONDS)
+
+
+class RateGovernor:
+    """
+    Thread-safe requests-per-minute / tokens-per-minute governor.
+
+    Callers acquire budget before each request and block until the sliding
+    window has room. After a quota error, backoff() pauses every caller, not
+    just the one that hit the error. A budget of 0 means unlimited.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.stats = RateStats()
+        self._clock = clock
+        self._sleep = sleep
+        self._events: deque[tuple[float, int, int]] = deque()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _purge(self, now: float) -> None:
+        """Drop events that left the window."""
+        while self._events and self._events[0][0] <= now - WINDOW_SECONDS:
+            self._events.popleft()
+
+    def _usage(self) -> tuple[int, int]:
+        """Requests and tokens used within the window."""
+        requests = sum(event[1] for event in self._events)
+        tokens = sum(event[2] for event in self._events)
+        return requests, tokens
+
+    def _fits(self, tokens: int) -> bool:
+        """True if one more request of tokens stays within both budgets."""
+        used_requests, used_tokens = self._usage()
+        if self.requests_per_minute and used_requests + 1 > self.requests_per_minute:
+            return False
+        if not self.tokens_per_minute or not self._events:
+            return True
+        return used_tokens + tokens <= self.tokens_per_minute
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds until the request may be sent (0 if it may be sent now)."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._purge(now)
+        if self._fits(tokens):
+            return 0.0
+        return self._events[0][0] + WINDOW_SECONDS - now
+
+    def acquire(self, tokens: int = 0, cancel: CancelToken | None = None) -> float:
+        """
+        Block until a request of the given token size fits the budgets.
+
+        Args:
+            tokens: Estimated tokens of the request
+            cancel: Optional token that interrupts the wait
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            OperationCancelled: If cancel was cancelled while waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                delay = self._wait_time(self._clock(), tokens)
+                if delay <= 0:
+                    self._events.append((self._clock(), 1, tokens))
+                    self._record_acquired(tokens, waited)
+                    return waited
+            if cancel is None:
+                self._sleep(delay)
+            else:
+                cancel.sleep(delay)
+            waited += delay
+
+    def _record_acquired(self, tokens: int, waited: float) -> None:
+        """Update stats for a granted request."""
+        self.stats.requests += 1
+        self.stats.tokens += tokens
+        if waited:
+            self.stats.throttled += 1
+            self.stats.wait_seconds += waited
+
+    def record_usage(self, estimated: int, actual: int) -> None:
+        """Correct the window with the real token usage reported by the API."""
+        delta = actual - estimated
+        if not delta:
+            return
+        with self._lock:
+            self._events.append((self._clock(), 0, delta))
+            self.stats.tokens += delta
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Pause all callers after a quota error.
+
+        Args:
+            attempt: 0-based retry number, for exponential backoff
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Pause length in seconds
+        """
+        delay = backoff_delay(attempt, retry_after)
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+            self.stats.quota_errors += 1
+        return delay
@@ -0,0 +1,203 @@
+"""Live throughput derived from the run metrics.
+
+The monitor samples the metrics registry (requests, bytes, tokens, stage
+progress) and turns the difference between samples into rates over a sliding
+window. A stage's ETA is its remaining work divided by its own rate, so it
+reflects what is actually moving rather than the overall progress bar.
+"""
+
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .metrics import (
+    STAGE_BUILD,
+    STAGE_DOWNLOAD,
+    STAGE_EXTRACT,
+    STAGE_PROCESS,
+    RunMetrics,
+    get_metrics,
+)
+from .upload_pipeline import STAGE_KEYS, STAGE_TRANSLATE, STAGE_TRANSLATIONS
+
+# Rates are averaged over this many seconds of samples
+DEFAULT_WINDOW_SECONDS = 5.0
+
+# Stages in the order they run; others are listed after them
+STAGE_ORDER = (
+    STAGE_BUILD,
+    STAGE_DOWNLOAD,
+    STAGE_EXTRACT,
+    STAGE_PROCESS,
+    STAGE_TRANSLATE,
+    STAGE_KEYS,
+    STAGE_TRANSLATIONS,
+)
+
+RATE_LIMITED_STATUS = "429"
+QUOTA_EXCEEDED = "quota_exceeded"
+
+
+@dataclass
+class Totals:
+    """Cumulative counters read from the metrics at one point in time."""
+
+    requests: float = 0.0
+    bytes: float = 0.0
+    tokens: float = 0.0
+    retries: float = 0.0
+    rate_limited: float = 0.0
+    in_flight: float = 0.0
+    stage_done: dict[str, float] = field(default_factory=dict)
+    stage_total: dict[str, float] = field(default_factory=dict)
+
+    def decreased_from(self, earlier: "Totals") -> bool:
+        """True if a counter went down, i.e. the metrics were reset in between."""
+        return self.requests < earlier.requests or self.bytes < earlier.bytes
+
+
+def read_totals(metrics: RunMetrics) -> Totals:
+    """Sum the series the dashboard needs over their labels."""
+    totals = Totals()
+    for sample in metrics.samples():
+        labels = dict(sample.labels)
+        if sample.name == "hermes_http_requests_total":
+            totals.requests += sample.value
+            if labels.get("status") == RATE_LIMITED_STATUS:
+                totals.rate_limited += sample.value
+        elif sample.name == "hermes_gemini_requests_total":
+            totals.requests += sample.value
+            if labels.get("outcome") == QUOTA_EXCEEDED:
+                totals.rate_limited += sample.value
+        elif sample.name == "hermes_download_bytes_total":
+            totals.bytes += sample.value
+        elif sample.name == "hermes_gemini_tokens_total":
+            totals.tokens += sample.value
+        elif sample.name == "hermes_retries_total":
+            totals.retries += sample.value
+        elif sample.name == "hermes_http_requests_in_flight":
+            totals.in_flight += sample.value
+        elif sample.name == "hermes_stage_done":
+            totals.stage_done[labels["stage"]] = sample.value
+        elif sample.name == "hermes_stage_total":
+            totals.stage_total[labels["stage"]] = sample.value
+    return totals
+
+
+@dataclass
+class StageRate:
+    """Progress, rate and ETA of one stage."""
+
+    stage: str
+    done: float
+    total: float
+    rate: float
+
+    @property
+    def finished(self) -> bool:
+        return self.total > 0 and self.done >= self.total
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Seconds until the stage finishes at its current rate (None if it is not moving)."""
+        if self.finished:
+            return 0.0
+        if self.rate <= 0 or self.total <= 0:
+            return None
+        return (self.total - self.done) / self.rate
+
+
+@dataclass
+class ThroughputSnapshot:
+    """Rates over the window and the current counts."""
+
+    requests_per_second: float = 0.0
+    bytes_per_second: float = 0.0
+    tokens_per_second: float = 0.0
+    in_flight: int = 0
+    retries: int = 0
+    rate_limited: int = 0
+    gemini_tokens: int = 0
+    stages: list[StageRate] = field(default_factory=list)
+
+
+def _stage_key(stage: str) -> tuple[int, str]:
+    if stage in STAGE_ORDER:
+        return STAGE_ORDER.index(stage), stage
+    return len(STAGE_ORDER), stage
+
+
+class ThroughputMonitor:
+    """Turns successive samples of the run metrics into rates and ETAs."""
+
+    def __init__(
+        self,
+        metrics: RunMetrics | None = None,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.metrics = metrics or get_metrics()
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._history: deque[tuple[float, Totals]] = deque()
+
+    def sample(self) -> ThroughputSnapshot:
+        """Read the metrics now and compute rates against the oldest sample in the window."""
+        now = self._clock()
+        current = read_totals(self.metrics)
+        if self._history and current.decreased_from(self._history[-1][1]):
+            self._history.clear()
+        self._history.append((now, current))
+        while len(self._history) > 2 and self._history[0][0] < now - self.window_seconds:
+            self._history.popleft()
+
+        start, oldest = self._history[0]
+        elapsed = now - start
+
+        def rate(value: float, earlier: float) -> float:
+            return max(0.0, value - earlier) / elapsed if elapsed > 0 else 0.0
+
+        stages = [
+            StageRate(
+                stage,
+                current.stage_done.get(stage, 0.0),
+                total,
+                rate(current.stage_done.get(stage, 0.0), oldest.stage_done.get(stage, 0.0)),
+            )
+            for stage, total in sorted(current.stage_total.items(), key=lambda s: _stage_key(s[0]))
+        ]
+        return ThroughputSnapshot(
+            requests_per_second=rate(current.requests, oldest.requests),
+            bytes_per_second=rate(current.bytes, oldest.bytes),
+            tokens_per_second=rate(current.tokens, oldest.tokens),
+            in_flight=max(0, int(current.in_flight)),
+            retries=int(current.retries),
+            rate_limited=int(current.rate_limited),
+            gemini_tokens=int(current.tokens),
+            stages=stages,
+        )
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable byte count (negative for a decrease)."""
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GB"
+
+
+def format_duration(seconds: float | None) -> str:
+    """ETA text, e.g. "1h 02m", "3m 05s", "12s" ("-" if unknown)."""
+    if seconds is None:
+        return "-"
+    minutes, secs = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
@@ -0,0 +1,191 @@
+"""Timing spans around stages, HTTP calls and Gemini requests.
+
+Spans are recorded by a process-wide recorder that is off by default, so
+instrumented code costs one attribute check until ``--timings`` enables it.
+Spans from worker threads are recorded too; overlapping spans (e.g. the
+upload pipeline stages) each count their own duration. Listeners (e.g. the
+profiler) are told when recorded spans start and end.
+"""
+
+import functools
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+CATEGORY_STAGE = "stage"
+CATEGORY_HTTP = "http"
+CATEGORY_GEMINI = "gemini"
+
+P95 = 0.95
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Events passed to span listeners
+SPAN_START = "start"
+SPAN_END = "end"
+
+# Listener of recorded spans: (event, name, category), called on the span's thread
+SpanListener = Callable[[str, str, str], None]
+
+
+@dataclass
+class Span:
+    """One timed operation; start is relative to when recording started."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: str
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SpanSummary:
+    """Aggregate of the spans with the same category and name."""
+
+    category: str
+    name: str
+    count: int
+    total: float
+    mean: float
+    p95: float
+    max: float
+
+
+def _summarize(category: str, name: str, durations: list[float]) -> SpanSummary:
+    ordered = sorted(durations)
+    total = sum(ordered)
+    return SpanSummary(
+        category=category,
+        name=name,
+        count=len(ordered),
+        total=total,
+        mean=total / len(ordered),
+        p95=ordered[min(len(ordered) - 1, int(len(ordered) * P95))],
+        max=ordered[-1],
+    )
+
+
+class Timings:
+    """Thread-safe recorder of timing spans."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.enabled = False
+        self.spans: list[Span] = []
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._listeners: list[SpanListener] = []
+
+    def start(self) -> None:
+        """Clear previous spans and start recording."""
+        with self._lock:
+            self.spans = []
+            self._origin = self._clock()
+            self.enabled = True
+
+    def stop(self) -> None:
+        """Stop recording (spans are kept)."""
+        self.enabled = False
+
+    def add_listener(self, listener: SpanListener) -> None:
+        """Call listener when recorded spans start and end."""
+        with self._lock:
+            self._listeners = [*self._listeners, listener]
+
+    def remove_listener(self, listener: SpanListener) -> None:
+        with self._lock:
+            self._listeners = [other for other in self._listeners if other is not listener]
+
+    def _notify(self, event: str, name: str, category: str) -> None:
+        for listener in self._listeners:
+            listener(event, name, category)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since recording started."""
+        return self._clock() - self._origin
+
+    @contextmanager
+    def span(self, name: str, category: str = CATEGORY_STAGE, **attrs: Any) -> Iterator[dict]:
+        """
+        Time the enclosed block.
+
+        Yields:
+            The span's attributes, so the block can add some (e.g. a status code)
+        """
+        if not self.enabled:
+            yield attrs
+            return
+        self._notify(SPAN_START, name, category)
+        start = self._clock()
+        try:
+            yield attrs
+        finally:
+            self._record(name, category, start, attrs)
+            self._notify(SPAN_END, name, category)
+
+    def _record(self, name: str, category: str, start: float, attrs: dict) -> None:
+        span = Span(
+            name=name,
+            category=category,
+            start=start - self._origin,
+            duration=self._clock() - start,
+            thread=threading.current_thread().name,
+            attrs=attrs,
+        )
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self) -> list[SpanSummary]:
+        """Spans aggregated by category and name, in the order they were first seen."""
+        with self._lock:
+            spans = list(self.spans)
+        groups: dict[tuple[str, str], list[float]] = {}
+        for span in spans:
+            groups.setdefault((span.category, span.name), []).append(span.duration)
+        return [
+            _summarize(category, name, durations) for (category, name), durations in groups.items()
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            spans = [asdict(span) for span in self.spans]
+        return {
+            "elapsed_seconds": self.elapsed,
+            "summary": [asdict(summary) for summary in self.summary()],
+            "spans": spans,
+        }
+
+    def write_json(self, path: str) -> None:
+        """Write the summary and every span to a JSON file."""
+        with Path(path).open("w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+_timings = Timings()
+
+
+def get_timings() -> Timings:
+    """Get the process-wide timing recorder."""
+    return _timings
+
+
+def timed(name: str, category: str = CATEGORY_STAGE) -> Callable[[F], F]:
+    """Decorator recording each call of a function as a span."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _timings.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
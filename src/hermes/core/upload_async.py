@@ -0,0 +1,246 @@
+"""Asyncio upload pipeline: translate → create keys → post translations.
+
+The asyncio counterpart of UploadPipeline, for callers that run on an event
+loop (the TUI). Gemini translates in a worker thread; each completed batch
+becomes a task on the loop that creates its keys and posts their translations
+through an AsyncCrowdinAPI, so the Crowdin requests of every batch share the
+client's bounded semaphore instead of a pool of worker threads.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from typing import Any
+
+from .cancellation import CancelToken
+from .crowdin_async import AsyncCrowdinAPI, gather_settled
+from .journal import UploadJournal
+from .keys import KeyPlan, to_identifier
+from .metrics import get_metrics
+from .upload_pipeline import (
+    STAGE_KEYS,
+    STAGE_TRANSLATE,
+    STAGE_TRANSLATIONS,
+    KeyItem,
+    PipelineProgress,
+    PipelineStats,
+    key_items,
+)
+
+
+class AsyncUploadPipeline:
+    """
+    Runs the upload stages of a CrowdinUploadAPI on the running event loop.
+
+    before_keys, if given, is awaited once before the first key is created
+    (e.g. a download that refreshes the existing keys); translation does not
+    wait for it. Journal, resume and cancellation behave as in UploadPipeline:
+    requests in flight always finish and are journaled; if a batch fails, the
+    cancel token stops Gemini and the requests not yet sent, and run() raises
+    the batch's exception.
+    """
+
+    def __init__(
+        self,
+        upload_api: Any,
+        crowdin: AsyncCrowdinAPI,
+        *,
+        progress_callback: PipelineProgress | None = None,
+        before_keys: Callable[[], Awaitable[None]] | None = None,
+        journal: UploadJournal | None = None,
+        cancel: CancelToken | None = None,
+    ):
+        self.upload_api = upload_api
+        self.crowdin = crowdin
+        self.progress_callback = progress_callback
+        self.before_keys = before_keys
+        self.journal = journal
+        self.cancel = cancel or CancelToken()
+        self.stats = PipelineStats()
+        # Gemini reports translated keys from its thread, the batches from the loop
+        self._lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._gate: asyncio.Future | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._totals = {STAGE_TRANSLATE: 0, STAGE_KEYS: 0, STAGE_TRANSLATIONS: 0}
+        self._done = {STAGE_TRANSLATE: 0, STAGE_KEYS: 0, STAGE_TRANSLATIONS: 0}
+
+    def _locales(self) -> list[str]:
+        """Locales that exist in the Crowdin project."""
+        languages = self.upload_api.languages
+        return [locale for locale in self.upload_api.translator.locales if locale in languages]
+
+    def _advance(self, stage: str, counter: str | None = None) -> None:
+        """Count one finished item of a stage (and a stats counter) and report progress."""
+        with self._lock:
+            self._done[stage] += 1
+            if counter:
+                setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+            done, total = self._done[stage], self._totals[stage]
+            get_metrics().stage_progress(stage, done, total)
+        if self.progress_callback:
+            self.progress_callback(stage, done, total)
+
+    def _raise_batch_error(self) -> None:
+        """Re-raise the first batch exception."""
+        if self._error is not None:
+            raise self._error
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        """Stop translation and the other batches when a batch raised."""
+        if task.cancelled() or task.exception() is None:
+            return
+        self._error = self._error or task.exception()
+        self.cancel.cancel("Upload failed")
+
+    def _start(self, items: list[KeyItem]) -> None:
+        """Start the task that uploads a batch (on the loop)."""
+        task = asyncio.ensure_future(self._upload(items))
+        task.add_done_callback(self._on_batch_done)
+        self._tasks.append(task)
+
+    def _enqueue_batch(self, batch: dict[str, dict[str, str]]) -> None:
+        """Record a completed Gemini batch and hand it to the loop (Gemini's thread)."""
+        self._raise_batch_error()
+        if self.journal:
+            self.journal.record_batch(batch)
+        items = key_items(batch)
+        for _ in items:
+            self._advance(STAGE_TRANSLATE, "keys_translated")
+        self._loop.call_soon_threadsafe(self._start, items)
+
+    async def _pass_gate(self) -> None:
+        """Await before_keys once; every batch waits for (and re-raises) the same result."""
+        if self.before_keys is None:
+            return
+        if self._gate is None:
+            self._gate = asyncio.ensure_future(self.before_keys())
+        await asyncio.shield(self._gate)
+
+    async def _skip_key(self, identifier: str) -> None:
+        """Report a key that already exists instead of creating it."""
+        if await self.crowdin.string_exists(identifier, self.cancel):
+            self.upload_api.log(f"Key '{identifier}' 已存在")
+        get_metrics().inc("hermes_upload_keys_total", result="skipped")
+        self._advance(STAGE_KEYS, "keys_skipped")
+
+    def _on_key(self, identifier: str, string_id: int) -> None:
+        """Record a created key."""
+        self.upload_api.log(f"新增 Key: {identifier}")
+        get_metrics().inc("hermes_upload_keys_total", result="created")
+        self._advance(STAGE_KEYS, "keys_created")
+        if self.journal:
+            self.journal.record_key(identifier, string_id)
+
+    async def _create_keys(self, identifiers: list[str]) -> dict[str, int]:
+        """Create the keys of a batch, reusing the ones a previous run created."""
+        string_ids: dict[str, int] = {}
+        skipped, new = [], []
+        for identifier in identifiers:
+            string_id = self.journal.string_id(identifier) if self.journal else None
+            if string_id is not None:
+                string_ids[identifier] = string_id
+                self._advance(STAGE_KEYS, "keys_resumed")
+            elif identifier in self.upload_api.existing_translations:
+                skipped.append(identifier)
+            else:
+                new.append(identifier)
+
+        await gather_settled(self._skip_key(identifier) for identifier in skipped)
+        created = await self.crowdin.add_keys(
+            new,
+            file_path=self.upload_api.resource_file_path,
+            key_callback=self._on_key,
+            cancel=self.cancel,
+        )
+        return string_ids | created
+
+    async def _upload(self, items: list[KeyItem]) -> None:
+        """Create the keys of a batch, then post their translations."""
+        await self._pass_gate()
+        string_ids = await self._create_keys([item.identifier for item in items])
+
+        def on_translation(identifier: str, locale: str, posted: bool) -> None:
+            if posted:
+                self.upload_api.log(f"新增 {locale} {identifier} 翻譯成功")
+            else:
+                self.upload_api.log(f"Warning: Failed to add {locale} translation of {identifier}")
+            result = "posted" if posted else "failed"
+            get_metrics().inc("hermes_upload_translations_total", language=locale, result=result)
+            self._advance(STAGE_TRANSLATIONS, f"translations_{result}")
+            if posted and self.journal:
+                self.journal.record_posted(string_ids[identifier], locale)
+
+        pending: dict[str, dict[str, str]] = {}
+        locales = self._locales()
+        for item in items:
+            string_id = string_ids.get(item.identifier)
+            if string_id is None:
+                continue
+            for locale in locales:
+                if locale not in item.translations:
+                    continue
+                if self.journal and self.journal.is_posted(string_id, locale):
+                    self._advance(STAGE_TRANSLATIONS, "translations_resumed")
+                    continue
+                pending.setdefault(locale, {})[item.identifier] = item.translations[locale]
+
+        await self.crowdin.add_translations(
+            pending, string_ids, translation_callback=on_translation, cancel=self.cancel
+        )
+
+    def _replay(self, plan: KeyPlan) -> KeyPlan:
+        """
+        Start the journaled translations of the plan.
+
+        Returns:
+            Plan of the keys that still need translating
+        """
+        if self.journal is None:
+            return plan
+        translated = {key for values in self.journal.state.translations.values() for key in values}
+        remaining = [key for key in plan.keys if to_identifier(key) not in translated]
+        if len(remaining) < len(plan.keys):
+            items = key_items(self.journal.cached_translations(plan.identifiers))
+            for _ in items:
+                self._advance(STAGE_TRANSLATE, "keys_translated")
+            self._start(items)
+        return replace(plan, keys=remaining)
+
+    async def run(self, plan: KeyPlan) -> PipelineStats:
+        """
+        Translate, create and post every key of the plan.
+
+        Args:
+            plan: Deduplicated keys to upload
+
+        Returns:
+            Counters of what was created and posted
+        """
+        identifiers = plan.identifiers
+        self._totals[STAGE_TRANSLATE] = len(identifiers)
+        self._totals[STAGE_KEYS] = len(identifiers)
+        self._totals[STAGE_TRANSLATIONS] = len(identifiers) * len(self._locales())
+        for stage, total in self._totals.items():
+            get_metrics().stage_progress(stage, 0, total)
+
+        self._loop = asyncio.get_running_loop()
+        try:
+            remaining = self._replay(plan)
+            if remaining.keys:
+                await asyncio.to_thread(
+                    self.upload_api.translate_missing_with_gemini,
+                    plan=remaining,
+                    batch_callback=self._enqueue_batch,
+                )
+            # Batches handed over by Gemini's thread are started before to_thread returns
+            await gather_settled(self._tasks)
+        except BaseException:
+            # Stops Gemini, the requests not yet sent and a download still waited for
+            self.cancel.cancel("Upload failed")
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            self._raise_batch_error()
+            raise
+        return self.stats
@@ -0,0 +1,349 @@
+"""Staged upload pipeline: translate → create keys → post translations.
+
+The three stages run concurrently and are connected by bounded queues, so a
+key is created as soon as its Gemini batch completes and its translations are
+posted as soon as the key exists. Total time approaches the slowest stage
+instead of the sum of all three, and the queues bound memory for large key files.
+"""
+
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import Any
+
+from .cancellation import CancelToken
+from .journal import UploadJournal
+from .keys import KeyPlan, to_identifier
+from .metrics import get_metrics
+from .timing import get_timings
+
+# Items buffered between two stages before the producer blocks
+PIPELINE_QUEUE_SIZE = 200
+
+# Concurrent Crowdin requests per stage
+KEY_WORKERS = 4
+TRANSLATION_WORKERS = 8
+
+# How often blocked workers check whether the pipeline was stopped
+QUEUE_POLL_SECONDS = 0.1
+
+STAGE_TRANSLATE = "translate"
+STAGE_KEYS = "keys"
+STAGE_TRANSLATIONS = "translations"
+
+# Receives (stage, done, total) after every completed item
+PipelineProgress = Callable[[str, int, int], None]
+
+# Marks the end of a queue
+_DONE = object()
+
+
+@dataclass
+class KeyItem:
+    """A translated key waiting to be created in Crowdin."""
+
+    identifier: str
+    translations: dict[str, str]
+
+
+@dataclass
+class TranslationItem:
+    """A translation waiting to be posted for a created key."""
+
+    string_id: int
+    identifier: str
+    locale: str
+    text: str
+
+
+@dataclass
+class PipelineStats:
+    """Outcome counters of a pipeline run."""
+
+    keys_translated: int = 0
+    keys_created: int = 0
+    keys_skipped: int = 0
+    keys_resumed: int = 0
+    translations_posted: int = 0
+    translations_failed: int = 0
+    translations_resumed: int = 0
+
+
+def key_items(batch: dict[str, dict[str, str]]) -> list[KeyItem]:
+    """
+    Regroup a batch's translations by key.
+
+    Args:
+        batch: Translations by locale, then identifier
+
+    Returns:
+        One item per identifier, with its translations by locale
+    """
+    by_key: dict[str, dict[str, str]] = {}
+    for locale, values in batch.items():
+        for identifier, text in values.items():
+            by_key.setdefault(identifier, {})[locale] = text
+    return [KeyItem(identifier, translations) for identifier, translations in by_key.items()]
+
+
+def _put(target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put an item, giving up if the pipeline stops while the queue is full."""
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=QUEUE_POLL_SECONDS)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _get(source: queue.Queue, stop: threading.Event) -> Any:
+    """Get the next item, or _DONE once the pipeline stops."""
+    while not stop.is_set():
+        try:
+            return source.get(timeout=QUEUE_POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+class UploadPipeline:
+    """
+    Runs the upload stages of a CrowdinUploadAPI concurrently.
+
+    The calling thread translates (Gemini batches already run in parallel);
+    key_workers threads create keys and translation_workers threads post
+    translations. If a worker fails, the pipeline stops and run() raises the
+    worker's exception.
+
+    before_keys, if given, runs once before the first key is created (e.g. to
+    wait for a download that refreshes the existing keys); translation does
+    not wait for it.
+
+    With a journal, completed work is recorded as it happens, and work already
+    recorded (translations, created keys, posted translations) is reused
+    instead of being requested again.
+
+    Workers check cancel before each request; once it is cancelled, every
+    stage stops after its in-flight request and run() raises
+    OperationCancelled, leaving the journal resumable.
+    """
+
+    def __init__(
+        self,
+        upload_api: Any,
+        *,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        key_workers: int = KEY_WORKERS,
+        translation_workers: int = TRANSLATION_WORKERS,
+        progress_callback: PipelineProgress | None = None,
+        before_keys: Callable[[], None] | None = None,
+        journal: UploadJournal | None = None,
+        cancel: CancelToken | None = None,
+    ):
+        self.upload_api = upload_api
+        self.key_workers = key_workers
+        self.translation_workers = translation_workers
+        self.progress_callback = progress_callback
+        self.before_keys = before_keys
+        self.journal = journal
+        self.cancel = cancel or CancelToken()
+        self.stats = PipelineStats()
+        self._key_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._translation_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._gate_lock = threading.Lock()
+        self._gate_passed = before_keys is None
+        self._gate_error: BaseException | None = None
+        self._totals = {STAGE_TRANSLATE: 0, STAGE_KEYS: 0, STAGE_TRANSLATIONS: 0}
+        self._done = {STAGE_TRANSLATE: 0, STAGE_KEYS: 0, STAGE_TRANSLATIONS: 0}
+
+    def _locales(self) -> list[str]:
+        """Locales that exist in the Crowdin project."""
+        languages = self.upload_api.languages
+        return [locale for locale in self.upload_api.translator.locales if locale in languages]
+
+    def _advance(self, stage: str, counter: str | None = None) -> None:
+        """Count one finished item of a stage (and a stats counter) and report progress."""
+        with self._lock:
+            self._done[stage] += 1
+            if counter:
+                setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+            done, total = self._done[stage], self._totals[stage]
+            # Under the lock, so the gauge never goes backwards
+            get_metrics().stage_progress(stage, done, total)
+        if self.progress_callback:
+            self.progress_callback(stage, done, total)
+
+    def _on_worker_done(self, future: Future) -> None:
+        """Stop the pipeline when a worker raised."""
+        error = future.exception()
+        if error is None:
+            return
+        with self._lock:
+            self._error = self._error or error
+        self._stop.set()
+
+    def _raise_worker_error(self) -> None:
+        """Re-raise the first worker exception in the calling thread."""
+        if self._error is not None:
+            raise self._error
+
+    def _enqueue_batch(self, batch: dict[str, dict[str, str]]) -> None:
+        """Record a completed Gemini batch and pass it on to key creation."""
+        self._raise_worker_error()
+        if self.journal:
+            self.journal.record_batch(batch)
+        self._enqueue(batch)
+
+    def _enqueue(self, batch: dict[str, dict[str, str]]) -> None:
+        """Queue the keys of a batch for creation."""
+        for item in key_items(batch):
+            self._advance(STAGE_TRANSLATE, "keys_translated")
+            _put(self._key_queue, item, self._stop)
+
+    def _pass_gate(self) -> None:
+        """
+        Run before_keys once; other key workers wait until it has finished.
+
+        If it fails, every key worker re-raises the first error without running it again.
+        """
+        with self._gate_lock:
+            if self._gate_error is not None:
+                raise self._gate_error
+            if self._gate_passed:
+                return
+            try:
+                with get_timings().span("wait before keys"):
+                    self.before_keys()
+            except BaseException as e:
+                self._gate_error = e
+                raise
+            self._gate_passed = True
+
+    def _create_keys(self) -> None:
+        """Key worker: create keys and queue their translations."""
+        self._pass_gate()
+        locales = self._locales()
+        while (item := _get(self._key_queue, self._stop)) is not _DONE:
+            self.cancel.raise_if_cancelled()
+            string_id = self._create_key(item.identifier)
+            if string_id is None:
+                continue
+            for locale in locales:
+                if locale in item.translations:
+                    translation = TranslationItem(
+                        string_id, item.identifier, locale, item.translations[locale]
+                    )
+                    _put(self._translation_queue, translation, self._stop)
+
+    def _create_key(self, identifier: str) -> int | None:
+        """Create a key, or reuse the one a previous run created."""
+        string_id = self.journal.string_id(identifier) if self.journal else None
+        if string_id is not None:
+            self._advance(STAGE_KEYS, "keys_resumed")
+            return string_id
+
+        string_id = self.upload_api.add_key(identifier)
+        self._advance(STAGE_KEYS, "keys_skipped" if string_id is None else "keys_created")
+        if string_id is not None and self.journal:
+            self.journal.record_key(identifier, string_id)
+        return string_id
+
+    def _post_translation(self, item: TranslationItem) -> None:
+        """Post a translation unless a previous run already did."""
+        if self.journal and self.journal.is_posted(item.string_id, item.locale):
+            self._advance(STAGE_TRANSLATIONS, "translations_resumed")
+            return
+
+        posted = self.upload_api.add_translation(
+            item.string_id, item.locale, item.identifier, item.text
+        )
+        self._advance(
+            STAGE_TRANSLATIONS, "translations_posted" if posted else "translations_failed"
+        )
+        if posted and self.journal:
+            self.journal.record_posted(item.string_id, item.locale)
+
+    def _post_translations(self) -> None:
+        """Translation worker: post queued translations."""
+        while (item := _get(self._translation_queue, self._stop)) is not _DONE:
+            self.cancel.raise_if_cancelled()
+            self._post_translation(item)
+
+    def _replay(self, plan: KeyPlan) -> KeyPlan:
+        """
+        Queue the journaled translations of the plan.
+
+        Returns:
+            Plan of the keys that still need translating
+        """
+        if self.journal is None:
+            return plan
+        translated = {key for values in self.journal.state.translations.values() for key in values}
+        remaining = [key for key in plan.keys if to_identifier(key) not in translated]
+        if len(remaining) < len(plan.keys):
+            self._enqueue(self.journal.cached_translations(plan.identifiers))
+        return replace(plan, keys=remaining)
+
+    def _start(
+        self, executor: ThreadPoolExecutor, worker: Callable[[], None], count: int
+    ) -> list[Future]:
+        """Start count copies of a stage worker."""
+        futures = [executor.submit(worker) for _ in range(count)]
+        for future in futures:
+            future.add_done_callback(self._on_worker_done)
+        return futures
+
+    def _close(self, target: queue.Queue, futures: list[Future]) -> None:
+        """Signal the end of a queue to its workers and wait for them."""
+        for _ in futures:
+            _put(target, _DONE, self._stop)
+        wait(futures)
+
+    def run(self, plan: KeyPlan) -> PipelineStats:
+        """
+        Translate, create and post every key of the plan.
+
+        Args:
+            plan: Deduplicated keys to upload
+
+        Returns:
+            Counters of what was created and posted
+        """
+        identifiers = plan.identifiers
+        self._totals[STAGE_TRANSLATE] = len(identifiers)
+        self._totals[STAGE_KEYS] = len(identifiers)
+        self._totals[STAGE_TRANSLATIONS] = len(identifiers) * len(self._locales())
+        for stage, total in self._totals.items():
+            get_metrics().stage_progress(stage, 0, total)
+
+        with ThreadPoolExecutor(
+            max_workers=self.key_workers + self.translation_workers
+        ) as executor:
+            key_futures = self._start(executor, self._create_keys, self.key_workers)
+            translation_futures = self._start(
+                executor, self._post_translations, self.translation_workers
+            )
+            try:
+                remaining = self._replay(plan)
+                if remaining.keys:
+                    self.upload_api.translate_missing_with_gemini(
+                        plan=remaining, batch_callback=self._enqueue_batch
+                    )
+            except BaseException:
+                # Key workers may still be in before_keys (e.g. a download); draining waits for them
+                self.cancel.cancel("Upload failed")
+                raise
+            finally:
+                with get_timings().span("drain key queue"):
+                    self._close(self._key_queue, key_futures)
+                with get_timings().span("drain translation queue"):
+                    self._close(self._translation_queue, translation_futures)
+
+        self._raise_worker_error()
+        return self.stats
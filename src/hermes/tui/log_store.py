@@ -0,0 +1,70 @@
+"""Bounded store of operation log lines for the TUI screens.
+
+The store keeps the newest ``max_lines`` lines in a ring buffer. Older lines
+are appended to a spill file (as plain text, markup removed), so a long
+upload log costs a fixed amount of memory and nothing is lost.
+"""
+
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from rich.text import Text
+
+from hermes.core.config import get_config_dir
+
+DEFAULT_MAX_LINES = 10_000
+
+LOGS_DIR = "logs"
+
+
+def spill_file_path(operation: str) -> Path:
+    """Spill file of an operation started now, e.g. logs/upload-20250101-120000.log."""
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    return get_config_dir() / LOGS_DIR / f"{operation}-{stamp}.log"
+
+
+class LogStore:
+    """Ring buffer of log lines (Rich markup) that spills evicted lines to a file."""
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, spill_path: Path | None = None):
+        """
+        Args:
+            max_lines: Lines kept in memory (at least 1)
+            spill_path: File receiving evicted lines (None = evicted lines are dropped)
+        """
+        self.max_lines = max(1, max_lines)
+        self.spill_path = spill_path
+        # Lines evicted so far, i.e. the absolute number of the oldest kept line
+        self.evicted = 0
+        self._lines: deque[str] = deque()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __getitem__(self, index: int) -> str:
+        return self._lines[index]
+
+    def append(self, line: str) -> None:
+        self.extend([line])
+
+    def extend(self, lines: list[str]) -> None:
+        """Add lines, evicting (and spilling) the oldest ones beyond max_lines."""
+        self._lines.extend(lines)
+        overflow = len(self._lines) - self.max_lines
+        if overflow <= 0:
+            return
+        evicted = [self._lines.popleft() for _ in range(overflow)]
+        self.evicted += overflow
+        self._spill(evicted)
+
+    def _spill(self, lines: list[str]) -> None:
+        """Append evicted lines to the spill file; stop spilling if it cannot be written."""
+        if not self.spill_path:
+            return
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.spill_path.open("a", encoding="utf-8") as f:
+                f.writelines(f"{Text.from_markup(line).plain}\n" for line in lines)
+        except OSError:
+            self.spill_path = None
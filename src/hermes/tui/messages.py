@@ -0,0 +1,13 @@
+"""Messages posted to the TUI screens from background work."""
+
+from textual.message import Message
+
+from hermes.core.progress import ProgressEvent
+
+
+class ProgressUpdate(Message):
+    """A coalesced batch of progress events from a ProgressBus."""
+
+    def __init__(self, events: list[ProgressEvent]):
+        super().__init__()
+        self.events = events
@@ -0,0 +1,112 @@
+"""Live throughput dashboard for Hermes TUI."""
+
+from typing import ClassVar
+
+from textual.app import ComposeResult
+from textual.binding import Binding, BindingType
+from textual.containers import Container, Grid
+from textual.screen import Screen
+from textual.widgets import DataTable, Footer, Header, Static
+
+from hermes.core.metrics import STAGE_BUILD, STAGE_DOWNLOAD
+from hermes.core.throughput import (
+    DEFAULT_WINDOW_SECONDS,
+    StageRate,
+    ThroughputMonitor,
+    ThroughputSnapshot,
+    format_bytes,
+    format_duration,
+)
+
+# Seconds between dashboard updates
+REFRESH_SECONDS = 1.0
+
+CARDS = {
+    "card-requests": "Requests/s",
+    "card-bytes": "Download/s",
+    "card-in-flight": "In flight",
+    "card-retries": "Retries",
+    "card-rate-limited": "429 / quota errors",
+    "card-tokens": "Gemini tokens",
+}
+
+
+def _amount(stage: str, value: float) -> str:
+    """A stage's work in its own unit: bytes downloaded, build percent or items."""
+    if stage == STAGE_DOWNLOAD:
+        return format_bytes(value)
+    if stage == STAGE_BUILD:
+        return f"{value:.0f}%"
+    return f"{value:,.0f}"
+
+
+def _stage_row(stage: StageRate) -> tuple[str, str, str, str]:
+    percent = f" ({stage.done * 100 / stage.total:.0f}%)" if stage.total else ""
+    eta = "[green]done[/green]" if stage.finished else format_duration(stage.eta_seconds)
+    return (
+        stage.stage,
+        f"{_amount(stage.stage, stage.done)} / {_amount(stage.stage, stage.total)}{percent}",
+        f"{_amount(stage.stage, stage.rate)}/s",
+        eta,
+    )
+
+
+class DashboardScreen(Screen):
+    """Live request, byte and token rates, error counts and per-stage ETAs."""
+
+    BINDINGS: ClassVar[list[BindingType]] = [
+        Binding("b", "app.pop_screen", "Back"),
+    ]
+
+    def __init__(self):
+        super().__init__()
+        self._monitor = ThroughputMonitor()
+
+    def compose(self) -> ComposeResult:
+        """Compose the dashboard layout."""
+        yield Header()
+
+        with Container(id="dashboard-container"):
+            yield Static("📊 Live Throughput", id="dashboard-title")
+            with Grid(id="dashboard-cards"):
+                for card_id in CARDS:
+                    yield Static(id=card_id, classes="dashboard-card")
+            yield DataTable(id="stage-table", cursor_type="none", zebra_stripes=True)
+            yield Static(
+                f"Rates over the last {DEFAULT_WINDOW_SECONDS:.0f}s of the running operation",
+                id="dashboard-hint",
+            )
+
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Set up the stage table and start refreshing."""
+        self.query_one("#stage-table", DataTable).add_columns("Stage", "Progress", "Rate", "ETA")
+        self.refresh_stats()
+        self.set_interval(REFRESH_SECONDS, self.refresh_stats)
+
+    def refresh_stats(self) -> None:
+        """Sample the run metrics and update the cards and the stage table."""
+        snapshot = self._monitor.sample()
+        self._update_cards(snapshot)
+
+        table = self.query_one("#stage-table", DataTable)
+        table.clear()
+        table.add_rows(_stage_row(stage) for stage in snapshot.stages)
+
+    def _update_cards(self, snapshot: ThroughputSnapshot) -> None:
+        rate_limited_style = "bold #f7768e" if snapshot.rate_limited else "bold #7aa2f7"
+        values = {
+            "card-requests": f"{snapshot.requests_per_second:.1f}",
+            "card-bytes": format_bytes(snapshot.bytes_per_second),
+            "card-in-flight": str(snapshot.in_flight),
+            "card-retries": str(snapshot.retries),
+            "card-rate-limited": f"[{rate_limited_style}]{snapshot.rate_limited}[/]",
+            "card-tokens": (
+                f"{snapshot.gemini_tokens:,} [dim]({snapshot.tokens_per_second:,.0f}/s)[/dim]"
+            ),
+        }
+        for card_id, label in CARDS.items():
+            self.query_one(f"#{card_id}", Static).update(
+                f"[bold #7aa2f7]{values[card_id]}[/]\n[dim]{label}[/dim]"
+            )
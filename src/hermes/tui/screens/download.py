@@ -1,5 +1,7 @@
 """Download screen for Hermes TUI."""
 
+import asyncio
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
@@ -8,18 +10,26 @@ from textual.widgets import (
     Button,
     Footer,
     Header,
+    OptionList,
     ProgressBar,
-    RichLog,
     Static,
 )
-from textual.worker import Worker, get_current_worker
+from textual.worker import Worker
 
-from hermes.core.config import Config, get_config
-from hermes.core.crowdin_api import CrowdinAPI, CrowdinError
+from hermes.core.cancellation import CancelToken, OperationCancelled
+from hermes.core.config import Config, Profile, get_config
+from hermes.core.crowdin_api import CrowdinError
+from hermes.core.crowdin_async import AsyncCrowdinAPI
 from hermes.core.file_operations import (
     extract_and_replace_files,
     process_language_files,
 )
+from hermes.core.metrics import get_metrics
+from hermes.core.progress import ProgressBus, summarize
+from hermes.tui.log_store import LogStore, spill_file_path
+from hermes.tui.messages import ProgressUpdate
+from hermes.tui.screens.dashboard import DashboardScreen
+from hermes.tui.widgets import LogView, ProfilePicker
 
 
 class DownloadScreen(Screen):
@@ -31,17 +41,19 @@ class DownloadScreen(Screen):
         Binding("k", "focus_previous", "Up", show=False),
         Binding("j", "focus_next", "Down", show=False),
         Binding("escape", "cancel_selection", "Cancel", show=False),
+        Binding("c", "cancel_operation", "Cancel operation"),
+        Binding("d", "show_dashboard", "Throughput"),
     ]
 
     def __init__(self):
         super().__init__()
         self.config: Config = get_config()
         self._operation_running = False
-        self._log_content: list[str] = []
+        # Cancelled by the Cancel button; a new token is created per operation
+        self._cancel = CancelToken()
+        self._log = LogStore(self.config.current_profile.log_max_lines)
         # Profile selection state
         self._selecting_profile = False
-        self._profile_list: list[str] = []
-        self._profile_index = 0
 
     def compose(self) -> ComposeResult:
         """Compose the download screen layout."""
@@ -59,12 +71,14 @@ class DownloadScreen(Screen):
                         variant="default",
                     )
                     yield Button("▶ Start", id="btn-start", variant="success")
+                    yield Button("■ Cancel", id="btn-cancel", variant="error", disabled=True)
                     yield Button("Back", id="btn-back", variant="default")
 
                 # Right panel - output
                 with Vertical(id="right-panel"):
                     with Vertical(id="log-container"):
-                        yield RichLog(id="log-view", highlight=True, markup=True)
+                        yield LogView(self._log, id="log-view")
+                        yield ProfilePicker(id="profile-picker")
 
                     with Horizontal(id="status-container"):
                         yield Static("Ready", id="status-label")
@@ -76,17 +90,21 @@ class DownloadScreen(Screen):
         """Focus the profile button when screen mounts."""
         self.query_one("#btn-profile", Button).focus()
 
+    def on_unmount(self) -> None:
+        """Stop a running operation when the screen goes away (e.g. the app quits)."""
+        self._cancel.cancel()
+
     def action_focus_next(self) -> None:
         """Move focus to next widget or profile item."""
         if self._selecting_profile:
-            self._move_profile_selection(1)
+            self.profile_picker.action_cursor_down()
         else:
             self.focus_next()
 
     def action_focus_previous(self) -> None:
         """Move focus to previous widget or profile item."""
         if self._selecting_profile:
-            self._move_profile_selection(-1)
+            self.profile_picker.action_cursor_up()
         else:
             self.focus_previous()
 
@@ -96,62 +114,38 @@ class DownloadScreen(Screen):
             self._exit_profile_selection()
             self.query_one("#btn-profile", Button).focus()
 
-    def _move_profile_selection(self, delta: int) -> None:
-        """Move the profile selection cursor."""
-        if not self._profile_list:
-            return
-        self._profile_index = (self._profile_index + delta) % len(self._profile_list)
-        self._render_profile_list()
+    @property
+    def profile_picker(self) -> ProfilePicker:
+        """Get the profile picker widget."""
+        return self.query_one("#profile-picker", ProfilePicker)
 
     def _enter_profile_selection(self) -> None:
-        """Enter profile selection mode."""
+        """Show the profile picker in place of the log."""
         self._selecting_profile = True
-        self._profile_list = list(self.config.profiles.keys())
-        try:
-            self._profile_index = self._profile_list.index(self.config.active_profile)
-        except ValueError:
-            self._profile_index = 0
-        self._render_profile_list()
-
-    def _render_profile_list(self) -> None:
-        """Render the profile list in the log view."""
-        log = self.log_view
-        log.clear()
-
-        log.write("[bold cyan]━━━ Select Profile ━━━[/bold cyan]")
-        log.write("")
-        log.write("[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]")
-        log.write("")
-
-        for i, profile_name in enumerate(self._profile_list):
-            profile = self.config.profiles[profile_name]
-            if i == self._profile_index:
-                # Highlighted selection
-                log.write(f"[bold reverse] ▸ {profile_name} [/bold reverse]")
-                log.write(f"    [dim]Project: {profile.project_id}[/dim]")
-                log.write(f"    [dim]Data: {profile.data_path}[/dim]")
-            else:
-                log.write(f"   {profile_name}")
-
-        log.write("")
-        log.write("[dim]─────────────────────────────[/dim]")
+        picker = self.profile_picker
+        picker.show_profiles(self.config)
+        self.log_view.display = False
+        picker.display = True
+        picker.focus()
 
     def _select_current_profile(self) -> None:
         """Select the currently highlighted profile."""
-        if self._profile_list and 0 <= self._profile_index < len(self._profile_list):
-            selected = self._profile_list[self._profile_index]
+        selected = self.profile_picker.highlighted_profile
+        if selected:
             self.config.active_profile = selected
             self.query_one("#btn-profile", Button).label = f"Profile: {selected}"
         self._exit_profile_selection()
 
     def _exit_profile_selection(self) -> None:
-        """Exit profile selection mode."""
+        """Hide the profile picker; the log is shown again as it was."""
         self._selecting_profile = False
-        log = self.log_view
-        log.clear()
-        # Restore previous log content
-        for line in self._log_content:
-            log.write(line)
+        self.profile_picker.display = False
+        self.log_view.display = True
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Select the profile chosen with Enter or a click."""
+        self._select_current_profile()
+        self.query_one("#btn-profile", Button).focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -170,20 +164,31 @@ class DownloadScreen(Screen):
             elif not self._operation_running:
                 self.start_download()
 
+        elif button_id == "btn-cancel":
+            self.action_cancel_operation()
+
         elif button_id == "btn-back":
             if self._selecting_profile:
                 self._exit_profile_selection()
             elif not self._operation_running:
                 self.app.pop_screen()
             else:
-                self.notify("⚠️ Please wait for the operation to complete", severity="warning")
+                self.notify(
+                    "⚠️ Please wait for the operation to complete or cancel it", severity="warning"
+                )
+
+    def action_show_dashboard(self) -> None:
+        """Show live rates and ETAs; the operation keeps running underneath."""
+        self.app.push_screen(DashboardScreen())
 
-    def on_key(self, event) -> None:
-        """Handle key events for profile selection."""
-        if self._selecting_profile and event.key == "enter":
-            self._select_current_profile()
-            event.prevent_default()
-            event.stop()
+    def action_cancel_operation(self) -> None:
+        """Cancel the running operation; it stops after the requests in flight."""
+        if not self._operation_running or self._cancel.cancelled:
+            return
+        self._cancel.cancel()
+        self.query_one("#btn-cancel", Button).disabled = True
+        self.update_status("Cancelling...")
+        self.log_message("[yellow]Cancelling after the requests in flight...[/yellow]")
 
     def start_download(self) -> None:
         """Start the download operation."""
@@ -198,9 +203,13 @@ class DownloadScreen(Screen):
             return
 
         self._operation_running = True
-        self._log_content.clear()
-        self.log_view.clear()
+        self._cancel = CancelToken()
+        # The dashboard shows the metrics of the current operation only
+        get_metrics().reset()
+        self._log = LogStore(profile.log_max_lines, spill_file_path("download"))
+        self.log_view.show(self._log)
         self.query_one("#btn-start", Button).disabled = True
+        self.query_one("#btn-cancel", Button).disabled = False
         self.update_status("Starting download...")
         self.log_message("[blue]Starting download operation...[/blue]")
 
@@ -208,14 +217,28 @@ class DownloadScreen(Screen):
         self.run_download_worker()
 
     @property
-    def log_view(self) -> RichLog:
+    def log_view(self) -> LogView:
         """Get the log view widget."""
-        return self.query_one("#log-view", RichLog)
+        return self.query_one("#log-view", LogView)
 
     def log_message(self, message: str) -> None:
         """Add a message to the log view."""
-        self._log_content.append(message)
-        self.log_view.write(message)
+        self.log_messages([message])
+
+    def log_messages(self, messages: list[str]) -> None:
+        """Add several messages to the log (only the visible ones are rendered)."""
+        self._log.extend(messages)
+        self.log_view.refresh_lines()
+
+    def on_progress_update(self, message: ProgressUpdate) -> None:
+        """Apply a batch of progress events from the running download."""
+        batch = summarize(message.events)
+        if batch.lines:
+            self.log_messages(batch.lines)
+        if batch.status is not None:
+            self.update_status(batch.status)
+        if batch.percent is not None:
+            self.update_progress(int(batch.percent))
 
     def update_status(self, status: str) -> None:
         """Update the status label."""
@@ -226,114 +249,122 @@ class DownloadScreen(Screen):
         self.query_one("#progress-bar", ProgressBar).update(progress=value)
 
     def run_download_worker(self) -> Worker:
-        """Run the download operation in a background worker."""
-        return self.run_worker(self._download_task, exclusive=True, thread=True)
-
-    async def _download_task(self) -> None:
-        """Background task for downloading translations."""
-        worker = get_current_worker()
-        profile = self.config.current_profile
-
-        try:
-            # Step 1: Initialize API
-            self.app.call_from_thread(self.log_message, "[cyan]Initializing Crowdin API...[/cyan]")
-            self.app.call_from_thread(self.update_progress, 5)
-
-            api = CrowdinAPI(profile.crowdin_token, profile.project_id)
-
+        """Run the download operation as an async worker on the app's event loop."""
+        return self.run_worker(self._download_task(), exclusive=True)
+
+    async def _download_latest(self, profile: Profile, bus: ProgressBus) -> list[str]:
+        """Build, download, extract and process the latest translations; returns the languages."""
+        # Step 1: Initialize API
+        bus.log("[cyan]Initializing Crowdin API...[/cyan]")
+        bus.update(percent=5)
+
+        async with AsyncCrowdinAPI(
+            profile.crowdin_token,
+            profile.project_id,
+            http2=profile.http2,
+            api_url=profile.crowdin_api_url or None,
+        ) as api:
             # Step 2: Initiate build
-            self.app.call_from_thread(self.log_message, "[cyan]Initiating translation build...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Initiating build...")
-            self.app.call_from_thread(self.update_progress, 10)
+            bus.log("[cyan]Initiating translation build...[/cyan]")
+            bus.update("Initiating build...", 10)
 
-            build_id = api.initiate_build()
-            self.app.call_from_thread(
-                self.log_message, f"[green]Build initiated. ID: {build_id}[/green]"
-            )
+            build_id = await api.initiate_build()
+            bus.log(f"[green]Build initiated. ID: {build_id}[/green]")
 
             # Step 3: Wait for build to complete
-            self.app.call_from_thread(self.log_message, "[cyan]Waiting for build to complete...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Building translations...")
+            bus.log("[cyan]Waiting for build to complete...[/cyan]")
+            bus.update("Building translations...")
 
             def build_progress(progress):
-                self.app.call_from_thread(
-                    self.log_message,
-                    f"[dim]Build progress: {progress.status} - {progress.progress}%[/dim]",
-                )
+                bus.log(f"[dim]Build progress: {progress.status} - {progress.progress}%[/dim]")
                 # Map build progress to 10-50% of total
-                mapped_progress = 10 + int(progress.progress * 0.4)
-                self.app.call_from_thread(self.update_progress, mapped_progress)
+                bus.update(percent=10 + int(progress.progress * 0.4))
 
-            api.check_build_status(build_id, progress_callback=build_progress)
-            self.app.call_from_thread(self.log_message, "[green]Build completed successfully![/green]")
+            await api.check_build_status(
+                build_id, progress_callback=build_progress, cancel=self._cancel
+            )
+            bus.log("[green]Build completed successfully![/green]")
 
-            # Step 4: Download build
-            self.app.call_from_thread(self.log_message, "[cyan]Downloading translations...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Downloading...")
-            self.app.call_from_thread(self.update_progress, 55)
+            # Step 4: Download build (progress mapped to 55-75% of total)
+            bus.log("[cyan]Downloading translations...[/cyan]")
+            bus.update("Downloading...", 55)
 
-            def download_progress(percent):
-                # Map download progress to 55-75% of total
-                mapped_progress = 55 + int(percent * 0.2)
-                self.app.call_from_thread(self.update_progress, mapped_progress)
+            zip_path = await api.download_build(
+                build_id, progress_callback=bus.scaled(55, 75), cancel=self._cancel
+            )
+            bus.log(f"[green]Downloaded to: {zip_path}[/green]")
 
-            zip_path = api.download_build(build_id, progress_callback=download_progress)
-            self.app.call_from_thread(self.log_message, f"[green]Downloaded to: {zip_path}[/green]")
+        # Step 5: Extract files (disk-bound, runs in a thread)
+        bus.log("[cyan]Extracting files...[/cyan]")
+        bus.update("Extracting...", 80)
 
-            # Step 5: Extract files
-            self.app.call_from_thread(self.log_message, "[cyan]Extracting files...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Extracting...")
-            self.app.call_from_thread(self.update_progress, 80)
+        await asyncio.to_thread(
+            extract_and_replace_files, zip_path, profile.data_path, cancel=self._cancel
+        )
+        bus.log(f"[green]Extracted to: {profile.data_path}[/green]")
 
-            extract_and_replace_files(zip_path, profile.data_path)
-            self.app.call_from_thread(
-                self.log_message, f"[green]Extracted to: {profile.data_path}[/green]"
-            )
+        # Step 6: Process language files (runs in a thread)
+        bus.log("[cyan]Processing language files...[/cyan]")
+        bus.update("Processing...", 90)
 
-            # Step 6: Process language files
-            self.app.call_from_thread(self.log_message, "[cyan]Processing language files...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Processing...")
-            self.app.call_from_thread(self.update_progress, 90)
+        def process_progress(lang, current, total):
+            bus.log(f"[dim]Processing {lang} ({current}/{total})[/dim]")
 
-            def process_progress(lang, current, total):
-                self.app.call_from_thread(
-                    self.log_message,
-                    f"[dim]Processing {lang} ({current}/{total})[/dim]",
-                )
+        processed = await asyncio.to_thread(
+            process_language_files,
+            profile.data_path,
+            profile.result_path,
+            progress_callback=process_progress,
+            cancel=self._cancel,
+        )
 
-            processed = process_language_files(
-                profile.data_path,
-                profile.result_path,
-                progress_callback=process_progress,
-            )
+        return processed
+
+    async def _download_task(self) -> None:
+        """Background task for downloading translations."""
+        profile = self.config.current_profile
+        # Chunk, build and language updates reach the UI as a few batches per second
+        bus = ProgressBus(
+            lambda events: self.post_message(ProgressUpdate(events)), profile.progress_rate
+        )
+
+        try:
+            processed = await self._download_latest(profile, bus)
 
             # Complete
-            self.app.call_from_thread(self.update_progress, 100)
-            self.app.call_from_thread(self.update_status, "Complete!")
-            self.app.call_from_thread(
-                self.log_message,
-                f"[bold green]✅ Download complete! Processed {len(processed)} languages.[/bold green]",
+            bus.update("Complete!", 100)
+            bus.log(
+                f"[bold green]✅ Download complete! Processed {len(processed)} languages.[/bold green]"
             )
 
             for lang in processed:
-                self.app.call_from_thread(self.log_message, f"  • {lang}")
+                bus.log(f"  • {lang}")
+
+        except OperationCancelled:
+            bus.log("[yellow]⏹ Download cancelled; start again to download[/yellow]")
+            bus.update("Cancelled")
+            self.notify("Download cancelled", severity="warning")
 
         except CrowdinError as e:
-            self.app.call_from_thread(self.log_message, f"[bold red]❌ Error: {e}[/bold red]")
-            self.app.call_from_thread(self.update_status, "Error!")
-            self.app.call_from_thread(self.notify, f"Download failed: {e}", severity="error")
+            bus.log(f"[bold red]❌ Error: {e}[/bold red]")
+            bus.update("Error!")
+            self.notify(f"Download failed: {e}", severity="error")
 
         except Exception as e:
-            self.app.call_from_thread(
-                self.log_message, f"[bold red]❌ Unexpected error: {e}[/bold red]"
-            )
-            self.app.call_from_thread(self.update_status, "Error!")
-            self.app.call_from_thread(self.notify, f"Unexpected error: {e}", severity="error")
+            bus.log(f"[bold red]❌ Unexpected error: {e}[/bold red]")
+            bus.update("Error!")
+            self.notify(f"Unexpected error: {e}", severity="error")
 
         finally:
-            self.app.call_from_thread(self._finish_operation)
+            bus.flush()
+            self._finish_operation()
 
     def _finish_operation(self) -> None:
         """Clean up after operation completes."""
         self._operation_running = False
         self.query_one("#btn-start", Button).disabled = False
+        self.query_one("#btn-cancel", Button).disabled = True
+        if self._log.evicted and self._log.spill_path:
+            self.log_message(
+                f"[dim]{self._log.evicted} older lines saved to {self._log.spill_path}[/dim]"
+            )
@@ -47,6 +47,7 @@ class MainMenuScreen(Screen):
 
             yield Button("📥 Download Translations", id="btn-download", classes="menu-button")
             yield Button("📤 Upload Translations", id="btn-upload", classes="menu-button")
+            yield Button("📊 Live Throughput", id="btn-dashboard", classes="menu-button")
             yield Button("⚙ Settings", id="btn-settings", classes="menu-button")
             yield Button("❌ Exit", id="btn-exit", classes="menu-button")
 
@@ -66,6 +67,11 @@ class MainMenuScreen(Screen):
 
             self.app.push_screen(UploadScreen())
 
+        elif button_id == "btn-dashboard":
+            from hermes.tui.screens.dashboard import DashboardScreen  # noqa: PLC0415 - deferred for startup time
+
+            self.app.push_screen(DashboardScreen())
+
         elif button_id == "btn-settings":
             from hermes.tui.screens.settings import SettingsScreen
 
@@ -1,5 +1,7 @@
 """Upload screen for Hermes TUI."""
 
+import asyncio
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
@@ -9,19 +11,32 @@ from textual.widgets import (
     Checkbox,
     Footer,
     Header,
+    OptionList,
     ProgressBar,
-    RichLog,
     Static,
 )
-from textual.worker import Worker, get_current_worker
+from textual.worker import Worker
 
-from hermes.core.config import Config, get_config
-from hermes.core.crowdin_api import CrowdinAPI, CrowdinError
+from hermes.core.cancellation import CancelToken, OperationCancelled
+from hermes.core.config import Config, Profile, get_config
+from hermes.core.crowdin_api import CrowdinError
+from hermes.core.crowdin_async import AsyncCrowdinAPI
+from hermes.core.crowdin_transport import configure_transport, get_transport
 from hermes.core.crowdin_upload_api import CrowdinUploadAPI
 from hermes.core.file_operations import (
     extract_and_replace_files,
     process_language_files,
 )
+from hermes.core.gemini import GeminiError
+from hermes.core.journal import UnfinishedJournalError
+from hermes.core.metrics import get_metrics
+from hermes.core.progress import ProgressBus, summarize
+from hermes.core.rate_limit import RateGovernor
+from hermes.core.upload_pipeline import STAGE_TRANSLATIONS
+from hermes.tui.log_store import LogStore, spill_file_path
+from hermes.tui.messages import ProgressUpdate
+from hermes.tui.screens.dashboard import DashboardScreen
+from hermes.tui.widgets import LogView, ProfilePicker
 
 
 class UploadScreen(Screen):
@@ -33,17 +48,19 @@ class UploadScreen(Screen):
         Binding("k", "focus_previous", "Up", show=False),
         Binding("j", "focus_next", "Down", show=False),
         Binding("escape", "cancel_selection", "Cancel", show=False),
+        Binding("c", "cancel_operation", "Cancel operation"),
+        Binding("d", "show_dashboard", "Throughput"),
     ]
 
     def __init__(self):
         super().__init__()
         self.config: Config = get_config()
         self._operation_running = False
-        self._log_content: list[str] = []
+        # Cancelled by the Cancel button; a new token is created per operation
+        self._cancel = CancelToken()
+        self._log = LogStore(self.config.current_profile.log_max_lines)
         # Profile selection state
         self._selecting_profile = False
-        self._profile_list: list[str] = []
-        self._profile_index = 0
 
     def compose(self) -> ComposeResult:
         """Compose the upload screen layout."""
@@ -62,13 +79,16 @@ class UploadScreen(Screen):
                     )
                     yield Checkbox("Download first", id="chk-download-first", value=True)
                     yield Checkbox("Use Gemini AI", id="chk-use-gemini", value=True)
+                    yield Checkbox("Resume interrupted upload", id="chk-resume", value=False)
                     yield Button("▶ Start", id="btn-start", variant="success")
+                    yield Button("■ Cancel", id="btn-cancel", variant="error", disabled=True)
                     yield Button("Back", id="btn-back", variant="default")
 
                 # Right panel - output
                 with Vertical(id="right-panel"):
                     with Vertical(id="log-container"):
-                        yield RichLog(id="log-view", highlight=True, markup=True)
+                        yield LogView(self._log, id="log-view")
+                        yield ProfilePicker(id="profile-picker")
 
                     with Horizontal(id="status-container"):
                         yield Static("Ready", id="status-label")
@@ -80,17 +100,21 @@ class UploadScreen(Screen):
         """Focus the profile button when screen mounts."""
         self.query_one("#btn-profile", Button).focus()
 
+    def on_unmount(self) -> None:
+        """Stop a running operation when the screen goes away (e.g. the app quits)."""
+        self._cancel.cancel()
+
     def action_focus_next(self) -> None:
         """Move focus to next widget or profile item."""
         if self._selecting_profile:
-            self._move_profile_selection(1)
+            self.profile_picker.action_cursor_down()
         else:
             self.focus_next()
 
     def action_focus_previous(self) -> None:
         """Move focus to previous widget or profile item."""
         if self._selecting_profile:
-            self._move_profile_selection(-1)
+            self.profile_picker.action_cursor_up()
         else:
             self.focus_previous()
 
@@ -100,62 +124,38 @@ class UploadScreen(Screen):
             self._exit_profile_selection()
             self.query_one("#btn-profile", Button).focus()
 
-    def _move_profile_selection(self, delta: int) -> None:
-        """Move the profile selection cursor."""
-        if not self._profile_list:
-            return
-        self._profile_index = (self._profile_index + delta) % len(self._profile_list)
-        self._render_profile_list()
+    @property
+    def profile_picker(self) -> ProfilePicker:
+        """Get the profile picker widget."""
+        return self.query_one("#profile-picker", ProfilePicker)
 
     def _enter_profile_selection(self) -> None:
-        """Enter profile selection mode."""
+        """Show the profile picker in place of the log."""
         self._selecting_profile = True
-        self._profile_list = list(self.config.profiles.keys())
-        try:
-            self._profile_index = self._profile_list.index(self.config.active_profile)
-        except ValueError:
-            self._profile_index = 0
-        self._render_profile_list()
-
-    def _render_profile_list(self) -> None:
-        """Render the profile list in the log view."""
-        log = self.log_view
-        log.clear()
-
-        log.write("[bold cyan]━━━ Select Profile ━━━[/bold cyan]")
-        log.write("")
-        log.write("[dim]Use ↑/↓ to navigate, Enter to select, Esc to cancel[/dim]")
-        log.write("")
-
-        for i, profile_name in enumerate(self._profile_list):
-            profile = self.config.profiles[profile_name]
-            if i == self._profile_index:
-                # Highlighted selection
-                log.write(f"[bold reverse] ▸ {profile_name} [/bold reverse]")
-                log.write(f"    [dim]Project: {profile.project_id}[/dim]")
-                log.write(f"    [dim]Data: {profile.data_path}[/dim]")
-            else:
-                log.write(f"   {profile_name}")
-
-        log.write("")
-        log.write("[dim]─────────────────────────────[/dim]")
+        picker = self.profile_picker
+        picker.show_profiles(self.config)
+        self.log_view.display = False
+        picker.display = True
+        picker.focus()
 
     def _select_current_profile(self) -> None:
         """Select the currently highlighted profile."""
-        if self._profile_list and 0 <= self._profile_index < len(self._profile_list):
-            selected = self._profile_list[self._profile_index]
+        selected = self.profile_picker.highlighted_profile
+        if selected:
             self.config.active_profile = selected
             self.query_one("#btn-profile", Button).label = f"Profile: {selected}"
         self._exit_profile_selection()
 
     def _exit_profile_selection(self) -> None:
-        """Exit profile selection mode."""
+        """Hide the profile picker; the log is shown again as it was."""
         self._selecting_profile = False
-        log = self.log_view
-        log.clear()
-        # Restore previous log content
-        for line in self._log_content:
-            log.write(line)
+        self.profile_picker.display = False
+        self.log_view.display = True
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Select the profile chosen with Enter or a click."""
+        self._select_current_profile()
+        self.query_one("#btn-profile", Button).focus()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -174,20 +174,31 @@ class UploadScreen(Screen):
             elif not self._operation_running:
                 self.start_upload()
 
+        elif button_id == "btn-cancel":
+            self.action_cancel_operation()
+
         elif button_id == "btn-back":
             if self._selecting_profile:
                 self._exit_profile_selection()
             elif not self._operation_running:
                 self.app.pop_screen()
             else:
-                self.notify("⚠️ Please wait for the operation to complete", severity="warning")
+                self.notify(
+                    "⚠️ Please wait for the operation to complete or cancel it", severity="warning"
+                )
+
+    def action_show_dashboard(self) -> None:
+        """Show live rates and ETAs; the operation keeps running underneath."""
+        self.app.push_screen(DashboardScreen())
 
-    def on_key(self, event) -> None:
-        """Handle key events for profile selection."""
-        if self._selecting_profile and event.key == "enter":
-            self._select_current_profile()
-            event.prevent_default()
-            event.stop()
+    def action_cancel_operation(self) -> None:
+        """Cancel the running operation; it stops after the requests in flight."""
+        if not self._operation_running or self._cancel.cancelled:
+            return
+        self._cancel.cancel()
+        self.query_one("#btn-cancel", Button).disabled = True
+        self.update_status("Cancelling...")
+        self.log_message("[yellow]Cancelling after the requests in flight...[/yellow]")
 
     def start_upload(self) -> None:
         """Start the upload operation."""
@@ -210,9 +221,13 @@ class UploadScreen(Screen):
             return
 
         self._operation_running = True
-        self._log_content.clear()
-        self.log_view.clear()
+        self._cancel = CancelToken()
+        # The dashboard shows the metrics of the current operation only
+        get_metrics().reset()
+        self._log = LogStore(profile.log_max_lines, spill_file_path("upload"))
+        self.log_view.show(self._log)
         self.query_one("#btn-start", Button).disabled = True
+        self.query_one("#btn-cancel", Button).disabled = False
         self.update_status("Starting upload...")
         self.log_message("[blue]Starting upload operation...[/blue]")
 
@@ -220,14 +235,28 @@ class UploadScreen(Screen):
         self.run_upload_worker()
 
     @property
-    def log_view(self) -> RichLog:
+    def log_view(self) -> LogView:
         """Get the log view widget."""
-        return self.query_one("#log-view", RichLog)
+        return self.query_one("#log-view", LogView)
 
     def log_message(self, message: str) -> None:
         """Add a message to the log view."""
-        self._log_content.append(message)
-        self.log_view.write(message)
+        self.log_messages([message])
+
+    def log_messages(self, messages: list[str]) -> None:
+        """Add several messages to the log (only the visible ones are rendered)."""
+        self._log.extend(messages)
+        self.log_view.refresh_lines()
+
+    def on_progress_update(self, message: ProgressUpdate) -> None:
+        """Apply a batch of progress events from the running upload."""
+        batch = summarize(message.events)
+        if batch.lines:
+            self.log_messages(batch.lines)
+        if batch.status is not None:
+            self.update_status(batch.status)
+        if batch.percent is not None:
+            self.update_progress(int(batch.percent))
 
     def update_status(self, status: str) -> None:
         """Update the status label."""
@@ -238,148 +267,184 @@ class UploadScreen(Screen):
         self.query_one("#progress-bar", ProgressBar).update(progress=value)
 
     def run_upload_worker(self) -> Worker:
-        """Run the upload operation in a background worker."""
-        return self.run_worker(self._upload_task, exclusive=True, thread=True)
-
-    async def _upload_task(self) -> None:
-        """Background task for uploading translations."""
-        worker = get_current_worker()
-        profile = self.config.current_profile
-
-        download_first = self.query_one("#chk-download-first", Checkbox).value
-        use_gemini = self.query_one("#chk-use-gemini", Checkbox).value
+        """Run the upload operation as an async worker on the app's event loop."""
+        return self.run_worker(self._upload_task(), exclusive=True)
+
+    async def _download_latest(self, profile: Profile, bus: ProgressBus) -> None:
+        """Build, download, extract and process the latest translations."""
+        bus.log("[cyan]Downloading latest translations...[/cyan]")
+        bus.update(percent=10)
+
+        async with AsyncCrowdinAPI(
+            profile.crowdin_token,
+            profile.project_id,
+            http2=profile.http2,
+            api_url=profile.crowdin_api_url or None,
+        ) as api:
+            # Initiate build
+            build_id = await api.initiate_build()
+            bus.log(f"[green]Build initiated. ID: {build_id}[/green]")
+
+            # Wait for build
+            bus.update(percent=20)
+            await api.check_build_status(build_id, cancel=self._cancel)
+            bus.log("[green]Build completed.[/green]")
+
+            # Download
+            bus.update(percent=30)
+            zip_path = await api.download_build(build_id, cancel=self._cancel)
+            bus.log(f"[green]Downloaded: {zip_path}[/green]")
+
+        # Extract (disk-bound, runs in a thread)
+        bus.update(percent=40)
+        await asyncio.to_thread(
+            extract_and_replace_files, zip_path, profile.data_path, cancel=self._cancel
+        )
+        bus.log("[green]Files extracted.[/green]")
+
+        # Process (runs in a thread)
+        bus.update(percent=45)
+        await asyncio.to_thread(
+            process_language_files, profile.data_path, profile.result_path, cancel=self._cancel
+        )
+        bus.log("[green]Language files processed.[/green]")
+
+    async def _upload(
+        self,
+        profile: Profile,
+        bus: ProgressBus,
+        *,
+        download_first: bool,
+        use_gemini: bool,
+        resume: bool,
+    ) -> None:
+        """Download (if selected) while translating, adding keys and adding translations."""
+        configure_transport(http2=profile.http2)
+
+        # Step 1: Initialize Upload API (reads the data files before a download replaces them)
+        bus.log("[cyan]Initializing upload API...[/cyan]")
+        bus.update("Initializing...", 5)
+
+        upload_api = await asyncio.to_thread(
+            CrowdinUploadAPI,
+            api_token=profile.crowdin_token,
+            project_id=profile.project_id,
+            gemini_api_key=profile.gemini_token or "",
+            key_file_path=profile.key_path,
+            prompt_file_path=profile.prompts_path,
+            data_path=profile.data_path,
+            glossary_file_path=profile.glossary_path,
+            log_callback=lambda msg: bus.log(f"[dim]{msg}[/dim]"),
+            rate_governor=RateGovernor(profile.gemini_rpm, profile.gemini_tpm),
+            fallback_model=profile.gemini_fallback_model or None,
+            crowdin_api_url=profile.crowdin_api_url or None,
+            gemini_api_url=profile.gemini_api_url or None,
+            cancel=self._cancel,
+            resource_file_path=profile.crowdin_file_path,
+        )
+
+        # Step 2: Download in the background if selected; key creation waits for it
+        download = None
+        if download_first:
+            if use_gemini:
+                await asyncio.to_thread(upload_api.preload_glossary)
+            download = asyncio.create_task(self._download_latest(profile, bus))
 
         try:
-            # Step 1: Download first if selected
-            if download_first:
-                self.app.call_from_thread(
-                    self.log_message,
-                    "[cyan]Downloading latest translations first...[/cyan]",
-                )
-                self.app.call_from_thread(self.update_status, "Downloading...")
-                self.app.call_from_thread(self.update_progress, 5)
-
-                api = CrowdinAPI(profile.crowdin_token, profile.project_id)
-
-                # Initiate build
-                build_id = api.initiate_build()
-                self.app.call_from_thread(
-                    self.log_message, f"[green]Build initiated. ID: {build_id}[/green]"
-                )
-
-                # Wait for build
-                self.app.call_from_thread(self.update_progress, 10)
-                api.check_build_status(build_id)
-                self.app.call_from_thread(self.log_message, "[green]Build completed.[/green]")
-
-                # Download
-                self.app.call_from_thread(self.update_progress, 20)
-                zip_path = api.download_build(build_id)
-                self.app.call_from_thread(self.log_message, f"[green]Downloaded: {zip_path}[/green]")
-
-                # Extract
-                self.app.call_from_thread(self.update_progress, 25)
-                extract_and_replace_files(zip_path, profile.data_path)
-                self.app.call_from_thread(self.log_message, "[green]Files extracted.[/green]")
-
-                # Process
-                self.app.call_from_thread(self.update_progress, 30)
-                process_language_files(profile.data_path, profile.result_path)
-                self.app.call_from_thread(self.log_message, "[green]Language files processed.[/green]")
-
-            # Step 2: Initialize Upload API
-            self.app.call_from_thread(self.log_message, "[cyan]Initializing upload API...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Initializing...")
-            self.app.call_from_thread(self.update_progress, 35)
-
-            def log_callback(msg):
-                self.app.call_from_thread(self.log_message, f"[dim]{msg}[/dim]")
-
-            upload_api = CrowdinUploadAPI(
-                api_token=profile.crowdin_token,
-                project_id=profile.project_id,
-                gemini_api_key=profile.gemini_token or "",
-                key_file_path=profile.key_path,
-                prompt_file_path=profile.prompts_path,
-                data_path=profile.data_path,
-                log_callback=log_callback,
-            )
-
-            # Step 3: Translate with Gemini (if enabled)
+            # Step 3: Translate, add keys and add translations; batches overlap on the loop
             if use_gemini:
-                self.app.call_from_thread(
-                    self.log_message, "[cyan]Translating with Gemini AI...[/cyan]"
-                )
-                self.app.call_from_thread(self.update_status, "Translating...")
-                self.app.call_from_thread(self.update_progress, 50)
-
-                def translate_progress(msg):
-                    self.app.call_from_thread(self.log_message, f"[dim]{msg}[/dim]")
-
-                translations = upload_api.translate_missing_with_gemini(
-                    progress_callback=translate_progress
+                bus.log("[cyan]Translating with Gemini AI and uploading to Crowdin...[/cyan]")
+                bus.update("Translating and uploading...")
+
+                def pipeline_progress(stage, done, total):
+                    if stage != STAGE_TRANSLATIONS or not total:
+                        return
+                    bus.update(percent=50 + int((done / total) * 49))
+
+                async with AsyncCrowdinAPI(
+                    profile.crowdin_token,
+                    profile.project_id,
+                    http2=profile.http2,
+                    api_url=profile.crowdin_api_url or None,
+                ) as crowdin:
+                    stats = await upload_api.run_async_upload(
+                        crowdin,
+                        progress_callback=pipeline_progress,
+                        wait_for_download=download,
+                        resume=resume,
+                    )
+                bus.log(
+                    f"[green]Added {stats.keys_created} new keys and "
+                    f"{stats.translations_posted} translations to Crowdin[/green]"
                 )
 
-                if translations:
-                    lang_count = len(translations)
-                    key_count = sum(len(keys) for keys in translations.values())
-                    self.app.call_from_thread(
-                        self.log_message,
-                        f"[green]Translated {key_count} keys across {lang_count} languages[/green]",
-                    )
-                else:
-                    self.app.call_from_thread(
-                        self.log_message, "[yellow]No new translations needed[/yellow]"
-                    )
+            if download:
+                await download
+        except BaseException:
+            # Stop the download instead of waiting for it
+            if download:
+                download.cancel()
+                await asyncio.gather(download, return_exceptions=True)
+            raise
 
-            # Step 4: Add keys to Crowdin
-            self.app.call_from_thread(self.log_message, "[cyan]Adding keys to Crowdin...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Adding keys...")
-            self.app.call_from_thread(self.update_progress, 70)
+    async def _upload_task(self) -> None:
+        """Background task for uploading translations."""
+        profile = self.config.current_profile
+        download_first = self.query_one("#chk-download-first", Checkbox).value
+        use_gemini = self.query_one("#chk-use-gemini", Checkbox).value
+        resume = self.query_one("#chk-resume", Checkbox).value
 
-            def key_progress(current, total):
-                self.app.call_from_thread(self.log_message, f"[dim]Adding key {current}/{total}[/dim]")
-                progress = 70 + int((current / total) * 15) if total > 0 else 70
-                self.app.call_from_thread(self.update_progress, progress)
+        # Per-key log lines and pipeline counts reach the UI as a few batches per second
+        bus = ProgressBus(
+            lambda events: self.post_message(ProgressUpdate(events)), profile.progress_rate
+        )
 
-            added_keys = upload_api.add_keys(progress_callback=key_progress)
-            self.app.call_from_thread(
-                self.log_message,
-                f"[green]Added {len(added_keys)} new keys to Crowdin[/green]",
+        try:
+            await self._upload(
+                profile, bus, download_first=download_first, use_gemini=use_gemini, resume=resume
             )
 
-            # Step 5: Add translations
-            self.app.call_from_thread(self.log_message, "[cyan]Adding translations...[/cyan]")
-            self.app.call_from_thread(self.update_status, "Adding translations...")
-            self.app.call_from_thread(self.update_progress, 85)
+            # Complete
+            bus.update("Complete!", 100)
+            bus.log("[bold green]✅ Upload complete![/bold green]")
+            bus.log(f"[dim]{get_transport().stats.summary()}[/dim]")
 
-            def translation_progress(current, total):
-                progress = 85 + int((current / total) * 14) if total > 0 else 85
-                self.app.call_from_thread(self.update_progress, progress)
+        except OperationCancelled:
+            hint = " Check 'Resume interrupted upload' to continue." if use_gemini else ""
+            bus.log(f"[yellow]⏹ Upload cancelled.{hint}[/yellow]")
+            bus.update("Cancelled")
+            self.notify("Upload cancelled", severity="warning")
 
-            upload_api.add_translations(progress_callback=translation_progress)
+        except CrowdinError as e:
+            bus.log(f"[bold red]❌ Crowdin Error: {e}[/bold red]")
+            bus.update("Error!")
+            self.notify(f"Upload failed: {e}", severity="error")
 
-            # Complete
-            self.app.call_from_thread(self.update_progress, 100)
-            self.app.call_from_thread(self.update_status, "Complete!")
-            self.app.call_from_thread(self.log_message, "[bold green]✅ Upload complete![/bold green]")
+        except GeminiError as e:
+            bus.log(f"[bold red]❌ Gemini Error: {e}[/bold red]")
+            bus.update("Error!")
+            self.notify(f"Translation failed: {e}", severity="error")
 
-        except CrowdinError as e:
-            self.app.call_from_thread(self.log_message, f"[bold red]❌ Crowdin Error: {e}[/bold red]")
-            self.app.call_from_thread(self.update_status, "Error!")
-            self.app.call_from_thread(self.notify, f"Upload failed: {e}", severity="error")
+        except UnfinishedJournalError as e:
+            bus.log(f"[bold red]❌ {e}. Check 'Resume interrupted upload' to continue.[/bold red]")
+            bus.update("Error!")
+            self.notify("Unfinished upload found", severity="error")
 
         except Exception as e:
-            self.app.call_from_thread(
-                self.log_message, f"[bold red]❌ Unexpected error: {e}[/bold red]"
-            )
-            self.app.call_from_thread(self.update_status, "Error!")
-            self.app.call_from_thread(self.notify, f"Unexpected error: {e}", severity="error")
+            bus.log(f"[bold red]❌ Unexpected error: {e}[/bold red]")
+            bus.update("Error!")
+            self.notify(f"Unexpected error: {e}", severity="error")
 
         finally:
-            self.app.call_from_thread(self._finish_operation)
+            bus.flush()
+            self._finish_operation()
 
     def _finish_operation(self) -> None:
         """Clean up after operation completes."""
         self._operation_running = False
         self.query_one("#btn-start", Button).disabled = False
+        self.query_one("#btn-cancel", Button).disabled = True
+        if self._log.evicted and self._log.spill_path:
+            self.log_message(
+                f"[dim]{self._log.evicted} older lines saved to {self._log.spill_path}[/dim]"
+            )
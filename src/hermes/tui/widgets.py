@@ -0,0 +1,101 @@
+"""Virtualized widgets shared by the operation screens."""
+
+from rich.highlighter import ReprHighlighter
+from rich.markup import escape
+from rich.text import Text
+from textual.cache import LRUCache
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option
+
+from hermes.core.config import Config
+
+from .log_store import LogStore
+
+# Rendered lines kept between refreshes (a few screens' worth)
+LINE_CACHE_SIZE = 1024
+
+
+class LogView(ScrollView, can_focus=True):
+    """
+    Read-only view of a LogStore that renders only the visible lines.
+
+    Lines are parsed as Rich markup when they scroll into view, and the view
+    follows new lines while it is scrolled to the end.
+    """
+
+    def __init__(self, store: LogStore | None = None, *, id: str | None = None):
+        super().__init__(id=id)
+        self.store = store or LogStore()
+        self._highlighter = ReprHighlighter()
+        self._cache: LRUCache[int, Strip] = LRUCache(LINE_CACHE_SIZE)
+        self._widest = 0
+
+    def show(self, store: LogStore) -> None:
+        """Display another store, e.g. the log of a new operation."""
+        self.store = store
+        self._cache.clear()
+        self._widest = 0
+        self.virtual_size = Size(0, 0)
+        self.scroll_home(animate=False)
+        self.refresh()
+
+    def refresh_lines(self) -> None:
+        """Update the view after lines were added to the store."""
+        follow = self.scroll_y >= self.max_scroll_y
+        self.virtual_size = Size(self._widest, len(self.store))
+        if follow:
+            self.scroll_end(animate=False, x_axis=False)
+        self.refresh()
+
+    def _strip(self, index: int) -> Strip:
+        """Rendered line of the store (cached by absolute line number)."""
+        number = self.store.evicted + index
+        cached = self._cache.get(number)
+        if cached is not None:
+            return cached
+        text = self._highlighter(Text.from_markup(self.store[index]))
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        self._cache[number] = strip
+        if strip.cell_length > self._widest:
+            # Grow the scrollable width to the widest line rendered so far
+            self._widest = strip.cell_length
+            self.virtual_size = Size(self._widest, len(self.store))
+        return strip
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.scrollable_content_region.width
+        index = scroll_y + y
+        if index >= len(self.store):
+            return Strip.blank(width, self.rich_style)
+        strip = self._strip(index).crop_extend(scroll_x, scroll_x + width, self.rich_style)
+        return strip.apply_style(self.rich_style)
+
+
+class ProfilePicker(OptionList):
+    """Profile list for the operation screens; only the visible rows are rendered."""
+
+    def show_profiles(self, config: Config) -> None:
+        """List every profile and highlight the active one."""
+        self.clear_options()
+        self.add_options(
+            Option(
+                f"{escape(name)}  [dim]Project: {escape(profile.project_id or '-')} · "
+                f"Data: {escape(profile.data_path)}[/dim]",
+                id=name,
+            )
+            for name, profile in config.profiles.items()
+        )
+        names = list(config.profiles)
+        if config.active_profile in names:
+            self.highlighted = names.index(config.active_profile)
+
+    @property
+    def highlighted_profile(self) -> str | None:
+        """Name of the highlighted profile."""
+        if self.highlighted is None:
+            return None
+        return self.get_option_at_index(self.highlighted).id